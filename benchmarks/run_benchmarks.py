@@ -0,0 +1,331 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmarks of the client hot paths against a local stand-in Workbench server.
+
+The benchmarks measure the time to import the package and the client, the round-trip
+latency of ``run_script_string``, with and without a flood of server log messages, and
+the throughput of ``upload_file`` and ``download_file`` at several file sizes. Each
+benchmark reports the p50, p95, and p99 latency, the throughput in MB/s, and the client
+CPU time per call or per MB. The server runs in a separate process so that only the CPU
+time of the client is counted.
+
+The results are compared with a stored baseline, and the script exits with status 1
+when a metric is worse than the baseline by more than the tolerance::
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --quick --tolerance 0.5
+    python benchmarks/run_benchmarks.py --save-baseline
+
+Baselines depend on the machine, so save a new baseline on the machine that runs the
+comparison before judging a change.
+"""
+
+import argparse
+import json
+import logging
+import math
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+from ansys.workbench.core.fake_server import FakeWorkbenchServer
+from ansys.workbench.core.workbench_client import WorkbenchClient
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+MB = 1 << 20
+
+# metrics compared with the baseline, and whether a higher value is better
+METRICS = {
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "mb_per_s": True,
+    "cpu_ms_per_call": False,
+    "cpu_ms_per_mb": False,
+}
+
+
+def percentile(values, percent):
+    """Return the nearest-rank percentile of a list of values."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _serve(connection, server_options):
+    """Run a stand-in server in a child process until the parent asks it to stop."""
+    with FakeWorkbenchServer(**server_options) as server:
+        connection.send((server.port, server.working_directory))
+        connection.recv()
+
+
+class ServerProcess:
+    """Stand-in Workbench server running in a child process."""
+
+    def __init__(self, **server_options):
+        context = multiprocessing.get_context("spawn")
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(
+            target=_serve, args=(child_connection, server_options), daemon=True
+        )
+
+    def __enter__(self):
+        """Start the server process and wait until it serves."""
+        self._process.start()
+        self.port, self.working_directory = self._connection.recv()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the server process."""
+        self._connection.send("stop")
+        self._process.join(timeout=30)
+
+    def connect(self, local_workdir):
+        """Create a client connected to the server."""
+        client = WorkbenchClient(local_workdir, "127.0.0.1", self.port, "insecure")
+        client._connect()
+        return client
+
+
+def _summarize(seconds, cpu_seconds=None, total_bytes=0):
+    """Compute the metrics of a benchmark from the wall and CPU times of its calls."""
+    result = {
+        "calls": len(seconds),
+        "p50_ms": percentile(seconds, 50) * 1000,
+        "p95_ms": percentile(seconds, 95) * 1000,
+        "p99_ms": percentile(seconds, 99) * 1000,
+    }
+    if cpu_seconds is None:
+        return result
+    if total_bytes:
+        result["mb_per_s"] = total_bytes / MB / sum(seconds)
+        result["cpu_ms_per_mb"] = sum(cpu_seconds) * 1000 / (total_bytes / MB)
+    else:
+        result["cpu_ms_per_call"] = sum(cpu_seconds) * 1000 / len(cpu_seconds)
+    return result
+
+
+def _measure(function, repeat, warmup=1):
+    """Call a function repeatedly and return the wall and CPU time of each call."""
+    for _ in range(warmup):
+        function()
+    seconds = []
+    cpu_seconds = []
+    for _ in range(repeat):
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+        cpu_seconds.append(time.process_time() - cpu_start)
+    return seconds, cpu_seconds
+
+
+def bench_import(module, repeat):
+    """Measure the time to import a module in a fresh interpreter."""
+    seconds = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in process.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                seconds.append(int(fields[1]) / 1e6)
+    return {"import_" + module.rsplit(".", 1)[-1]: _summarize(seconds)}
+
+
+def bench_run_script(client, repeat, name, log_level="error"):
+    """Measure the round-trip latency of a small script."""
+    seconds, cpu_seconds = _measure(
+        lambda: client.run_script_string("wb_script_result = 1", log_level=log_level), repeat
+    )
+    return {name: _summarize(seconds, cpu_seconds)}
+
+
+def bench_transfers(client, server_workdir, local_dir, size, repeat, show_progress):
+    """Measure the upload and download throughput of a file of the given size."""
+    name = f"bench_{size // MB}mb.bin"
+    local_path = os.path.join(local_dir, name)
+    with open(local_path, "wb") as f:
+        for _ in range(size // MB):
+            f.write(os.urandom(MB))
+    download_dir = os.path.join(local_dir, "downloads")
+    os.makedirs(download_dir, exist_ok=True)
+
+    upload = _measure(lambda: client.upload_file(local_path, show_progress=show_progress), repeat)
+    assert os.path.getsize(os.path.join(server_workdir, name)) == size
+    download = _measure(
+        lambda: client.download_file(name, show_progress=show_progress, target_dir=download_dir),
+        repeat,
+    )
+    assert os.path.getsize(os.path.join(download_dir, name)) == size
+    os.remove(local_path)
+    os.remove(os.path.join(download_dir, name))
+    label = f"{size // MB}MB"
+    return {
+        f"upload_file_{label}": _summarize(*upload, total_bytes=size * repeat),
+        f"download_file_{label}": _summarize(*download, total_bytes=size * repeat),
+    }
+
+
+def run_benchmarks(quick=False, show_progress=False):
+    """Run all benchmarks and return their metrics by benchmark name."""
+    calls = 50 if quick else 500
+    sizes = [1 * MB, 16 * MB] if quick else [1 * MB, 16 * MB, 256 * MB]
+    transfers = 3 if quick else 5
+    results = {}
+    for module in ("ansys.workbench.core", "ansys.workbench.core.public_api"):
+        results.update(bench_import(module, 5 if quick else 20))
+    with tempfile.TemporaryDirectory(prefix="wb_bench_") as local_dir:
+        with ServerProcess() as server:
+            client = server.connect(local_dir)
+            try:
+                results.update(bench_run_script(client, calls, "run_script_string"))
+                for size in sizes:
+                    results.update(
+                        bench_transfers(
+                            client,
+                            server.working_directory,
+                            local_dir,
+                            size,
+                            transfers,
+                            show_progress,
+                        )
+                    )
+            finally:
+                client._disconnect()
+        with ServerProcess(log_messages=1000) as server:
+            client = server.connect(local_dir)
+            try:
+                results.update(
+                    bench_run_script(
+                        client, calls // 5, "run_script_string_1000_logs", log_level="info"
+                    )
+                )
+            finally:
+                client._disconnect()
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Compare results with a baseline.
+
+    Returns
+    -------
+    list[str]
+        Description of each metric that is worse than the baseline by more than the
+        tolerance, given as a fraction of the baseline value.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if metric not in metrics or not reference.get(metric):
+                continue
+            change = metrics[metric] / reference[metric] - 1
+            if higher_is_better:
+                change = -change
+            if change > tolerance:
+                regressions.append(
+                    f"{name} {metric}: {metrics[metric]:.3f} vs. baseline "
+                    f"{reference[metric]:.3f} ({change:+.0%} worse)"
+                )
+    return regressions
+
+
+def format_table(results, baseline):
+    """Format the results, with the baseline value of each metric in parentheses."""
+    lines = []
+    for name, metrics in results.items():
+        reference = baseline.get(name, {})
+        cells = []
+        for metric in METRICS:
+            if metric in metrics:
+                cell = f"{metric}={metrics[metric]:.3f}"
+                if metric in reference:
+                    cell += f" ({reference[metric]:.3f})"
+                cells.append(cell)
+        lines.append(f"{name:32} " + "  ".join(cells))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store the results as the new baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown before a metric is flagged (default: 0.25)",
+    )
+    parser.add_argument("--quick", action="store_true", help="fewer calls and smaller files")
+    parser.add_argument(
+        "--show-progress", action="store_true", help="show progress bars during transfers"
+    )
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    warnings.filterwarnings("ignore", message="Starting gRPC client without TLS")
+    results = run_benchmarks(quick=args.quick, show_progress=args.show_progress)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print(format_table(results, baseline))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"Saved the baseline to {args.baseline}.")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    if not baseline:
+        print(f"No baseline found at {args.baseline}. Run with --save-baseline to store one.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,11 +22,54 @@
 
 """PyWorkbench Python client."""
 
-import importlib.metadata as importlib_metadata
+import importlib
+from typing import TYPE_CHECKING
 
-# exposed API
-from ansys.workbench.core.public_api import connect_workbench, launch_workbench  # noqa: F401
+# exposed API, imported on first use so that importing the package stays fast
+_LAZY_ATTRIBUTES = {
+    "ChannelOptions": "ansys.workbench.core.channel_options",
+    "connect_workbench": "ansys.workbench.core.public_api",
+    "connect_workbench_async": "ansys.workbench.core.public_api",
+    "disable_warm_spares": "ansys.workbench.core.public_api",
+    "enable_warm_spares": "ansys.workbench.core.public_api",
+    "launch_many": "ansys.workbench.core.public_api",
+    "launch_workbench": "ansys.workbench.core.public_api",
+    "launch_workbench_async": "ansys.workbench.core.public_api",
+    "WorkbenchPool": "ansys.workbench.core.workbench_pool",
+}
 
-# Read from the pyproject.toml
-__version__ = importlib_metadata.version("ansys-workbench-core")
-"""Version of ansys-workbench-core module."""
+if TYPE_CHECKING:
+    from ansys.workbench.core.channel_options import ChannelOptions  # noqa: F401
+    from ansys.workbench.core.public_api import (  # noqa: F401
+        connect_workbench,
+        connect_workbench_async,
+        disable_warm_spares,
+        enable_warm_spares,
+        launch_many,
+        launch_workbench,
+        launch_workbench_async,
+    )
+    from ansys.workbench.core.workbench_pool import WorkbenchPool  # noqa: F401
+
+
+def __getattr__(name):
+    """Import the exposed API and the version on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name == "__version__":
+        import importlib.metadata as importlib_metadata
+
+        # Read from the pyproject.toml
+        value = importlib_metadata.version("ansys-workbench-core")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the exposed API along with the module attributes."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"__version__"})
+
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
@@ -0,0 +1,141 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for returning large numeric script results as binary NumPy files."""
+
+_SERVER_TYPECODES = {"float64": ("d", "<f8"), "float32": ("f", "<f4"), "int32": ("i", "<i4")}
+
+
+def array_script(script_content, dtype):
+    """Return a server script that saves ``wb_script_array`` as a ``.npy`` file.
+
+    The script runs the given script and writes the sequence, or the list of equally
+    long rows, that it assigns to ``wb_script_array`` into the server's working
+    directory. It uses only the ``array`` and ``struct`` modules, so no NumPy is
+    needed on the server.
+
+    Parameters
+    ----------
+    script_content : str
+        Script that assigns ``wb_script_array``.
+    dtype : str
+        Data type of the array. Options are ``"float64"``, ``"float32"``, and ``"int32"``.
+
+    Returns
+    -------
+    str
+        Server script whose ``wb_script_result`` holds the name of the ``.npy`` file
+        in the server's working directory and the shape of the array.
+
+    Raises
+    ------
+    ValueError
+        If the data type is not supported.
+    """
+    if dtype not in _SERVER_TYPECODES:
+        raise ValueError(f"Unsupported array data type: {dtype}")
+    typecode, descr = _SERVER_TYPECODES[dtype]
+    return f"""wb_script_array = None
+{script_content}
+import array
+import json
+import os
+import struct
+import sys
+import uuid
+if wb_script_array is None:
+    raise ValueError("The script did not assign wb_script_array.")
+_wb_rows = list(wb_script_array)
+_wb_flat = array.array("{typecode}")
+if _wb_rows and hasattr(_wb_rows[0], "__len__"):
+    _wb_shape = [len(_wb_rows), len(_wb_rows[0])]
+    for _wb_row in _wb_rows:
+        if len(_wb_row) != _wb_shape[1]:
+            raise ValueError("The rows of wb_script_array must have the same length.")
+        _wb_flat.extend(_wb_row)
+else:
+    _wb_shape = [len(_wb_rows)]
+    _wb_flat.extend(_wb_rows)
+_wb_rows = None
+if sys.byteorder != "little":
+    _wb_flat.byteswap()
+_wb_header = "{{'descr': '{descr}', 'fortran_order': False, 'shape': (%s,), }}" % ", ".join(
+    str(n) for n in _wb_shape)
+_wb_header += " " * (63 - (10 + len(_wb_header)) % 64) + "\\n"
+_wb_name = "wb_array_" + uuid.uuid4().hex + ".npy"
+with open(os.path.join(GetServerWorkingDirectory(), _wb_name), "wb") as _wb_file:
+    _wb_file.write(b"\\x93NUMPY\\x01\\x00" + struct.pack("<H", len(_wb_header)))
+    _wb_file.write(_wb_header.encode("latin-1"))
+    _wb_file.write(_wb_flat.tobytes() if hasattr(_wb_flat, "tobytes") else _wb_flat.tostring())
+_wb_flat = None
+wb_script_result = json.dumps({{"file": _wb_name, "shape": _wb_shape}})
+"""
+
+
+def import_numpy():
+    """Import NumPy, which array results need on the client.
+
+    Returns
+    -------
+    module
+        The ``numpy`` module.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as ex:
+        raise ImportError(
+            "NumPy is required for array results. Install it with "
+            "'pip install ansys-workbench-core[arrays]'."
+        ) from ex
+    return numpy
+
+
+def load_array(file_path, mmap=True):
+    """Load a ``.npy`` file written by the script from ``array_script()``.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the downloaded ``.npy`` file.
+    mmap : bool, default: True
+        Whether to memory-map the file instead of reading it into memory.
+
+    Returns
+    -------
+    numpy.ndarray
+        The array. Memory-mapped arrays are read-only.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+    return import_numpy().load(file_path, mmap_mode="r" if mmap else None, allow_pickle=False)
+
+
+__all__ = ["array_script", "import_numpy", "load_array"]
@@ -0,0 +1,525 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Asynchronous Workbench client module for PyWorkbench."""
+
+import asyncio
+import json
+import logging
+import os
+import re
+from warnings import warn
+
+import grpc
+
+from ansys.api.workbench.v0 import workbench_pb2 as wb
+from ansys.api.workbench.v0.workbench_pb2_grpc import WorkbenchServiceStub
+from ansys.tools.common.cyberchannel import (
+    LOOPBACK_HOSTS,
+    determine_uds_folder,
+    is_uds_supported,
+    verify_transport_mode,
+)
+from ansys.workbench.core.progress import track_progress
+from ansys.workbench.core.upload_pipeline import DEFAULT_CHUNK_SIZE
+from ansys.workbench.core.workbench_client import (
+    _PROJECT_PATH_SCRIPT,
+    ServerInfo,
+    _DownloadFileWriter,
+    _WorkbenchClientBase,
+)
+
+_IS_WINDOWS = os.name == "nt"
+
+
+def _create_aio_channel(
+    host, port, transport_mode, grpc_options=None, uds_service=None, uds_full_path=None
+):
+    """Create a ``grpc.aio`` channel for the given transport mode.
+
+    The transport modes are checked like ``ansys.tools.common.cyberchannel`` checks
+    them for the synchronous client: WNUA is only accepted on Windows for a loopback
+    host, insecure channels are reported with a warning, and UDS uses the same socket
+    locations.
+
+    Parameters
+    ----------
+    host : str
+        Hostname or IP address of the server.
+    port : int
+        Port number of the server.
+    transport_mode : str
+        Security mode of the server. Options are: "insecure", "uds", "wnua", "mtls"
+    grpc_options : list[tuple[str, object]], default: None
+        gRPC channel options to pass when creating the channel.
+    uds_service : str, default: None
+        Service name of the UDS socket, which is ``<uds_service>.sock`` in the default
+        socket directory.
+    uds_full_path : str, default: None
+        Full path to the UDS socket file, which takes precedence over ``uds_service``.
+
+    Returns
+    -------
+    grpc.aio.Channel
+        The created asynchronous channel.
+    """
+    mode = transport_mode.lower()
+    verify_transport_mode(mode)
+    if mode == "uds":
+        if not is_uds_supported():
+            raise RuntimeError(
+                "Unix Domain Sockets are not supported on this platform or gRPC version."
+            )
+        if uds_full_path is None:
+            if uds_service is None:
+                raise ValueError("When using UDS transport mode, 'uds_service' must be provided.")
+            uds_full_path = determine_uds_folder() / f"{uds_service}.sock"
+        options = [("grpc.default_authority", "localhost")] + list(grpc_options or [])
+        logging.info(f"Connecting using UDS -> unix:{uds_full_path}")
+        return grpc.aio.insecure_channel(f"unix:{uds_full_path}", options=options)
+    if host is None or port is None:
+        raise ValueError(f"When using {mode} transport mode, 'host' and 'port' must be provided.")
+    target = f"{host}:{port}"
+    if mode == "insecure":
+        warn(
+            f"Starting gRPC client without TLS on {target}. This is INSECURE. "
+            "Consider using a secure connection."
+        )
+        return grpc.aio.insecure_channel(target, options=grpc_options)
+    if mode == "wnua":
+        if not _IS_WINDOWS:
+            raise ValueError(
+                "Windows Named User Authentication (WNUA) is only supported on Windows."
+            )
+        if host not in LOOPBACK_HOSTS:
+            raise ValueError("Remote host connections are not supported with WNUA.")
+        options = [("grpc.default_authority", "localhost")] + list(grpc_options or [])
+        return grpc.aio.insecure_channel(target, options=options)
+    certs_dir = os.environ.get("ANSYS_GRPC_CERTIFICATES", "certs")
+    with open(os.path.join(certs_dir, "ca.crt"), "rb") as f:
+        trusted_certs = f.read()
+    with open(os.path.join(certs_dir, "client.crt"), "rb") as f:
+        client_cert = f.read()
+    with open(os.path.join(certs_dir, "client.key"), "rb") as f:
+        client_key = f.read()
+    credentials = grpc.ssl_channel_credentials(
+        root_certificates=trusted_certs, private_key=client_key, certificate_chain=client_cert
+    )
+    return grpc.aio.secure_channel(target, credentials, options=grpc_options)
+
+
+class AsyncWorkbenchClient(_WorkbenchClientBase):
+    """Functions of an asynchronous PyWorkbench client built on ``grpc.aio``.
+
+    All methods that talk to the server are coroutines, so a single event loop
+    can drive many Workbench sessions concurrently without a thread per session.
+
+    Parameters
+    ----------
+    local_workdir : str
+        Local working directory for the client.
+    server_host : str
+        Hostname or IP address of the server.
+    server_port : int
+        Port number of the server.
+    server_security : string
+        Security mode of the server.
+        Options are: "insecure", "uds", "wnua", "mtls"
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
+    """
+
+    async def __aenter__(self):
+        """Connect to the server when entering a context."""
+        self._connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Disconnect from the server when exiting a context."""
+        await self._disconnect()
+
+    def _connect(self):
+        """Connect to the server."""
+        self.channel = _create_aio_channel(
+            self._server_host,
+            self._server_port,
+            self._server_security,
+            self._channel_options.grpc_options(),
+        )
+        self.stub = WorkbenchServiceStub(self.channel)
+        self._forget_other_server()
+        logging.info(
+            f"connected to the WB server at {self._server_host}:{self._server_port} "
+            f"using {self._server_security} connection"
+        )
+
+    async def _disconnect(self):
+        """Disconnect from the server."""
+        if self.channel:
+            await self.channel.close()
+            self.channel = None
+            self.stub = None
+            logging.info("Disconnected from the Workbench server")
+
+    async def get_server_info(self, refresh=False):
+        """Get information about the connected server.
+
+        The information is collected with a single script call on first use and cached
+        until the client connects to a different server.
+
+        Parameters
+        ----------
+        refresh : bool, default: False
+            Whether to collect the information again.
+
+        Returns
+        -------
+        ServerInfo
+            Information about the connected server.
+        """
+        if self._server_info is None or refresh:
+            self._set_server_info(await self.run_script_string(ServerInfo.script))
+        return self._server_info
+
+    async def get_server_version(self):
+        """Get the Workbench version of the connected server.
+
+        Returns
+        -------
+        int
+            Three-digit Workbench version, such as ``252``.
+        """
+        return (await self.get_server_info()).version
+
+    async def get_project_path(self):
+        """Get the path of the current project file on the server.
+
+        The path is read from the server on each call, because it changes when a
+        project is opened or saved under a new name.
+
+        Returns
+        -------
+        str
+            Path of the project file.
+        """
+        return await self.run_script_string(_PROJECT_PATH_SCRIPT)
+
+    async def run_script_string(self, script_string, args=None, log_level="error"):
+        """Run a script as given in the input string on the server.
+
+        Parameters
+        ----------
+        script_string : str or ScriptTemplate
+            String containing the content of the script to run, or a template
+            created from it.
+        args : dictionary of script variable names and values
+            Variables in the script specified as $$varname%%50%% will be converted to variable
+            values or use the default value - 50 in the example.
+        log_level : str, default: "error"
+            Level of logging. Options are "critical", "debug", "error", "info", and "warning".
+
+        Returns
+        -------
+        str
+            Output defined in the script.
+
+        Examples
+        --------
+        Run a Workbench script, given in a string, that returns the name of
+        a newly created system.
+
+        >>> await wb.run_script_string(r'''import json
+        wb_script_result=json.dumps(GetTemplate(TemplateName="FLUENT").CreateSystem().Name)
+        ''')
+
+        """
+        if not self._is_connected():
+            logging.error("Workbench client is not yet connected to a server.")
+            return None
+        updated_script_string = self._prepare_script(script_string, args)
+        if updated_script_string is None:
+            return None
+        request = wb.RunScriptRequest(
+            content=updated_script_string,
+            log_level=AsyncWorkbenchClient._to_server_log_level(log_level),
+        )
+        with self._rpc_stats.call("RunScript") as rpc:
+            rpc.bytes_sent = request.ByteSize()
+            async for response in self.stub.RunScript(request):
+                rpc.chunk(received=response.ByteSize())
+                if response.log and response.log.messages and len(response.log.messages) > 0:
+                    for log_entry in response.log.messages:
+                        rpc.log(log_entry.level, log_entry.message)
+                        self._python_logging(log_entry.level, log_entry.message)
+                if response.result:
+                    if response.result.error:
+                        rpc.set_error(response.result.error)
+                        logging.error("Error when running the script: " + response.result.error)
+                        return None
+                    elif response.result.result:
+                        logging.info("The script has finished.")
+                        return json.loads(response.result.result)
+
+    async def run_scripts_batch(self, scripts, stop_on_error=True, log_level="error"):
+        """Run several scripts on the server in a single round trip.
+
+        Parameters
+        ----------
+        scripts : list
+            Scripts to run. Each entry is a script string, a ``ScriptTemplate``, or a
+            ``(script, args)`` tuple, where ``args`` is a dictionary of script variable
+            names and values as for ``run_script_string()``.
+        stop_on_error : bool, default: True
+            Whether to skip the remaining scripts after the first script that fails.
+        log_level : str, default: "error"
+            Level of logging. Options are "critical", "debug", "error", "info", and "warning".
+
+        Returns
+        -------
+        list[ScriptResult]
+            Result and error of each script, in the order of the given scripts.
+        """
+        script = self._batch_script(scripts, stop_on_error)
+        if script is None:
+            return None
+        outputs = await self.run_script_string(script, log_level=log_level)
+        return self._batch_results(outputs, len(scripts))
+
+    async def run_script_file(self, script_file_name, args=None, log_level="error"):
+        """Run a script file on the server.
+
+        Parameters
+        ----------
+        script_file_name : str
+            Name of the script file to run. The script file should be located in the client
+            working directory
+        args : dictionary of script variable names and values
+            Variables in the script specified as $$varname%%50%% will be converted to variable
+            values or use the default value - 50 in the example.
+        log_level : str, default: "error"
+            Level of logging. Options are "critical", "debug", "error", "info", and "warning".
+
+        Returns
+        -------
+        str
+            Output defined in the script.
+        """
+        if not self._is_connected():
+            logging.error("Workbench client is not yet connected to a server")
+            return None
+        script_path = os.path.join(self.workdir, script_file_name)
+        with open(script_path, encoding="utf-8-sig") as sf:
+            script_string = sf.read()
+        return await self.run_script_string(script_string, args, log_level)
+
+    async def upload_file(self, *file_list, show_progress=True):
+        """Upload one or more files from the client to the server.
+
+        Parameters
+        ----------
+        file_list : list[str]
+            List of paths to the one or more local files to upload. The
+            wildcard characters "?" and "*" are supported.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the upload. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for other options.
+        """
+        if not self._is_connected():
+            logging.error("Workbench client is not yet connected to a server.")
+            return
+        for file_path in self._resolve_upload_files(file_list):
+            logging.info(f"uploading file {file_path}")
+            with self._rpc_stats.call("UploadFile") as rpc:
+                response = await self.stub.UploadFile(
+                    self.__upload_iterator(file_path, show_progress, rpc),
+                    **self._transfer_call_options(),
+                )
+                if response.error:
+                    rpc.set_error(response.error)
+            if response.error:
+                logging.error("Error during file upload: " + response.error)
+            else:
+                logging.info(
+                    "A file is uploaded to the server with the name: " + response.file_name
+                )
+
+    async def __upload_iterator(self, file_path, show_progress, rpc):
+        file_name = os.path.basename(file_path)
+        yield wb.UploadFileRequest(file_name=file_name)
+
+        f = open(file_path, mode="rb")
+        tracker = None
+        if show_progress:
+            tracker = track_progress(
+                show_progress, f"Uploading {file_name}", os.path.getsize(file_path)
+            )
+
+        loop = asyncio.get_running_loop()
+        chunk_size = self._channel_options.upload_chunk_size or DEFAULT_CHUNK_SIZE
+        read_ahead = self._channel_options.upload_read_ahead > 0
+        tuner = self._upload_chunk_tuner()
+        pending = None
+        try:
+            while True:
+                if tuner is not None:
+                    chunk_size = tuner.chunk_size
+                # file reads run in the default executor to keep the event loop responsive
+                if pending is None:
+                    pending = loop.run_in_executor(None, f.read, chunk_size)
+                chunk = await pending
+                pending = None
+                if not chunk:
+                    return
+                if read_ahead:
+                    # the next read overlaps with sending this chunk
+                    pending = loop.run_in_executor(None, f.read, chunk_size)
+                if tuner is not None:
+                    tuner.record(len(chunk))
+                rpc.chunk(sent=len(chunk))
+                if tracker is not None:
+                    tracker.advance(len(chunk))
+                yield wb.UploadFileRequest(file_content=chunk)
+        finally:
+            if pending is not None:
+                # a read that is already running cannot be cancelled, so it has to finish
+                # before the file is closed
+                try:
+                    await pending
+                except Exception:
+                    pass
+            f.close()
+            if tracker is not None:
+                tracker.close()
+
+    async def download_file(self, file_name, show_progress=True, target_dir=None):
+        """Download one or more files from the server.
+
+        Parameters
+        ----------
+        file_name : str
+            Name of the file. File must be located in the server's working directory.
+            The wildcard characters "?" and "*" are supported. A ZIP file is automatically
+            generated and downloaded when multiple files are specified.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the download. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for other options.
+        target_dir : str, default: None
+            Path to a local directory to download the files to. The default is ``None``,
+            in which case the client working directory is used.
+
+        Returns
+        -------
+        str
+            Name of the downloaded file.
+        """
+        if not self._is_connected():
+            logging.error("Workbench client is not yet connected to a server.")
+            return None
+        request = wb.DownloadFileRequest(file_name=file_name)
+        file_name = file_name.replace("*", "_").replace("?", "_")
+        td = target_dir
+        if td is None:
+            td = self.workdir
+        file_path = os.path.join(td, file_name)
+        loop = asyncio.get_running_loop()
+        tracker = None
+        writer = None
+        try:
+            with self._rpc_stats.call("DownloadFile") as rpc:
+                async for response in self.stub.DownloadFile(request):
+                    rpc.chunk(received=len(response.file_content))
+                    if response.error:
+                        rpc.set_error(response.error)
+                        logging.error("Error during file download: " + response.error)
+                        if writer is not None:
+                            writer.abort()
+                        return None
+                    if response.HasField("file_info"):
+                        if response.file_info.is_archive:
+                            file_name += ".zip"
+                            file_path += ".zip"
+                        if response.file_info.file_size > 0 and writer is None:
+                            writer = _DownloadFileWriter(file_path, response.file_info.file_size)
+                            if show_progress:
+                                tracker = track_progress(
+                                    show_progress,
+                                    f"Downloading {file_name}",
+                                    response.file_info.file_size,
+                                )
+                    if response.file_content:
+                        if writer is None:
+                            writer = _DownloadFileWriter(file_path)
+                        await loop.run_in_executor(None, writer.write, response.file_content)
+                        if tracker is not None:
+                            tracker.advance(len(response.file_content))
+            if writer is None:
+                writer = _DownloadFileWriter(file_path)
+            await loop.run_in_executor(None, writer.commit)
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+        finally:
+            if tracker is not None:
+                tracker.close()
+        logging.info(
+            f"Downloaded the file {file_name}: {writer.written / 1048576:.1f} MB "
+            f"at {writer.throughput:.1f} MB/s."
+        )
+        return file_name
+
+    async def download_project_archive(
+        self, archive_name, include_solution_result_files=True, show_progress=True
+    ):
+        """Create and download the project archive.
+
+        Parameters
+        ----------
+        archive_name : str
+            Name of the project archive to use, without the file extension.
+        include_solution_result_files : bool, default: True
+            Whether to include solution and result files in the archive.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the download. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for other options.
+        """
+        if not re.match(r"^\w+$", archive_name):
+            logging.error("archive name should contain only alphanumeric characters")
+            return
+        script = self._archive_script(archive_name, include_solution_result_files)
+        archive_created = await self.run_script_string(script)
+        if not archive_created:
+            logging.error(
+                (
+                    "Failed to create the project archive. "
+                    "Make sure that the solver PyAnsys sessions are closed."
+                )
+            )
+            return
+        await self.download_file(archive_name + ".wbpz", show_progress=show_progress)
+
+
+__all__ = ["AsyncWorkbenchClient"]
@@ -0,0 +1,180 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for tuning the gRPC channel to the Workbench server."""
+
+from dataclasses import dataclass
+
+# names of the grpc.Compression members, so that grpc is imported only when a channel is made
+_COMPRESSION = {
+    None: None,
+    "none": "NoCompression",
+    "gzip": "Gzip",
+    "deflate": "Deflate",
+}
+
+
+@dataclass(frozen=True)
+class ChannelOptions:
+    """Settings of the gRPC channel to a Workbench server.
+
+    Fields left at ``None`` keep the gRPC defaults.
+
+    Parameters
+    ----------
+    max_send_message_length : int, default: None
+        Maximum size in bytes of a message sent to the server, or ``-1`` for no limit.
+    max_receive_message_length : int, default: None
+        Maximum size in bytes of a message received from the server, or ``-1`` for no
+        limit. The gRPC default of 4 MB also limits the size of script results.
+    keepalive_time_ms : int, default: None
+        Interval in milliseconds between keepalive pings, which keep idle connections
+        through firewalls and detect dead servers. By default, gRPC servers accept pings
+        without calls no more than once every 5 minutes and close connections that ping
+        more often, so shorter intervals are only safe without
+        ``keepalive_permit_without_calls``.
+    keepalive_timeout_ms : int, default: None
+        Time in milliseconds to wait for a keepalive ping to be answered.
+    keepalive_permit_without_calls : bool, default: False
+        Whether to send keepalive pings while no call is in progress.
+    transfer_compression : str, default: None
+        Compression of the file uploads. Options are ``"gzip"``, ``"deflate"``, and
+        ``"none"``. Script calls are never compressed, and downloads are compressed only
+        if the server chooses to.
+    upload_chunk_size : int, default: None
+        Size in bytes of the messages of file uploads. The default is ``None``, in which
+        case 64 KB is used. Larger chunks lower the per-message overhead of large files
+        but must stay below the message size limit of the server, which is 4 MB unless
+        the server is configured otherwise.
+    upload_read_ahead : int, default: 0
+        Number of chunks to read ahead from the file on a background thread during an
+        upload, so that disk reads overlap with network sends. The default is ``0``, in
+        which case each chunk is read when it is sent.
+    adaptive_chunk_size : bool, default: False
+        Whether to tune the chunk size of each upload to the measured throughput,
+        starting at ``upload_chunk_size`` and staying between 64 KB and 3 MB or
+        ``upload_chunk_size``, whichever is larger.
+    """
+
+    max_send_message_length: int = None
+    max_receive_message_length: int = None
+    keepalive_time_ms: int = None
+    keepalive_timeout_ms: int = None
+    keepalive_permit_without_calls: bool = False
+    transfer_compression: str = None
+    upload_chunk_size: int = None
+    upload_read_ahead: int = 0
+    adaptive_chunk_size: bool = False
+
+    def __post_init__(self):
+        """Check the compression and upload settings."""
+        if self.transfer_compression not in _COMPRESSION:
+            raise ValueError(f"Unsupported compression: {self.transfer_compression}")
+        if self.upload_chunk_size is not None and self.upload_chunk_size <= 0:
+            raise ValueError(f"Invalid upload chunk size: {self.upload_chunk_size}")
+        if self.upload_read_ahead < 0:
+            raise ValueError(f"Invalid upload read-ahead: {self.upload_read_ahead}")
+
+    @classmethod
+    def high_throughput(cls):
+        """Return settings for bulk transfers of large, compressible files.
+
+        Message size limits are lifted, keepalive pings every 5 minutes, the shortest
+        interval that gRPC servers accept by default on idle connections, keep idle
+        sessions open through firewalls and detect dead servers, and uploads are
+        compressed with gzip, which pays off for mesh, journal, and text files. Uploads
+        are sent in large chunks that are read ahead on a background thread, with the
+        chunk size tuned to the throughput.
+
+        Returns
+        -------
+        ChannelOptions
+            High-throughput settings.
+        """
+        return cls(
+            max_send_message_length=-1,
+            max_receive_message_length=-1,
+            keepalive_time_ms=300000,
+            keepalive_timeout_ms=20000,
+            keepalive_permit_without_calls=True,
+            transfer_compression="gzip",
+            upload_chunk_size=1 << 20,
+            upload_read_ahead=4,
+            adaptive_chunk_size=True,
+        )
+
+    @classmethod
+    def resolve(cls, channel_options):
+        """Return the settings for a ``channel_options`` argument.
+
+        Parameters
+        ----------
+        channel_options : ChannelOptions, str, or None
+            Settings, the name of a preset (``"default"`` or ``"high_throughput"``), or
+            ``None`` for the defaults.
+
+        Returns
+        -------
+        ChannelOptions
+            Settings to use.
+        """
+        if channel_options is None or channel_options == "default":
+            return cls()
+        if channel_options == "high_throughput":
+            return cls.high_throughput()
+        if isinstance(channel_options, cls):
+            return channel_options
+        raise ValueError(f"Invalid channel options: {channel_options}")
+
+    def grpc_options(self):
+        """Return the gRPC channel arguments.
+
+        Returns
+        -------
+        list[tuple[str, object]]
+            Channel arguments, or ``None`` if all settings are at their defaults.
+        """
+        options = []
+        for name, value in (
+            ("grpc.max_send_message_length", self.max_send_message_length),
+            ("grpc.max_receive_message_length", self.max_receive_message_length),
+            ("grpc.keepalive_time_ms", self.keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms),
+        ):
+            if value is not None:
+                options.append((name, value))
+        if self.keepalive_permit_without_calls:
+            options.append(("grpc.keepalive_permit_without_calls", 1))
+        return options or None
+
+    @property
+    def compression(self):
+        """Compression of the transfer calls as ``grpc.Compression``, or ``None``."""
+        if self.transfer_compression is None:
+            return None
+        import grpc
+
+        return getattr(grpc.Compression, _COMPRESSION[self.transfer_compression])
+
+
+__all__ = ["ChannelOptions"]
@@ -0,0 +1,245 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for recording gRPC calls and server launches as a Chrome trace."""
+
+import json
+import os
+import threading
+import time
+
+from ansys.workbench.core import hooks
+
+
+class ChromeTraceExporter:
+    """Record gRPC calls and server launches in the Chrome trace event format.
+
+    Each gRPC call becomes a span on the thread that made it, with its byte, chunk, and
+    log counters as arguments, and each server launch becomes a row of spans between its
+    phases. Server log messages are recorded as instant events. The saved file can be
+    opened in ``chrome://tracing`` or https://ui.perfetto.dev to find where the time of
+    an automation run goes.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the JSON trace file to write.
+    chunks : bool, default: False
+        Whether to also record a counter of the transferred bytes for every streamed
+        message. This adds an event per 64 KB of file transfers.
+    logs : bool, default: True
+        Whether to record server log messages.
+
+    Examples
+    --------
+    Trace all clients and launches of a script.
+
+    >>> with ChromeTraceExporter("automation_trace.json"):
+    ...     wb = launch_workbench()
+    ...     wb.upload_file("model.agdb")
+    ...     wb.run_script_file("solve.wbjn")
+
+    """
+
+    def __init__(self, file_path, chunks=False, logs=True):
+        self.file_path = file_path
+        self._chunks = chunks
+        self._logs = logs
+        self._lock = threading.Lock()
+        self._events = []
+        self._threads = {}
+        self._launches = {}
+        self._transferred = {}
+        self._attached = []
+        self._pid = os.getpid()
+
+    def __enter__(self):
+        """Start recording the events of all clients and launches."""
+        self.attach()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop recording and save the trace file."""
+        self.detach()
+        self.save()
+
+    def attach(self, client=None):
+        """Start recording events.
+
+        Parameters
+        ----------
+        client : WorkbenchClient, default: None
+            Client to record the calls of. The default is ``None``, in which case the
+            calls of all clients and all server launches are recorded.
+        """
+        callbacks = [("rpc_end", self._on_rpc_end)]
+        if self._chunks:
+            callbacks.append(("rpc_chunk", self._on_rpc_chunk))
+        if self._logs:
+            callbacks.append(("rpc_log", self._on_rpc_log))
+        if client is None:
+            callbacks.append(("launch_phase", self._on_launch_phase))
+        for event, callback in callbacks:
+            if client is None:
+                hooks.add_hook(event, callback)
+            else:
+                client.add_hook(event, callback)
+            self._attached.append((client, event, callback))
+
+    def detach(self):
+        """Stop recording events."""
+        for client, event, callback in self._attached:
+            if client is None:
+                hooks.remove_hook(event, callback)
+            else:
+                client.remove_hook(event, callback)
+        self._attached = []
+
+    def save(self):
+        """Write the recorded events to the trace file.
+
+        Returns
+        -------
+        str
+            Path of the trace file.
+        """
+        with self._lock:
+            events = list(self._events)
+            for tid, name in self._threads.items():
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": self._pid,
+                        "tid": tid,
+                        "args": {"name": name},
+                    }
+                )
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return self.file_path
+
+    @property
+    def events(self):
+        """Events recorded so far."""
+        with self._lock:
+            return list(self._events)
+
+    @staticmethod
+    def _timestamp(seconds=None):
+        """Convert a ``time.perf_counter()`` value to trace microseconds."""
+        return (time.perf_counter() if seconds is None else seconds) * 1e6
+
+    def _thread(self):
+        thread = threading.current_thread()
+        if thread.ident not in self._threads:
+            self._threads[thread.ident] = thread.name
+        return thread.ident
+
+    def _on_rpc_end(self, call):
+        event = {
+            "name": call.method,
+            "cat": "rpc",
+            "ph": "X",
+            "ts": self._timestamp(call.start),
+            "dur": call.seconds * 1e6,
+            "pid": self._pid,
+            "args": {
+                "bytes_sent": call.bytes_sent,
+                "bytes_received": call.bytes_received,
+                "chunks": call.chunks,
+                "log_messages": call.log_messages,
+                "error": call.error,
+            },
+        }
+        with self._lock:
+            event["tid"] = self._thread()
+            self._events.append(event)
+
+    def _on_rpc_chunk(self, call, size):
+        with self._lock:
+            total = self._transferred.get(call.method, 0) + size
+            self._transferred[call.method] = total
+            self._events.append(
+                {
+                    "name": "transferred bytes",
+                    "ph": "C",
+                    "ts": self._timestamp(),
+                    "pid": self._pid,
+                    "args": {call.method: total},
+                }
+            )
+
+    def _on_rpc_log(self, call, level, message):
+        event = {
+            "name": "server log",
+            "cat": "log",
+            "ph": "i",
+            "s": "t",
+            "ts": self._timestamp(),
+            "pid": self._pid,
+            "args": {"level": level, "message": message},
+        }
+        with self._lock:
+            event["tid"] = self._thread()
+            self._events.append(event)
+
+    def _on_launch_phase(self, phase, info):
+        now = self._timestamp()
+        launch_id = info.get("launch_id")
+        with self._lock:
+            if launch_id not in self._launches:
+                # a row of its own for every launch, with small ids that no thread has
+                tid = len(self._launches) + 1
+                self._threads[tid] = f"launch {str(launch_id)[:8]}"
+                self._launches[launch_id] = (tid, None, None)
+            tid, previous_phase, previous_time = self._launches[launch_id]
+            if previous_phase is not None:
+                self._events.append(
+                    {
+                        "name": f"{previous_phase} -> {phase}",
+                        "cat": "launch",
+                        "ph": "X",
+                        "ts": previous_time,
+                        "dur": now - previous_time,
+                        "pid": self._pid,
+                        "tid": tid,
+                        "args": info,
+                    }
+                )
+            self._events.append(
+                {
+                    "name": phase,
+                    "cat": "launch",
+                    "ph": "i",
+                    "s": "t",
+                    "ts": now,
+                    "pid": self._pid,
+                    "tid": tid,
+                    "args": info,
+                }
+            )
+            self._launches[launch_id] = (tid, phase, now)
+
+
+__all__ = ["ChromeTraceExporter"]
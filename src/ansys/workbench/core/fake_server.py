@@ -0,0 +1,412 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for a local stand-in of the Workbench gRPC service."""
+
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+import fnmatch
+import io
+import os
+import random
+import tempfile
+import threading
+import time
+import traceback
+import zipfile
+
+import grpc
+
+from ansys.api.workbench.v0 import workbench_pb2 as wb
+from ansys.api.workbench.v0.workbench_pb2_grpc import (
+    WorkbenchServiceServicer,
+    add_WorkbenchServiceServicer_to_server,
+)
+from ansys.tools.common.cyberchannel import create_channel
+from ansys.workbench.core.workbench_client import WorkbenchClient, WorkbenchServiceStub
+
+
+class FakeWorkbenchServer(WorkbenchServiceServicer):
+    """Local stand-in for a Workbench server, for offline tests and benchmarks.
+
+    The server implements the ``RunScript``, ``UploadFile``, and ``DownloadFile`` calls
+    of the Workbench gRPC service on a loopback port or a Unix domain socket. Scripts
+    run in the local Python interpreter with a few stand-ins for Workbench functions,
+    such as ``GetServerWorkingDirectory()``, ``GetFrameworkVersion()``, and ``Reset()``,
+    and return the value of ``wb_script_result``. Latency, download chunk size, log
+    message floods, and failures can be configured to measure and test the client.
+
+    Parameters
+    ----------
+    working_directory : str, default: None
+        Working directory of the server. The default is ``None``, in which case a
+        temporary directory is created and removed when the server stops.
+    host : str, default: "127.0.0.1"
+        Address to listen on.
+    port : int, default: 0
+        Port to listen on. The default is ``0``, in which case a free port is used.
+    uds_path : str, default: None
+        Path of a Unix domain socket to listen on instead of a port.
+    version : str, default: "25.2"
+        Version returned by ``GetFrameworkVersion()``.
+    latency : float, default: 0.0
+        Delay in seconds added at the start of every call.
+    chunk_size : int, default: 65536
+        Size in bytes of the chunks of downloaded files.
+    log_messages : int, default: 0
+        Number of info log messages sent with every script result, to simulate
+        chatty scripts. Like the real server, only messages within the log level of
+        the request are sent.
+    failure_rate : float, default: 0.0
+        Probability that a call fails with ``failure_code``.
+    failure_code : grpc.StatusCode, default: grpc.StatusCode.UNAVAILABLE
+        Status code of random failures.
+    seed : int, default: None
+        Seed of the random failures.
+    functions : dict, default: None
+        Additional functions or values for the script namespace, by name.
+    max_workers : int, default: 10
+        Maximum number of calls handled at the same time.
+
+    Examples
+    --------
+    Measure the round trip of a script call.
+
+    >>> from ansys.workbench.core.fake_server import FakeWorkbenchServer
+    >>> with FakeWorkbenchServer(latency=0.001) as server:
+    ...     wb = server.connect()
+    ...     wb.run_script_string("wb_script_result = str(1 + 1)")
+    2
+    """
+
+    log_batch_size = 100
+
+    def __init__(
+        self,
+        working_directory=None,
+        host="127.0.0.1",
+        port=0,
+        uds_path=None,
+        version="25.2",
+        latency=0.0,
+        chunk_size=65536,
+        log_messages=0,
+        failure_rate=0.0,
+        failure_code=grpc.StatusCode.UNAVAILABLE,
+        seed=None,
+        functions=None,
+        max_workers=10,
+    ):
+        self._temp_dir = None
+        if working_directory is None:
+            self._temp_dir = tempfile.TemporaryDirectory(prefix="wb_fake_server_")
+            working_directory = self._temp_dir.name
+        self.working_directory = working_directory
+        self.host = host
+        self.port = port
+        self.uds_path = uds_path
+        self.version = version
+        self.latency = latency
+        self.chunk_size = chunk_size
+        self.log_messages = log_messages
+        self.failure_rate = failure_rate
+        self.failure_code = failure_code
+        self._random = random.Random(seed)
+        self._functions = dict(functions or {})
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._failures = deque()
+        self._namespace = None
+        self._project_file = None
+        self._server = None
+        self.calls = Counter()
+        """Number of calls handled, by method name."""
+        self.bytes_received = 0
+        """Number of file bytes received by ``UploadFile``."""
+        self.bytes_sent = 0
+        """Number of file bytes sent by ``DownloadFile``."""
+        self.Reset()
+
+    @property
+    def address(self):
+        """Target address of the server for a gRPC channel."""
+        if self.uds_path is not None:
+            return f"unix:{self.uds_path}"
+        return f"{self.host}:{self.port}"
+
+    def start(self):
+        """Start serving.
+
+        Returns
+        -------
+        FakeWorkbenchServer
+            The server itself.
+        """
+        self._server = grpc.server(
+            ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="wb-fake"),
+            options=[("grpc.max_receive_message_length", -1), ("grpc.max_send_message_length", -1)],
+        )
+        add_WorkbenchServiceServicer_to_server(self, self._server)
+        bound = self._server.add_insecure_port(self.address)
+        if self.uds_path is None:
+            self.port = bound
+        self._server.start()
+        return self
+
+    def stop(self, grace=None):
+        """Stop serving and remove the temporary working directory.
+
+        Parameters
+        ----------
+        grace : float, default: None
+            Number of seconds to let running calls finish.
+        """
+        if self._server is not None:
+            self._server.stop(grace).wait()
+            self._server = None
+        if self._temp_dir is not None:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
+
+    def __enter__(self):
+        """Start serving when entering a context."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop serving when exiting a context."""
+        self.stop()
+
+    def connect(self, local_workdir=None, channel_options=None):
+        """Create a client connected to this server.
+
+        Parameters
+        ----------
+        local_workdir : str, default: None
+            Local working directory of the client. The default is ``None``, in which
+            case the system temp directory is used.
+        channel_options : ChannelOptions or str, default: None
+            Settings of the gRPC channel.
+
+        Returns
+        -------
+        WorkbenchClient
+            Connected client.
+        """
+        if local_workdir is None:
+            local_workdir = tempfile.gettempdir()
+        if self.uds_path is None:
+            client = WorkbenchClient(
+                local_workdir, self.host, self.port, "insecure", channel_options
+            )
+            client._connect()
+            return client
+        client = WorkbenchClient(local_workdir, "localhost", 0, "uds", channel_options)
+        client.channel = create_channel(
+            "uds",
+            uds_full_path=self.uds_path,
+            grpc_options=client._channel_options.grpc_options(),
+        )
+        client.stub = WorkbenchServiceStub(client.channel)
+        return client
+
+    def fail_next(self, method=None, count=1, code=grpc.StatusCode.UNAVAILABLE, after_bytes=0):
+        """Make the next calls fail.
+
+        Parameters
+        ----------
+        method : str, default: None
+            Name of the call to fail: "RunScript", "UploadFile", or "DownloadFile". The
+            default is ``None``, in which case the next call of any kind fails.
+        count : int, default: 1
+            Number of calls to fail.
+        code : grpc.StatusCode, default: grpc.StatusCode.UNAVAILABLE
+            Status code of the failure.
+        after_bytes : int, default: 0
+            For file transfers, number of bytes to transfer before failing.
+        """
+        with self._lock:
+            for _ in range(count):
+                self._failures.append((method, code, after_bytes))
+
+    # stand-ins for Workbench functions available to the scripts
+
+    def GetServerWorkingDirectory(self):  # noqa: N802
+        """Return the working directory of the server."""
+        return self.working_directory
+
+    def GetFrameworkVersion(self):  # noqa: N802
+        """Return the version of the server."""
+        return self.version
+
+    def GetProjectFile(self):  # noqa: N802
+        """Return the path of the current project file."""
+        return self._project_file
+
+    def Reset(self):  # noqa: N802
+        """Start a new, empty project and clear the script variables."""
+        self._project_file = os.path.join(self.working_directory, "wbnew.wbpj")
+        self._namespace = {
+            "GetServerWorkingDirectory": self.GetServerWorkingDirectory,
+            "GetFrameworkVersion": self.GetFrameworkVersion,
+            "GetProjectFile": self.GetProjectFile,
+            "Reset": self.Reset,
+            "Save": self.Save,
+            "Archive": self.Archive,
+            "internal_wbexit": lambda: None,
+            **self._functions,
+        }
+
+    def Save(self, FilePath=None, Overwrite=False):  # noqa: N802, N803
+        """Write an empty project file."""
+        if FilePath is not None:
+            self._project_file = FilePath
+        with open(self._project_file, "w", encoding="utf-8") as f:
+            f.write("fake Workbench project\n")
+
+    def Archive(self, FilePath, IncludeSkippedFiles=True):  # noqa: N802, N803
+        """Write a project archive that contains the project file."""
+        with zipfile.ZipFile(FilePath, "w") as archive:
+            archive.write(self._project_file, os.path.basename(self._project_file))
+
+    # gRPC service
+
+    def RunScript(self, request, context):  # noqa: N802
+        """Run a script with the local Python interpreter."""
+        self.__begin_call("RunScript", context)
+        if self.log_messages and request.log_level >= wb.LOG_INFO:
+            for start in range(0, self.log_messages, self.log_batch_size):
+                count = min(self.log_batch_size, self.log_messages - start)
+                yield wb.RunScriptResponse(
+                    log=wb.RunScriptLog(
+                        messages=[
+                            wb.LogEntry(level=wb.LOG_INFO, message=f"log message {start + i}")
+                            for i in range(count)
+                        ]
+                    )
+                )
+        namespace = self._namespace
+        namespace["wb_script_result"] = None
+        try:
+            exec(request.content, namespace)
+        except Exception:
+            yield wb.RunScriptResponse(result=wb.RunScriptResult(error=traceback.format_exc()))
+            return
+        result = namespace.get("wb_script_result")
+        yield wb.RunScriptResponse(
+            result=wb.RunScriptResult(result="" if result is None else str(result))
+        )
+
+    def UploadFile(self, request_iterator, context):  # noqa: N802
+        """Write an uploaded file into the working directory."""
+        failure = self.__begin_call("UploadFile", context)
+        file = None
+        file_name = ""
+        received = 0
+        try:
+            for request in request_iterator:
+                if file is None:
+                    file_name = request.file_name
+                    file = open(os.path.join(self.working_directory, file_name), "wb")
+                if failure is not None and received >= failure[2]:
+                    context.abort(failure[0], failure[1])
+                file.write(request.file_content)
+                received += len(request.file_content)
+        finally:
+            if file is not None:
+                file.close()
+            with self._lock:
+                self.bytes_received += received
+        return wb.UploadFileResponse(file_name=file_name)
+
+    def DownloadFile(self, request, context):  # noqa: N802
+        """Stream a file, or a ZIP archive of the files matching a pattern."""
+        failure = self.__begin_call("DownloadFile", context)
+        file_name = request.file_name
+        is_archive = "*" in file_name or "?" in file_name
+        if is_archive:
+            names = fnmatch.filter(sorted(os.listdir(self.working_directory)), file_name)
+            if not names:
+                yield wb.DownloadFileResponse(error=f"No file matches {file_name}.")
+                return
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+                for name in names:
+                    archive.write(os.path.join(self.working_directory, name), name)
+            source = io.BytesIO(buffer.getvalue())
+            size = len(buffer.getvalue())
+        else:
+            path = os.path.join(self.working_directory, file_name)
+            if not os.path.isfile(path):
+                yield wb.DownloadFileResponse(error=f"File {file_name} does not exist.")
+                return
+            source = open(path, "rb")
+            size = os.path.getsize(path)
+        sent = 0
+        try:
+            yield wb.DownloadFileResponse(
+                file_info=wb.DownloadFileInfo(is_archive=is_archive, file_size=size)
+            )
+            while True:
+                if failure is not None and sent >= failure[2]:
+                    context.abort(failure[0], failure[1])
+                block = source.read(self.chunk_size)
+                if not block:
+                    break
+                yield wb.DownloadFileResponse(file_content=block)
+                sent += len(block)
+        finally:
+            source.close()
+            with self._lock:
+                self.bytes_sent += sent
+
+    def __begin_call(self, method, context):
+        """Count the call, apply the latency, and inject failures.
+
+        Returns
+        -------
+        tuple
+            Status code, message, and number of bytes to transfer before failing, or
+            ``None`` if the call does not fail.
+        """
+        with self._lock:
+            self.calls[method] += 1
+            failure = None
+            for index, (failed_method, code, after_bytes) in enumerate(self._failures):
+                if failed_method in (None, method):
+                    failure = (code, after_bytes)
+                    del self._failures[index]
+                    break
+            if failure is None and self.failure_rate and self._random.random() < self.failure_rate:
+                failure = (self.failure_code, 0)
+        if self.latency:
+            time.sleep(self.latency)
+        if failure is None:
+            return None
+        code, after_bytes = failure
+        message = f"Injected failure of {method}."
+        if after_bytes <= 0 or method == "RunScript":
+            context.abort(code, message)
+        return code, message, after_bytes
+
+
+__all__ = ["FakeWorkbenchServer"]
@@ -0,0 +1,162 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for hashing local files with a persistent cache."""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+
+SERVER_SHA256_FUNCTION = """import hashlib
+def _wb_sha256(file_path):
+    sha = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while True:
+            block = f.read(1048576)
+            if not block:
+                break
+            sha.update(block)
+    return sha.hexdigest()
+"""
+"""Server script snippet that defines ``_wb_sha256(file_path)`` matching ``file_sha256()``."""
+
+
+def file_sha256(file_path):
+    """Return the SHA-256 hex digest of a local file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the file.
+
+    Returns
+    -------
+    str
+        Hex digest of the file content.
+    """
+    sha = hashlib.sha256()
+    with open(file_path, mode="rb") as f:
+        while True:
+            block = f.read(1 << 20)
+            if not block:
+                break
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def default_index_path():
+    """Return the path of the hash index in the cache directory of the current user.
+
+    The index decides which files are uploaded, so it is not kept in a shared
+    directory such as the system temp directory, where other users could read or
+    alter it. The index is kept in an ``ansys-workbench`` folder in ``%LOCALAPPDATA%``
+    on Windows, and in ``$XDG_CACHE_HOME`` or ``~/.cache`` otherwise. The folder is
+    created accessible to the current user only.
+
+    Returns
+    -------
+    str
+        Path to the JSON file of the index.
+    """
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cache_dir = os.path.join(base, "ansys-workbench")
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    except OSError as ex:
+        logging.warning(f"Failed to create the cache directory {cache_dir}: {ex}")
+    return os.path.join(cache_dir, "file_hash_index.json")
+
+
+class FileHashIndex:
+    """Cache of SHA-256 hashes of local files, keyed by path, size, and modification time.
+
+    A file is hashed again only when its size or modification time changes, so
+    unchanged multi-GB files are not read again on every upload.
+
+    Parameters
+    ----------
+    index_path : str
+        Path to the JSON file that stores the index between sessions.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self._entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def sha256(self, file_path):
+        """Return the SHA-256 hex digest of a file, using the cached value when valid.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file.
+
+        Returns
+        -------
+        str
+            Hex digest of the file content.
+        """
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        key = [stat.st_size, stat.st_mtime_ns]
+        with self._lock:
+            entry = self._entries.get(file_path)
+        if entry is not None and entry[:2] == key:
+            return entry[2]
+        digest = file_sha256(file_path)
+        with self._lock:
+            self._entries[file_path] = key + [digest]
+            self._dirty = True
+        return digest
+
+    def save(self):
+        """Write the index to disk if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            # a unique name keeps clients that save at the same time from mixing writes
+            temp_path = f"{self.index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(temp_path, mode="w", encoding="utf-8") as f:
+                    json.dump(self._entries, f)
+                os.replace(temp_path, self.index_path)
+                self._dirty = False
+            except OSError as ex:
+                logging.warning(f"Failed to save the file hash index {self.index_path}: {ex}")
+                with contextlib.suppress(OSError):
+                    os.remove(temp_path)
+
+
+__all__ = ["FileHashIndex", "default_index_path", "file_sha256"]
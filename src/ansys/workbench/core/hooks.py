@@ -0,0 +1,165 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for callbacks on the gRPC calls of the clients and on server launches."""
+
+import logging
+import threading
+
+EVENTS = ("rpc_start", "rpc_chunk", "rpc_log", "rpc_end", "launch_phase")
+"""Names of the events that callbacks can be registered for.
+
+- ``rpc_start(call)``: a gRPC call starts.
+- ``rpc_chunk(call, size)``: a message of a streamed call is sent or received. The size is
+  the number of file bytes it carries, or the size of the message for script calls.
+- ``rpc_log(call, level, message)``: a server log message is received during a script call.
+- ``rpc_end(call)``: a gRPC call ends. The ``error`` of the call is set if it failed.
+- ``launch_phase(phase, info)``: a server launch reaches a phase: "started",
+  "process_spawned", "port_seen", "connected", or "failed". The info dictionary contains
+  the ``launch_id`` and, when known, the ``pid``, ``port``, and ``host`` of the server.
+
+The ``call`` is the ``RpcCall`` measuring the call, with its ``method``, ``start`` and
+``end`` times from ``time.perf_counter()``, and its byte, chunk, and log counters.
+"""
+
+
+class HookRegistry:
+    """Callbacks for the events of gRPC calls and server launches.
+
+    A callback that raises an exception is logged and does not affect the call.
+    Registries can be chained, so that the events of a client also reach the callbacks
+    registered for all clients.
+
+    Parameters
+    ----------
+    parent : HookRegistry, default: None
+        Registry that also receives all events of this registry.
+    """
+
+    def __init__(self, parent=None):
+        self._parent = parent
+        self._lock = threading.Lock()
+        self._callbacks = {event: () for event in EVENTS}
+        self._count = 0
+
+    def add(self, event, callback):
+        """Register a callback for an event.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event. Options are "rpc_start", "rpc_chunk", "rpc_log",
+            "rpc_end", and "launch_phase".
+        callback : callable
+            Function called with the arguments of the event.
+
+        Returns
+        -------
+        callable
+            The callback.
+        """
+        if event not in self._callbacks:
+            raise ValueError(f"Invalid hook event: {event}")
+        with self._lock:
+            # replace the tuple so that events being emitted keep a consistent view
+            self._callbacks[event] = self._callbacks[event] + (callback,)
+            self._count += 1
+        return callback
+
+    def remove(self, event, callback):
+        """Unregister a callback for an event.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event.
+        callback : callable
+            Function registered with ``add()``.
+        """
+        with self._lock:
+            callbacks = list(self._callbacks[event])
+            if callback in callbacks:
+                callbacks.remove(callback)
+                self._callbacks[event] = tuple(callbacks)
+                self._count -= 1
+
+    def __bool__(self):
+        """Return whether any callback would receive an event of this registry."""
+        return self._count > 0 or bool(self._parent)
+
+    def emit(self, event, *args):
+        """Call the callbacks of an event with the given arguments.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event.
+        *args
+            Arguments passed to the callbacks.
+        """
+        for callback in self._callbacks[event]:
+            try:
+                callback(*args)
+            except Exception as ex:
+                logging.error(f"The {event} hook {callback!r} failed: {ex}")
+        if self._parent is not None:
+            self._parent.emit(event, *args)
+
+
+global_hooks = HookRegistry()
+"""Registry whose callbacks receive the events of all clients and launchers."""
+
+
+def add_hook(event, callback):
+    """Register a callback for an event of all clients and server launches.
+
+    Parameters
+    ----------
+    event : str
+        Name of the event. Options are "rpc_start", "rpc_chunk", "rpc_log", "rpc_end",
+        and "launch_phase".
+    callback : callable
+        Function called with the arguments of the event.
+
+    Returns
+    -------
+    callable
+        The callback.
+    """
+    return global_hooks.add(event, callback)
+
+
+def remove_hook(event, callback):
+    """Unregister a callback registered with ``add_hook()``.
+
+    Parameters
+    ----------
+    event : str
+        Name of the event.
+    callback : callable
+        Function registered with ``add_hook()``.
+    """
+    global_hooks.remove(event, callback)
+
+
+__all__ = ["EVENTS", "HookRegistry", "add_hook", "global_hooks", "remove_hook"]
@@ -0,0 +1,350 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for reporting the progress of file transfers."""
+
+import logging
+import threading
+import time
+
+
+class ProgressReporter:
+    """Base class of the progress reporters of file transfers.
+
+    A reporter is told when a transfer starts, receives updates at most once every
+    ``interval`` seconds while the transfer runs, and is told when it finishes. Every
+    call receives the ``ProgressTracker`` of the transfer with its totals, so a reporter
+    can follow several transfers at once. A transfer of several files reports their
+    combined totals.
+    """
+
+    interval = 0.1
+    """Minimum number of seconds between two updates of a transfer."""
+
+    def start(self, tracker):
+        """Report the start of a transfer.
+
+        Parameters
+        ----------
+        tracker : ProgressTracker
+            Progress of the transfer.
+        """
+
+    def update(self, tracker):
+        """Report the progress of a transfer.
+
+        Parameters
+        ----------
+        tracker : ProgressTracker
+            Progress of the transfer.
+        """
+
+    def finish(self, tracker):
+        """Report the end of a transfer.
+
+        Parameters
+        ----------
+        tracker : ProgressTracker
+            Progress of the transfer.
+        """
+
+
+class SilentProgress(ProgressReporter):
+    """Progress reporter that reports nothing."""
+
+    interval = float("inf")
+
+
+class TqdmProgress(ProgressReporter):
+    """Progress reporter that shows a ``tqdm`` progress bar for every transfer.
+
+    The ``tqdm`` module is imported when the first progress bar is shown.
+
+    Parameters
+    ----------
+    interval : float, default: 0.1
+        Minimum number of seconds between two updates of a progress bar.
+    **tqdm_options
+        Other arguments of the progress bars, such as ``file`` or ``leave``.
+    """
+
+    def __init__(self, interval=0.1, **tqdm_options):
+        self.interval = interval
+        self._tqdm_options = tqdm_options
+        self._bars = {}
+
+    def start(self, tracker):
+        """Show a progress bar."""
+        import tqdm
+
+        self._bars[id(tracker)] = tqdm.tqdm(
+            total=tracker.total or None,
+            initial=tracker.done,
+            desc=tracker.description,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            **self._tqdm_options,
+        )
+
+    def update(self, tracker):
+        """Move the progress bar."""
+        bar = self._bars.get(id(tracker))
+        if bar is not None:
+            bar.update(tracker.done - bar.n)
+
+    def finish(self, tracker):
+        """Complete and close the progress bar."""
+        bar = self._bars.pop(id(tracker), None)
+        if bar is not None:
+            bar.update(tracker.done - bar.n)
+            bar.close()
+
+
+class LoggingProgress(ProgressReporter):
+    """Progress reporter that writes log messages, for headless runs.
+
+    Parameters
+    ----------
+    logger : logging.Logger, default: None
+        Logger to write to. The default is ``None``, in which case the root logger is used.
+    level : int, default: logging.INFO
+        Level of the messages.
+    interval : float, default: 10.0
+        Minimum number of seconds between two messages about a transfer.
+    """
+
+    def __init__(self, logger=None, level=logging.INFO, interval=10.0):
+        self._logger = logger or logging.getLogger()
+        self._level = level
+        self.interval = interval
+
+    def _log(self, tracker, state):
+        message = f"{tracker.description}: {state} {tracker.done / 1048576:.1f}"
+        if tracker.total:
+            message += f" of {tracker.total / 1048576:.1f} MB ({tracker.fraction:.0%})"
+        else:
+            message += " MB"
+        if tracker.files > 1:
+            message += f", {tracker.files_done} of {tracker.files} files"
+        message += f" at {tracker.rate / 1048576:.1f} MB/s"
+        self._logger.log(self._level, message)
+
+    def update(self, tracker):
+        """Log the progress."""
+        self._log(tracker, "transferred")
+
+    def finish(self, tracker):
+        """Log the result."""
+        self._log(tracker, "finished after")
+
+
+class CallbackProgress(ProgressReporter):
+    """Progress reporter that calls a function.
+
+    Parameters
+    ----------
+    callback : callable
+        Function called with the ``ProgressTracker`` of the transfer on every update and
+        when the transfer finishes.
+    interval : float, default: 0.5
+        Minimum number of seconds between two calls about a transfer.
+    """
+
+    def __init__(self, callback, interval=0.5):
+        self._callback = callback
+        self.interval = interval
+
+    def update(self, tracker):
+        """Call the function."""
+        self._callback(tracker)
+
+    def finish(self, tracker):
+        """Call the function."""
+        self._callback(tracker)
+
+
+class ProgressTracker:
+    """Progress of a file transfer, which updates its reporter at a limited rate.
+
+    Parameters
+    ----------
+    reporter : ProgressReporter
+        Reporter to update.
+    description : str
+        Description of the transfer.
+    total : int, default: 0
+        Total number of bytes to transfer, or ``0`` if unknown.
+    initial : int, default: 0
+        Number of bytes transferred before, such as for a resumed download.
+    files : int, default: 1
+        Number of files in the transfer.
+    """
+
+    def __init__(self, reporter, description, total=0, initial=0, files=1):
+        self.reporter = reporter
+        self.description = description
+        self.total = total
+        self.done = initial
+        self.files = files
+        self.files_done = 0
+        self._initial = initial
+        self._start = time.monotonic()
+        self._next_update = self._start + reporter.interval
+        self._lock = threading.Lock()
+        self._closed = False
+        reporter.start(self)
+
+    @property
+    def elapsed(self):
+        """Number of seconds since the transfer started."""
+        return time.monotonic() - self._start
+
+    @property
+    def fraction(self):
+        """Transferred fraction of the total, or ``0.0`` if the total is unknown."""
+        return self.done / self.total if self.total else 0.0
+
+    @property
+    def rate(self):
+        """Average transfer rate of this transfer in bytes per second."""
+        elapsed = self.elapsed
+        return (self.done - self._initial) / elapsed if elapsed > 0 else 0.0
+
+    def advance(self, size):
+        """Count transferred bytes, and update the reporter if the interval has passed.
+
+        Parameters
+        ----------
+        size : int
+            Number of bytes transferred since the last call.
+        """
+        with self._lock:
+            self.done += size
+            now = time.monotonic()
+            if now >= self._next_update:
+                self._next_update = now + self.reporter.interval
+                self.reporter.update(self)
+
+    def file_done(self):
+        """Count a completed file of a transfer of several files."""
+        with self._lock:
+            self.files_done += 1
+
+    def close(self):
+        """Report the end of the transfer."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self.reporter.finish(self)
+
+
+_default_reporter = None
+
+
+def set_default_progress(reporter):
+    """Set how transfers report their progress when ``show_progress=True`` is given.
+
+    Parameters
+    ----------
+    reporter : ProgressReporter, str, or callable
+        Reporter to use, the name of a built-in reporter ("tqdm", "logging", or
+        "silent"), or a function to call with the ``ProgressTracker`` of the transfer.
+        ``None`` restores the default ``tqdm`` progress bars.
+    """
+    global _default_reporter
+    _default_reporter = None if reporter is None else get_progress_reporter(reporter)
+
+
+def get_progress_reporter(show_progress):
+    """Return the reporter for the ``show_progress`` argument of a transfer.
+
+    Parameters
+    ----------
+    show_progress : bool, str, ProgressReporter, or callable
+        ``True`` for the default reporter, ``False`` or ``None`` for no reporting, the name
+        of a built-in reporter ("tqdm", "logging", or "silent"), a reporter, or a
+        function to call with the ``ProgressTracker`` of the transfer.
+
+    Returns
+    -------
+    ProgressReporter
+        Reporter, or ``None`` if the progress is not reported.
+    """
+    if show_progress is None or show_progress is False:
+        return None
+    if show_progress is True:
+        if _default_reporter is None:
+            return TqdmProgress()
+        return _default_reporter
+    if isinstance(show_progress, ProgressReporter):
+        return show_progress
+    if isinstance(show_progress, str):
+        reporters = {"tqdm": TqdmProgress, "logging": LoggingProgress, "silent": SilentProgress}
+        if show_progress not in reporters:
+            raise ValueError(f"Invalid progress reporter: {show_progress}")
+        return reporters[show_progress]()
+    if callable(show_progress):
+        return CallbackProgress(show_progress)
+    raise TypeError(f"Invalid progress reporter: {show_progress!r}")
+
+
+def track_progress(show_progress, description, total=0, initial=0, files=1):
+    """Start tracking the progress of a transfer.
+
+    Parameters
+    ----------
+    show_progress : bool, str, ProgressReporter, or callable
+        How to report the progress. See ``get_progress_reporter()``.
+    description : str
+        Description of the transfer.
+    total : int, default: 0
+        Total number of bytes to transfer, or ``0`` if unknown.
+    initial : int, default: 0
+        Number of bytes transferred before.
+    files : int, default: 1
+        Number of files in the transfer.
+
+    Returns
+    -------
+    ProgressTracker
+        Tracker of the transfer, or ``None`` if the progress is not reported.
+    """
+    reporter = get_progress_reporter(show_progress)
+    if reporter is None:
+        return None
+    return ProgressTracker(reporter, description, total, initial, files)
+
+
+__all__ = [
+    "CallbackProgress",
+    "LoggingProgress",
+    "ProgressReporter",
+    "ProgressTracker",
+    "SilentProgress",
+    "TqdmProgress",
+    "get_progress_reporter",
+    "set_default_progress",
+    "track_progress",
+]
@@ -22,13 +22,19 @@
 
 """Module for public API on PyWorkbench."""
 
+import asyncio
 import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 import tempfile
+import time
 
+from ansys.workbench.core.async_workbench_client import AsyncWorkbenchClient
 from ansys.workbench.core.workbench_client import WorkbenchClient
 from ansys.workbench.core.workbench_launcher import Launcher
 
+_warm_spares = None
+
 
 class ClientWrapper(WorkbenchClient):
     """Provides for connecting to a Workbench server.
@@ -44,15 +50,18 @@ class ClientWrapper(WorkbenchClient):
     security : str, default: 'mtls'
         Transport mode used for connection security.
         Options are: "insecure", "uds", "wnua", "mtls"
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
     """
 
-    def __init__(self, port, client_workdir=None, host=None, security="mtls"):
+    def __init__(self, port, client_workdir=None, host=None, security="mtls", channel_options=None):
         """Create a PyWorkbench client that connects to a Workbench server."""
         if host is None:
             host = "localhost"
         if client_workdir is None:
             client_workdir = tempfile.gettempdir()
-        super().__init__(client_workdir, host, port, security)
+        super().__init__(client_workdir, host, port, security, channel_options)
         super()._connect()
 
     def exit(self):
@@ -62,6 +71,56 @@ class ClientWrapper(WorkbenchClient):
             logging.info("Workbench server connection has ended.")
 
 
+def _launch_server(
+    version,
+    show_gui,
+    server_workdir,
+    port,
+    use_insecure_connection,
+    host,
+    username,
+    password,
+    timeout=480,
+    output_lines=1000,
+    forward_output=False,
+):
+    """Launch a server, or take a matching warm spare.
+
+    Returns
+    -------
+    tuple
+        Launcher, port, and security mode of the server. The port is ``0`` if the server
+        failed to start.
+    """
+    if _warm_spares is not None and port <= 0:
+        if _warm_spares.matches(
+            version=version,
+            show_gui=show_gui,
+            server_workdir=server_workdir,
+            use_insecure_connection=use_insecure_connection,
+            host=host,
+            username=username,
+            password=password,
+        ):
+            spare = _warm_spares.take()
+            if spare is not None:
+                spare[0].configure_output(output_lines, forward_output)
+                return spare
+    launcher = Launcher(output_lines, forward_output)
+    port, security = launcher.launch(
+        version,
+        show_gui,
+        server_workdir,
+        port,
+        use_insecure_connection,
+        host,
+        username,
+        password,
+        timeout,
+    )
+    return launcher, port, security
+
+
 class LaunchWorkbench(ClientWrapper):
     """Launch a Workbench server on a local machine or a remote Windows machine.
 
@@ -88,6 +147,15 @@ class LaunchWorkbench(ClientWrapper):
     password : str, None
         User's password on the server computer. The default is ``None`` for launching on
         the local computer.
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
+    output_lines : int, default: 1000
+        Number of the most recent output lines of the server process to keep for
+        ``recent_output()``.
+    forward_output : bool, default: False
+        Whether to also log every output line of the server process to the "WB" logger
+        at the info level.
 
     Raises
     ------
@@ -113,9 +181,11 @@ class LaunchWorkbench(ClientWrapper):
         host=None,
         username=None,
         password=None,
+        channel_options=None,
+        output_lines=1000,
+        forward_output=False,
     ):
-        self._launcher = Launcher()
-        port, security = self._launcher.launch(
+        launcher, port, security = _launch_server(
             version,
             show_gui,
             server_workdir,
@@ -124,7 +194,43 @@ class LaunchWorkbench(ClientWrapper):
             host,
             username,
             password,
+            output_lines=output_lines,
+            forward_output=forward_output,
+        )
+        self._attach(
+            launcher, port, security, client_workdir, host, use_insecure_connection, channel_options
         )
+
+    @classmethod
+    def _from_launcher(
+        cls,
+        launcher,
+        port,
+        security,
+        client_workdir=None,
+        host=None,
+        use_insecure_connection=False,
+        channel_options=None,
+    ):
+        """Create a client for a server that is already launched."""
+        client = cls.__new__(cls)
+        client._attach(
+            launcher, port, security, client_workdir, host, use_insecure_connection, channel_options
+        )
+        return client
+
+    def _attach(
+        self,
+        launcher,
+        port,
+        security,
+        client_workdir,
+        host,
+        use_insecure_connection,
+        channel_options,
+    ):
+        """Connect to a launched server and take over its launcher."""
+        self._launcher = launcher
         if port is None or port <= 0:
             raise Exception("Failed to launch Ansys Workbench service.")
         if use_insecure_connection:
@@ -133,10 +239,28 @@ class LaunchWorkbench(ClientWrapper):
                 "Please see the documentation for your installed "
                 "product for additional information."
             )
-        super().__init__(port, client_workdir, host, security)
+        super().__init__(port, client_workdir, host, security, channel_options)
+        launcher.report_phase("connected", host=host, port=port)
         atexit.register(self.exit)
         self._exited = False
 
+    def recent_output(self, lines=None):
+        """Return the most recent output lines of the Workbench server process.
+
+        Parameters
+        ----------
+        lines : int, default: None
+            Maximum number of lines to return. The default is ``None``, in which case
+            all kept lines are returned.
+
+        Returns
+        -------
+        list of str
+            Output lines, oldest first. The list is empty on Windows, where the output
+            of the server process is not captured.
+        """
+        return self._launcher.recent_output(lines)
+
     def exit(self):
         """Terminate the Workbench server and disconnect the client."""
         if self._exited:
@@ -160,6 +284,9 @@ def launch_workbench(
     host=None,
     username=None,
     password=None,
+    channel_options=None,
+    output_lines=1000,
+    forward_output=False,
 ):
     """Launch PyWorkbench server on the local machine or a remote Windows machine.
 
@@ -192,6 +319,15 @@ def launch_workbench(
     password : str, None
         User's password on the server computer. The default is ``None`` for launching on
         the local computer.
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
+    output_lines : int, default: 1000
+        Number of the most recent output lines of the server process to keep for
+        ``recent_output()``.
+    forward_output : bool, default: False
+        Whether to also log every output line of the server process to the "WB" logger
+        at the info level.
 
     Returns
     -------
@@ -216,10 +352,181 @@ def launch_workbench(
         host,
         username,
         password,
+        channel_options,
+        output_lines,
+        forward_output,
     )
 
 
-def connect_workbench(port, client_workdir=None, host=None, security="mtls"):
+def launch_many(
+    count,
+    timeout=480,
+    show_gui=True,
+    version=None,
+    client_workdir=None,
+    server_workdir=None,
+    use_insecure_connection=False,
+    host=None,
+    username=None,
+    password=None,
+    channel_options=None,
+    output_lines=1000,
+    forward_output=False,
+):
+    """Launch several PyWorkbench servers at the same time.
+
+    All servers are started at once and their startup is awaited concurrently, so
+    launching many servers takes about as long as launching one. Servers that fail to
+    start within the timeout are stopped and reported in the log. The servers that
+    did start are kept.
+
+    Parameters
+    ----------
+    count : int
+        Number of servers to launch.
+    timeout : float, default: 480
+        Maximum number of seconds to wait for all servers to start.
+    show_gui : bool, default: True
+        Weather to launch Workbench in UI mode.
+    version : str, default: None
+        Workbench version to launch. It must be a 3-digit version that is "242" or later.
+        If None, the latest version available will be used.
+    client_workdir : str, default: None
+        Path to a writable directory on the client computer. The default is ``None``,
+        in which case the system temp directory is used.
+    server_workdir : str, None
+        Path to a writable directory on the server computer. The default is ``None``,
+        in which case the user preference for the Workbench temporary file folder is used.
+    use_insecure_connection : bool, default: False
+        whether to use insecure connection between the server and clients
+    host : str, None
+        Server computer's name or IP address. The default is ``None`` for launching on the
+        local computer.
+    username : str, None
+        User's login name on the server computer. The default is ``None`` for launching on
+        the local computer.
+    password : str, None
+        User's password on the server computer. The default is ``None`` for launching on
+        the local computer.
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
+    output_lines : int, default: 1000
+        Number of the most recent output lines of the server process to keep for
+        ``recent_output()``.
+    forward_output : bool, default: False
+        Whether to also log every output line of the server process to the "WB" logger
+        at the info level.
+
+    Returns
+    -------
+    list of WorkbenchClient
+        Clients of the started servers in the order in which the servers became ready.
+
+    Raises
+    ------
+    Exception
+        If none of the servers started.
+
+    Examples
+    --------
+    Launch eight servers without UI.
+
+    >>> from ansys.workbench.core import launch_many
+    >>> clients = launch_many(8, show_gui=False)
+    """
+    deadline = time.monotonic() + timeout
+
+    def launch():
+        return _launch_server(
+            version,
+            show_gui,
+            server_workdir,
+            -1,
+            use_insecure_connection,
+            host,
+            username,
+            password,
+            max(0.0, deadline - time.monotonic()),
+            output_lines,
+            forward_output,
+        )
+
+    clients = []
+    failures = 0
+    with ThreadPoolExecutor(max_workers=count, thread_name_prefix="wb-launch") as executor:
+        futures = [executor.submit(launch) for _ in range(count)]
+        for future in as_completed(futures):
+            try:
+                launcher, port, security = future.result()
+            except Exception as ex:
+                logging.error(f"Failed to launch a Workbench server: {ex}")
+                failures += 1
+                continue
+            if port is None or port <= 0:
+                logging.error("Failed to launch a Workbench server.")
+                launcher.exit()
+                failures += 1
+                continue
+            clients.append(
+                LaunchWorkbench._from_launcher(
+                    launcher,
+                    port,
+                    security,
+                    client_workdir,
+                    host,
+                    use_insecure_connection,
+                    channel_options,
+                )
+            )
+    if not clients:
+        raise Exception("Failed to launch Ansys Workbench service.")
+    if failures:
+        logging.error(f"{failures} of {count} Workbench servers failed to launch.")
+    return clients
+
+
+def enable_warm_spares(count=1, idle_timeout=600.0, **launch_options):
+    """Keep Workbench servers launched in the background for ``launch_workbench()``.
+
+    A ``launch_workbench()`` call with the same launch options and no explicit port then
+    returns a client for a ready server immediately, and a replacement is launched in the
+    background. Spares that stay unused for ``idle_timeout`` seconds are stopped.
+
+    Parameters
+    ----------
+    count : int, default: 1
+        Number of spare servers to keep ready.
+    idle_timeout : float, default: 600.0
+        Number of seconds after which an unused spare is stopped.
+    **launch_options
+        Options for launching the spares: ``version``, ``show_gui``, ``server_workdir``,
+        ``use_insecure_connection``, ``host``, ``username``, and ``password``.
+
+    Examples
+    --------
+    Keep two servers without UI ready and use one of them.
+
+    >>> from ansys.workbench.core import enable_warm_spares, launch_workbench
+    >>> enable_warm_spares(2, show_gui=False, version="252")
+    >>> wb = launch_workbench(show_gui=False, version="252")
+    """
+    from ansys.workbench.core.warm_spares import WarmSparePool
+
+    global _warm_spares
+    disable_warm_spares()
+    _warm_spares = WarmSparePool(count, idle_timeout, **launch_options)
+
+
+def disable_warm_spares():
+    """Stop the spare servers started by ``enable_warm_spares()``."""
+    global _warm_spares
+    if _warm_spares is not None:
+        _warm_spares.close()
+        _warm_spares = None
+
+
+def connect_workbench(port, client_workdir=None, host=None, security="mtls", channel_options=None):
     """Create a PyWorkbench client that connects to an already running Workbench server.
 
     Parameters
@@ -233,6 +540,9 @@ def connect_workbench(port, client_workdir=None, host=None, security="mtls"):
         Server computer's name or IP address. The default is ``None`` for the local computer.
     security : str among 'mtls', 'wnua', 'insecure', default: 'mtls'
         Transport mode used for connection security. The default is `mtls`.
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
 
     Returns
     -------
@@ -247,7 +557,240 @@ def connect_workbench(port, client_workdir=None, host=None, security="mtls"):
     >>> from ansys.workbench.core import connect_workbench
     >>> wb = connect_workbench(port = 32588)
     """
-    return ClientWrapper(port, client_workdir, host, security)
+    return ClientWrapper(port, client_workdir, host, security, channel_options)
+
+
+class AsyncClientWrapper(AsyncWorkbenchClient):
+    """Provides for connecting to a Workbench server with an asynchronous client.
+
+    Parameters
+    ----------
+    port : int
+        Port used by the server.
+    client_workdir : str, default: None
+        Path to a writable directory on the client computer.
+    host : str, default: None
+        Server computer's name or IP address.
+    security : str, default: 'mtls'
+        Transport mode used for connection security.
+        Options are: "insecure", "uds", "wnua", "mtls"
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
+    """
+
+    def __init__(self, port, client_workdir=None, host=None, security="mtls", channel_options=None):
+        """Create an asynchronous PyWorkbench client that connects to a Workbench server."""
+        if host is None:
+            host = "localhost"
+        if client_workdir is None:
+            client_workdir = tempfile.gettempdir()
+        super().__init__(client_workdir, host, port, security, channel_options)
+        super()._connect()
+
+    async def exit(self):
+        """Disconnect from the server."""
+        if super()._is_connected():
+            await super()._disconnect()
+            logging.info("Workbench server connection has ended.")
+
+
+class AsyncLaunchWorkbench(AsyncClientWrapper):
+    """Asynchronous client for a Workbench server started by ``launch_workbench_async()``.
+
+    Parameters
+    ----------
+    launcher : Launcher
+        Launcher that started the server.
+    port : int
+        Port used by the server.
+    security : str
+        Transport mode used for connection security.
+    client_workdir : str, default: None
+        Path to a writable directory on the client computer.
+    host : str, default: None
+        Server computer's name or IP address.
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
+    """
+
+    def __init__(
+        self, launcher, port, security, client_workdir=None, host=None, channel_options=None
+    ):
+        self._launcher = launcher
+        super().__init__(port, client_workdir, host, security, channel_options)
+        launcher.report_phase("connected", host=host, port=port)
+        # the event loop may be gone at interpreter exit, so fall back to killing the process
+        atexit.register(self._launcher.exit)
+        self._exited = False
+
+    def recent_output(self, lines=None):
+        """Return the most recent output lines of the Workbench server process.
+
+        Parameters
+        ----------
+        lines : int, default: None
+            Maximum number of lines to return. The default is ``None``, in which case
+            all kept lines are returned.
+
+        Returns
+        -------
+        list of str
+            Output lines, oldest first. The list is empty on Windows, where the output
+            of the server process is not captured.
+        """
+        return self._launcher.recent_output(lines)
 
+    async def exit(self):
+        """Terminate the Workbench server and disconnect the client."""
+        if self._exited:
+            return
+        await self.run_script_string("Reset()")
+        if await self.get_server_version() >= 252:
+            await self.run_script_string("internal_wbexit()")
+        else:
+            self._launcher.exit()
+        atexit.unregister(self._launcher.exit)
+        await super().exit()
+        self._exited = True
 
-__all__ = ["launch_workbench", "connect_workbench"]
+
+async def launch_workbench_async(
+    show_gui=True,
+    version=None,
+    client_workdir=None,
+    server_workdir=None,
+    port=-1,
+    use_insecure_connection=False,
+    host=None,
+    username=None,
+    password=None,
+    channel_options=None,
+    output_lines=1000,
+    forward_output=False,
+):
+    """Launch PyWorkbench server and create an asynchronous client that connects to it.
+
+    The server startup runs in a worker thread, so the event loop stays free while
+    Workbench starts. The parameters are the same as for the ``launch_workbench()`` function,
+    and a matching warm spare is taken when ``enable_warm_spares()`` was called.
+
+    Parameters
+    ----------
+    show_gui : bool, default: True
+        Weather to launch Workbench in UI mode.
+    version : str, default: None
+        Workbench version to launch. It must be a 3-digit version that is "242" or later.
+        If None, the latest version available will be used.
+    client_workdir : str, default: None
+        Path to a writable directory on the client computer. The default is ``None``,
+        in which case the system temp directory is used.
+    server_workdir : str, None
+        Path to a writable directory on the server computer. The default is ``None``,
+        in which case the user preference for the Workbench temporary file folder is used.
+    port : int, optional
+        Port to use for the launched server. If not specified, port is auto determined.
+    use_insecure_connection : bool, default: False
+        whether to use insecure connection between the server and clients
+    host : str, None
+        Server computer's name or IP address. The default is ``None`` for launching on the
+        local computer.
+    username : str, None
+        User's login name on the server computer. The default is ``None`` for launching on
+        the local computer.
+    password : str, None
+        User's password on the server computer. The default is ``None`` for launching on
+        the local computer.
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
+    output_lines : int, default: 1000
+        Number of the most recent output lines of the server process to keep for
+        ``recent_output()``.
+    forward_output : bool, default: False
+        Whether to also log every output line of the server process to the "WB" logger
+        at the info level.
+
+    Returns
+    -------
+    AsyncWorkbenchClient
+        Instance of the asynchronous PyWorkbench client that is connected to the launched server.
+
+    Raises
+    ------
+    Exception
+        If PyWorkbench server failed to launch.
+
+    Examples
+    --------
+    Launch a server on the local computer and use the ``wb`` variable to hold the returned client.
+
+    >>> from ansys.workbench.core import launch_workbench_async
+    >>> wb = await launch_workbench_async()
+
+    """
+    launcher, port, security = await asyncio.to_thread(
+        _launch_server,
+        version,
+        show_gui,
+        server_workdir,
+        port,
+        use_insecure_connection,
+        host,
+        username,
+        password,
+        output_lines=output_lines,
+        forward_output=forward_output,
+    )
+    if port is None or port <= 0:
+        raise Exception("Failed to launch Ansys Workbench service.")
+    return AsyncLaunchWorkbench(launcher, port, security, client_workdir, host, channel_options)
+
+
+async def connect_workbench_async(
+    port, client_workdir=None, host=None, security="mtls", channel_options=None
+):
+    """Create an asynchronous PyWorkbench client that connects to a running Workbench server.
+
+    Parameters
+    ----------
+    port : int
+        Port used by the server.
+    client_workdir : str, default: None
+        Path to a writable directory on the client computer. The default is ``None``,
+        in which case the system temp directory is used.
+    host : str, default: None
+        Server computer's name or IP address. The default is ``None`` for the local computer.
+    security : str among 'mtls', 'wnua', 'insecure', default: 'mtls'
+        Transport mode used for connection security. The default is `mtls`.
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
+
+    Returns
+    -------
+    AsyncWorkbenchClient
+        Instance of the asynchronous PyWorkbench client that is connected to the server.
+
+    Examples
+    --------
+    Connect to a server at port 32588 on localhost and run scripts on it concurrently
+    with other sessions.
+
+    >>> from ansys.workbench.core import connect_workbench_async
+    >>> wb = await connect_workbench_async(port=32588)
+    >>> await wb.run_script_string("Reset()")
+    """
+    return AsyncClientWrapper(port, client_workdir, host, security, channel_options)
+
+
+__all__ = [
+    "launch_workbench",
+    "connect_workbench",
+    "launch_workbench_async",
+    "connect_workbench_async",
+    "launch_many",
+    "enable_warm_spares",
+    "disable_warm_spares",
+]
@@ -0,0 +1,307 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for counting the gRPC calls of a Workbench client."""
+
+import bisect
+import threading
+import time
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+"""Upper bounds in milliseconds of the buckets of the latency histograms."""
+
+
+class RpcCall:
+    """Measurements of a single gRPC call.
+
+    The client updates the counters with ``chunk()`` and ``log()`` while the call runs.
+    The call is recorded when the ``with`` block around it exits, and an exception raised
+    in the block is recorded as the error status of the call. The hooks of the client
+    are called at the start and end of the call and for every chunk and log message.
+
+    Parameters
+    ----------
+    stats : RpcStats
+        Statistics to record the call in.
+    method : str
+        Name of the gRPC method, such as ``"RunScript"``.
+    hooks : HookRegistry, default: None
+        Callbacks for the events of the call.
+    """
+
+    __slots__ = (
+        "_stats",
+        "_hooks",
+        "method",
+        "start",
+        "end",
+        "bytes_sent",
+        "bytes_received",
+        "chunks",
+        "log_messages",
+        "error",
+    )
+
+    def __init__(self, stats, method, hooks=None):
+        self._stats = stats
+        self._hooks = hooks if hooks else None
+        self.method = method
+        self.start = time.perf_counter()
+        self.end = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.chunks = 0
+        self.log_messages = 0
+        self.error = None
+
+    def __enter__(self):
+        """Start the clock and return the call."""
+        self.start = time.perf_counter()
+        if self._hooks is not None:
+            self._hooks.emit("rpc_start", self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Record the call, with the status of the exception if one was raised."""
+        if exc_value is not None:
+            self.set_error(exc_value)
+        self.end = time.perf_counter()
+        self._stats._record(self)
+        if self._hooks is not None:
+            self._hooks.emit("rpc_end", self)
+
+    @property
+    def seconds(self):
+        """Duration of the call in seconds."""
+        return (self.end or time.perf_counter()) - self.start
+
+    def chunk(self, sent=0, received=0):
+        """Count a streamed message.
+
+        Parameters
+        ----------
+        sent : int, default: 0
+            Number of bytes sent with the message.
+        received : int, default: 0
+            Number of bytes received with the message.
+        """
+        self.chunks += 1
+        self.bytes_sent += sent
+        self.bytes_received += received
+        if self._hooks is not None:
+            self._hooks.emit("rpc_chunk", self, sent + received)
+
+    def log(self, level, message):
+        """Count a server log message.
+
+        Parameters
+        ----------
+        level : int
+            Server log level of the message.
+        message : str
+            Log message.
+        """
+        self.log_messages += 1
+        if self._hooks is not None:
+            self._hooks.emit("rpc_log", self, level, message)
+
+    def set_error(self, error):
+        """Mark the call as failed.
+
+        Parameters
+        ----------
+        error : Exception or str
+            Exception raised by the call, or error message returned by the server.
+            gRPC errors are recorded by their status code, other exceptions by their
+            type, and error messages as ``"SERVER_ERROR"``.
+        """
+        if self.error is not None:
+            return
+        if isinstance(error, str):
+            self.error = "SERVER_ERROR"
+        elif callable(getattr(error, "code", None)):
+            self.error = error.code().name
+        else:
+            self.error = type(error).__name__
+
+
+class _MethodStats:
+    """Aggregated measurements of the calls of one gRPC method."""
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "seconds",
+        "min_seconds",
+        "max_seconds",
+        "bytes_sent",
+        "bytes_received",
+        "chunks",
+        "log_messages",
+        "histogram",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = {}
+        self.seconds = 0.0
+        self.min_seconds = None
+        self.max_seconds = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.chunks = 0
+        self.log_messages = 0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, call):
+        seconds = call.seconds
+        self.calls += 1
+        if call.error is not None:
+            self.errors[call.error] = self.errors.get(call.error, 0) + 1
+        self.seconds += seconds
+        if self.min_seconds is None or seconds < self.min_seconds:
+            self.min_seconds = seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.bytes_sent += call.bytes_sent
+        self.bytes_received += call.bytes_received
+        self.chunks += call.chunks
+        self.log_messages += call.log_messages
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+
+    def merge(self, other):
+        self.calls += other.calls
+        for error, count in other.errors.items():
+            self.errors[error] = self.errors.get(error, 0) + count
+        self.seconds += other.seconds
+        if other.min_seconds is not None and (
+            self.min_seconds is None or other.min_seconds < self.min_seconds
+        ):
+            self.min_seconds = other.min_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+        self.chunks += other.chunks
+        self.log_messages += other.log_messages
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+
+    def percentile_ms(self, percent):
+        """Estimate a latency percentile as the upper bound of its histogram bucket."""
+        rank = percent / 100 * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.histogram):
+            seen += count
+            if count and seen >= rank:
+                return min(bound, self.max_seconds * 1000)
+        return self.max_seconds * 1000
+
+    def snapshot(self):
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS]
+        labels.append(f">{LATENCY_BUCKETS_MS[-1]}ms")
+        return {
+            "calls": self.calls,
+            "errors": dict(self.errors),
+            "seconds": self.seconds,
+            "min_ms": (self.min_seconds or 0.0) * 1000,
+            "mean_ms": self.seconds * 1000 / self.calls if self.calls else 0.0,
+            "max_ms": self.max_seconds * 1000,
+            "p50_ms": self.percentile_ms(50),
+            "p95_ms": self.percentile_ms(95),
+            "p99_ms": self.percentile_ms(99),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "chunks": self.chunks,
+            "log_messages": self.log_messages,
+            "histogram": dict(zip(labels, self.histogram)),
+        }
+
+
+class RpcStats:
+    """Counters and latency histograms of the gRPC calls of a client.
+
+    Recording a call takes a lock once, when the call ends, so the statistics are
+    always collected.
+
+    Parameters
+    ----------
+    hooks : HookRegistry, default: None
+        Callbacks for the events of the calls.
+    """
+
+    def __init__(self, hooks=None):
+        self._hooks = hooks
+        self._lock = threading.Lock()
+        self._methods = {}
+        self._since = time.time()
+
+    def call(self, method):
+        """Start measuring a call.
+
+        Parameters
+        ----------
+        method : str
+            Name of the gRPC method.
+
+        Returns
+        -------
+        RpcCall
+            Measurements of the call, to be used as a context manager around the call.
+        """
+        return RpcCall(self, method, self._hooks)
+
+    def _record(self, call):
+        with self._lock:
+            stats = self._methods.get(call.method)
+            if stats is None:
+                stats = self._methods[call.method] = _MethodStats()
+            stats.add(call)
+
+    def snapshot(self):
+        """Return the statistics collected since the creation or the last reset.
+
+        Returns
+        -------
+        dict
+            ``since``, the time when the collection started in seconds since the epoch,
+            ``methods``, the statistics of each gRPC method, and ``totals``, the statistics
+            of all calls. The statistics include the number of ``calls``, the number of
+            ``errors`` by status, the total ``seconds``, latency percentiles estimated from
+            the ``histogram``, ``bytes_sent`` and ``bytes_received``, the number of streamed
+            ``chunks``, and the number of server ``log_messages``.
+        """
+        with self._lock:
+            totals = _MethodStats()
+            methods = {}
+            for method, stats in self._methods.items():
+                methods[method] = stats.snapshot()
+                totals.merge(stats)
+            return {"since": self._since, "methods": methods, "totals": totals.snapshot()}
+
+    def reset(self):
+        """Clear the statistics."""
+        with self._lock:
+            self._methods = {}
+            self._since = time.time()
+
+
+__all__ = ["LATENCY_BUCKETS_MS", "RpcCall", "RpcStats"]
@@ -0,0 +1,143 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for script templates with ``$$name%%default%%`` placeholders."""
+
+import functools
+import re
+
+_PLACEHOLDER = re.compile(r"\$\$(\w+)%%((?:(?!%%).)*)%%")
+_ARG_NAME = re.compile(r"^\w+$")
+
+
+class ScriptTemplate:
+    """Script whose ``$$name%%default%%`` placeholders are parsed once.
+
+    The script is split into literal text and placeholders when the template is
+    created. Rendering only joins the segments, so running the same script many
+    times with different arguments does not scan the script text again.
+
+    Parameters
+    ----------
+    script_string : str
+        String containing the content of the script.
+
+    Examples
+    --------
+    >>> template = ScriptTemplate("Solve(Iterations=$$iterations%%50%%)")
+    >>> template.render({"iterations": 100})
+    'Solve(Iterations=100)'
+    >>> template.render()
+    'Solve(Iterations=50)'
+    """
+
+    def __init__(self, script_string):
+        self.script_string = script_string
+        parts = []
+        slots = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(script_string):
+            parts.append(script_string[position : match.start()])
+            slots.append((len(parts), match.group(1), match.group(2)))
+            parts.append(match.group(2))
+            position = match.end()
+        parts.append(script_string[position:])
+        self._parts = parts
+        self._slots = slots
+        self.names = frozenset(name for _, name, _ in slots)
+        """Names of all placeholders in the script."""
+
+    @classmethod
+    def literal(cls, script_string):
+        """Create a template that renders a script unchanged.
+
+        Use it for scripts that are already rendered, so that text that only looks
+        like a placeholder, such as a substituted argument value, is kept as is.
+
+        Parameters
+        ----------
+        script_string : str
+            String containing the content of the script.
+
+        Returns
+        -------
+        ScriptTemplate
+            Template without placeholders.
+        """
+        template = cls.__new__(cls)
+        template.script_string = script_string
+        template._parts = [script_string]
+        template._slots = []
+        template.names = frozenset()
+        return template
+
+    def render(self, args=None):
+        """Return the script with the placeholders replaced.
+
+        Parameters
+        ----------
+        args : dictionary of script variable names and values, default: None
+            Values for the placeholders. Placeholders without a value use their default.
+
+        Returns
+        -------
+        str
+            Script with all placeholders substituted.
+
+        Raises
+        ------
+        ValueError
+            If an argument name contains characters other than letters, digits, and
+            underscores.
+        """
+        if not args:
+            if not self._slots:
+                return self.script_string
+            args = {}
+        for arg_name in args:
+            if not _ARG_NAME.match(arg_name):
+                raise ValueError(f"script argument name contains illegal character: {arg_name}")
+        parts = list(self._parts)
+        for index, name, _ in self._slots:
+            if name in args:
+                parts[index] = str(args[name])
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def get_script_template(script_string):
+    """Return the parsed template of a script, reusing recently parsed templates.
+
+    Parameters
+    ----------
+    script_string : str
+        String containing the content of the script.
+
+    Returns
+    -------
+    ScriptTemplate
+        Parsed template. The 256 most recently used scripts are cached.
+    """
+    return ScriptTemplate(script_string)
+
+
+__all__ = ["ScriptTemplate", "get_script_template"]
@@ -0,0 +1,180 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for forwarding Workbench server log messages to Python logging."""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+import weakref
+
+_forwarders = weakref.WeakSet()
+
+
+class ServerLogForwarder:
+    """Forward server log messages to a logger from a background thread.
+
+    Messages received from the server are put into a bounded queue and written to
+    the logger and its handlers by a writer thread, so a slow log file or a flood
+    of debug messages never slows down reading the responses of the server. The
+    writer thread starts on the first message and stops when it has been idle for
+    a few seconds.
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        Logger to forward the messages to.
+    max_queue_size : int, default: 10000
+        Maximum number of messages waiting to be written.
+    overflow : str, default: "drop"
+        What to do with new messages when the queue is full. Options are ``"drop"``
+        to discard them, ``"sample"`` to also keep only every ``sample_rate``-th
+        message below the warning level once the queue is half full, and ``"block"``
+        to wait for free space.
+    sample_rate : int, default: 10
+        Keep one of this many low-level messages when sampling.
+    """
+
+    idle_timeout = 5.0
+
+    def __init__(self, logger, max_queue_size=10000, overflow="drop", sample_rate=10):
+        if overflow not in ("drop", "sample", "block"):
+            raise ValueError(f"Invalid overflow policy: {overflow}")
+        self._logger = logger
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.sample_rate = max(1, sample_rate)
+        self.forwarded = 0
+        self.dropped = 0
+        self._sample_counter = 0
+        # the counters are updated by the submitting threads and by the writer thread
+        self._counter_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._thread = None
+        _forwarders.add(self)
+
+    def submit(self, level, message):
+        """Queue a message for the logger without waiting for it to be written.
+
+        Parameters
+        ----------
+        level : int
+            Python log level of the message.
+        message : str
+            Message to log.
+        """
+        if not self._logger.isEnabledFor(level):
+            return
+        if (
+            self.overflow == "sample"
+            and level < logging.WARNING
+            and self._queue.qsize() >= self._max_queue_size // 2
+        ):
+            with self._counter_lock:
+                self._sample_counter += 1
+                skip = self._sample_counter % self.sample_rate != 0
+                if skip:
+                    self.dropped += 1
+            if skip:
+                return
+        try:
+            self._queue.put((level, message), block=self.overflow == "block")
+        except queue.Full:
+            with self._counter_lock:
+                self.dropped += 1
+            return
+        self.__ensure_writer()
+
+    def __ensure_writer(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self.__write_messages, name="wb-server-log", daemon=True
+                )
+                self._thread.start()
+
+    def __write_messages(self):
+        while True:
+            try:
+                level, message = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+            try:
+                self._logger.log(level, message)
+                with self._counter_lock:
+                    self.forwarded += 1
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout=None):
+        """Wait until all queued messages are written.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Maximum number of seconds to wait. The default is ``None``, in which
+            case the method waits until the queue is empty.
+
+        Returns
+        -------
+        bool
+            Whether all queued messages were written.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks > 0:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def counters(self):
+        """Return the message counters.
+
+        Returns
+        -------
+        dict
+            Number of ``forwarded`` and ``dropped`` messages and of messages still
+            ``queued``.
+        """
+        with self._counter_lock:
+            return {
+                "forwarded": self.forwarded,
+                "dropped": self.dropped,
+                "queued": self._queue.qsize(),
+            }
+
+
+@atexit.register
+def _flush_all():
+    """Write the remaining server log messages when the interpreter exits."""
+    for forwarder in list(_forwarders):
+        forwarder.flush(timeout=1.0)
+
+
+__all__ = ["ServerLogForwarder"]
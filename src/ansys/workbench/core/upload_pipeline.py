@@ -0,0 +1,198 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for reading files ahead of the upload stream."""
+
+import logging
+import queue
+import threading
+import time
+
+DEFAULT_CHUNK_SIZE = 1 << 16  # 64 KB
+MIN_CHUNK_SIZE = 1 << 16  # 64 KB
+MAX_CHUNK_SIZE = 3 << 20  # 3 MB, below the default 4 MB message limit of the server
+_READER_JOIN_TIMEOUT = 1.0  # seconds to wait for the reader thread when the stream closes
+
+
+class ChunkSizeTuner:
+    """Tune the chunk size of an upload to the measured throughput.
+
+    The throughput is measured over windows of a few chunks. The chunk size keeps
+    changing in the same direction, doubling or halving, while the throughput improves,
+    turns around when it drops, and stays put while it is flat.
+
+    Parameters
+    ----------
+    chunk_size : int, default: DEFAULT_CHUNK_SIZE
+        Chunk size to start with.
+    min_chunk_size : int, default: MIN_CHUNK_SIZE
+        Smallest chunk size to use.
+    max_chunk_size : int, default: MAX_CHUNK_SIZE
+        Largest chunk size to use.
+    window_chunks : int, default: 8
+        Number of chunks in each measurement window.
+    """
+
+    tolerance = 0.05
+
+    def __init__(
+        self,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        min_chunk_size=MIN_CHUNK_SIZE,
+        max_chunk_size=MAX_CHUNK_SIZE,
+        window_chunks=8,
+    ):
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max(min_chunk_size, max_chunk_size)
+        self.chunk_size = min(max(chunk_size, self.min_chunk_size), self.max_chunk_size)
+        self.window_chunks = window_chunks
+        self.throughput = 0.0
+        """Throughput of the last window in bytes per second."""
+        self._factor = 2
+        self._window_start = None
+        self._window_bytes = 0
+        self._window_count = 0
+
+    def record(self, size):
+        """Record a chunk handed to the upload stream.
+
+        Parameters
+        ----------
+        size : int
+            Size of the chunk in bytes.
+
+        Returns
+        -------
+        int
+            Chunk size to read next.
+        """
+        now = time.perf_counter()
+        if self._window_start is None:
+            # the first chunk only starts the clock
+            self._window_start = now
+            return self.chunk_size
+        self._window_bytes += size
+        self._window_count += 1
+        elapsed = now - self._window_start
+        if self._window_count >= self.window_chunks and elapsed > 0:
+            self.__adjust(self._window_bytes / elapsed)
+            self._window_start = now
+            self._window_bytes = 0
+            self._window_count = 0
+        return self.chunk_size
+
+    def __adjust(self, throughput):
+        previous = self.throughput
+        self.throughput = throughput
+        if previous and throughput < previous * (1 - self.tolerance):
+            self._factor = 0.5 if self._factor > 1 else 2
+        elif previous and throughput <= previous * (1 + self.tolerance):
+            return
+        chunk_size = int(self.chunk_size * self._factor)
+        if not self.min_chunk_size <= chunk_size <= self.max_chunk_size:
+            self._factor = 0.5 if self._factor > 1 else 2
+            chunk_size = min(max(chunk_size, self.min_chunk_size), self.max_chunk_size)
+        self.chunk_size = chunk_size
+
+
+def read_chunks(fileobj, chunk_size=DEFAULT_CHUNK_SIZE, read_ahead=0, tuner=None):
+    """Yield the content of a binary file object in chunks.
+
+    With ``read_ahead``, the file is read on a background thread into a bounded queue,
+    so reading the next chunks overlaps with sending the current one and at most
+    ``read_ahead`` chunks are held in memory. When the stream is closed early, the
+    reader thread is given a short time to stop. A daemon thread that is still blocked
+    in ``read()``, for example on a pipe or a socket, is left behind instead of blocking
+    the caller.
+
+    Parameters
+    ----------
+    fileobj : file object
+        Binary file object to read from its current position.
+    chunk_size : int, default: DEFAULT_CHUNK_SIZE
+        Size of the chunks in bytes, unless a tuner is given.
+    read_ahead : int, default: 0
+        Number of chunks to read ahead. The default is ``0``, in which case each chunk is
+        read when it is requested.
+    tuner : ChunkSizeTuner, default: None
+        Tuner that chooses the size of each chunk from the measured throughput.
+
+    Yields
+    ------
+    bytes
+        Next chunk of the file.
+    """
+
+    def next_size():
+        return tuner.chunk_size if tuner is not None else chunk_size
+
+    if read_ahead <= 0:
+        while True:
+            chunk = fileobj.read(next_size())
+            if not chunk:
+                return
+            if tuner is not None:
+                tuner.record(len(chunk))
+            yield chunk
+
+    chunks = queue.Queue(maxsize=read_ahead)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def read():
+        try:
+            while not stop.is_set():
+                chunk = fileobj.read(next_size())
+                put(chunk)
+                if not chunk:
+                    return
+        except BaseException as ex:
+            put(ex)
+
+    thread = threading.Thread(target=read, name="wb-read-ahead", daemon=True)
+    thread.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if isinstance(chunk, BaseException):
+                raise chunk
+            if not chunk:
+                return
+            if tuner is not None:
+                tuner.record(len(chunk))
+            yield chunk
+    finally:
+        stop.set()
+        thread.join(_READER_JOIN_TIMEOUT)
+        if thread.is_alive():
+            logging.warning("The read-ahead thread is still blocked reading the upload source.")
+
+
+__all__ = ["ChunkSizeTuner", "read_chunks"]
@@ -0,0 +1,250 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for keeping Workbench servers launched ahead of time."""
+
+import atexit
+from dataclasses import dataclass
+import logging
+import threading
+import time
+
+import grpc
+
+from ansys.api.workbench.v0 import workbench_pb2 as wb
+from ansys.api.workbench.v0.workbench_pb2_grpc import WorkbenchServiceStub
+from ansys.tools.common.cyberchannel import create_channel
+from ansys.workbench.core.workbench_launcher import Launcher
+
+_LAUNCH_DEFAULTS = {
+    "version": None,
+    "show_gui": True,
+    "server_workdir": None,
+    "use_insecure_connection": False,
+    "host": None,
+    "username": None,
+    "password": None,
+}
+
+# seconds to wait for a spare to accept a connection before it is discarded
+_HEALTH_CHECK_TIMEOUT = 5.0
+
+
+def _open_channel(host, port, security):
+    """Open a bare channel to a spare server.
+
+    A ``WorkbenchClient`` is not used here because each one adds a handler to the
+    shared "WB" logger, which would repeat every server log line once per spare.
+    """
+    return create_channel(
+        host=host or "localhost", port=port, transport_mode=security, certs_dir=None
+    )
+
+
+@dataclass
+class _Spare:
+    """Launched server waiting to be handed out."""
+
+    launcher: Launcher
+    port: int
+    security: str
+    ready_time: float
+
+
+class WarmSparePool:
+    """Servers launched in the background before they are needed.
+
+    Starting Workbench takes much longer than anything else in a typical job. A warm
+    spare pool keeps a number of servers launched and reset, hands them out at once,
+    and launches replacements in the background. Spares that are not used within
+    the idle timeout are stopped to free their licenses, and the pool is filled
+    again on the next request.
+
+    Parameters
+    ----------
+    count : int, default: 1
+        Number of spare servers to keep ready.
+    idle_timeout : float, default: 600.0
+        Number of seconds after which an unused spare is stopped.
+    **launch_options
+        Options for launching the spares, as for ``launch_workbench()``: ``version``,
+        ``show_gui``, ``server_workdir``, ``use_insecure_connection``, ``host``,
+        ``username``, and ``password``.
+    """
+
+    def __init__(self, count=1, idle_timeout=600.0, **launch_options):
+        unknown = set(launch_options) - set(_LAUNCH_DEFAULTS)
+        if unknown:
+            raise ValueError(f"Invalid launch options for warm spares: {sorted(unknown)}")
+        self.count = count
+        self.idle_timeout = idle_timeout
+        self._launch_options = {**_LAUNCH_DEFAULTS, **launch_options}
+        self._lock = threading.Lock()
+        self._spares = []
+        self._launching = 0
+        self._closed = threading.Event()
+        self.__top_up()
+        threading.Thread(target=self.__retire_idle, name="wb-spare-reaper", daemon=True).start()
+        atexit.register(self.close)
+
+    @property
+    def ready(self):
+        """Number of spares ready to be handed out."""
+        with self._lock:
+            return len(self._spares)
+
+    def matches(self, **launch_options):
+        """Return whether the spares were launched with the given options.
+
+        Parameters
+        ----------
+        **launch_options
+            Options of a ``launch_workbench()`` call.
+
+        Returns
+        -------
+        bool
+            Whether a spare can be used for these options.
+        """
+        options = {
+            key: launch_options.get(key, default) for key, default in _LAUNCH_DEFAULTS.items()
+        }
+        return options == self._launch_options
+
+    def take(self):
+        """Hand out a ready spare and launch a replacement in the background.
+
+        Spares whose server has stopped or no longer accepts connections are stopped
+        and skipped.
+
+        Returns
+        -------
+        tuple
+            Launcher, port, and security mode of the server, or ``None`` if no healthy
+            spare is ready.
+        """
+        while True:
+            with self._lock:
+                spare = self._spares.pop(0) if self._spares else None
+            self.__top_up()
+            if spare is None:
+                return None
+            if self.__is_healthy(spare):
+                break
+            logging.warning(
+                f"Discarding the warm spare Workbench server on port {spare.port} "
+                "because it is no longer running."
+            )
+            spare.launcher.exit()
+        logging.info(f"Using the warm spare Workbench server on port {spare.port}.")
+        return spare.launcher, spare.port, spare.security
+
+    def close(self):
+        """Stop all spares and launch no more."""
+        self._closed.set()
+        atexit.unregister(self.close)
+        with self._lock:
+            spares, self._spares = self._spares, []
+        for spare in spares:
+            spare.launcher.exit()
+
+    def __top_up(self):
+        with self._lock:
+            if self._closed.is_set():
+                return
+            missing = self.count - len(self._spares) - self._launching
+            self._launching += max(0, missing)
+        for _ in range(missing):
+            threading.Thread(target=self.__launch, name="wb-spare-launch", daemon=True).start()
+
+    def __launch(self):
+        """Launch a server and reset it so that it is ready to be handed out."""
+        launcher = None
+        try:
+            options = self._launch_options
+            launcher = Launcher()
+            port, security = launcher.launch(
+                options["version"],
+                options["show_gui"],
+                options["server_workdir"],
+                -1,
+                options["use_insecure_connection"],
+                options["host"],
+                options["username"],
+                options["password"],
+            )
+            if port is None or port <= 0:
+                raise Exception("Failed to launch Ansys Workbench service.")
+            channel = _open_channel(options["host"], port, security)
+            try:
+                request = wb.RunScriptRequest(content="Reset()", log_level=wb.LOG_NONE)
+                for response in WorkbenchServiceStub(channel).RunScript(request):
+                    if response.result and response.result.error:
+                        raise Exception(response.result.error)
+            finally:
+                channel.close()
+        except Exception as ex:
+            logging.error(f"Failed to launch a warm spare Workbench server: {ex}")
+            if launcher is not None:
+                launcher.exit()
+            with self._lock:
+                self._launching -= 1
+            return
+        with self._lock:
+            self._launching -= 1
+            if not self._closed.is_set():
+                self._spares.append(_Spare(launcher, port, security, time.monotonic()))
+                return
+        launcher.exit()
+
+    def __is_healthy(self, spare):
+        """Return whether the server of a spare is running and accepts connections."""
+        if not spare.launcher.is_running():
+            return False
+        try:
+            channel = _open_channel(self._launch_options["host"], spare.port, spare.security)
+        except Exception as ex:
+            logging.info(f"Failed to connect to the warm spare on port {spare.port}: {ex}")
+            return False
+        try:
+            grpc.channel_ready_future(channel).result(timeout=_HEALTH_CHECK_TIMEOUT)
+        except grpc.FutureTimeoutError:
+            logging.info(f"Warm spare Workbench server on port {spare.port} is not ready.")
+            return False
+        finally:
+            channel.close()
+        return True
+
+    def __retire_idle(self):
+        """Stop spares that have not been used within the idle timeout."""
+        while not self._closed.wait(min(self.idle_timeout / 2, 60.0)):
+            now = time.monotonic()
+            with self._lock:
+                retired = [s for s in self._spares if now - s.ready_time > self.idle_timeout]
+                self._spares = [s for s in self._spares if s not in retired]
+            for spare in retired:
+                logging.info(f"Stopping the idle warm spare Workbench server on port {spare.port}.")
+                spare.launcher.exit()
+
+
+__all__ = ["WarmSparePool"]
@@ -22,6 +22,9 @@
 
 """Workbench client module for PyWorkbench."""
 
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+from dataclasses import dataclass, field
 import glob
 import json
 import logging
@@ -30,17 +33,384 @@ from logging.handlers import WatchedFileHandler
 import os
 import re
 import time
+import uuid
 
-import tqdm
+import grpc
 
 from ansys.api.workbench.v0 import workbench_pb2 as wb
 from ansys.api.workbench.v0.workbench_pb2_grpc import WorkbenchServiceStub
 from ansys.tools.common.cyberchannel import create_channel
-from ansys.tools.common.example_download import download_manager
+from ansys.workbench.core.array_result import array_script, import_numpy, load_array
+from ansys.workbench.core.channel_options import ChannelOptions
+from ansys.workbench.core.hash_index import (
+    SERVER_SHA256_FUNCTION,
+    FileHashIndex,
+    default_index_path,
+    file_sha256,
+)
+from ansys.workbench.core.hooks import HookRegistry, global_hooks
+from ansys.workbench.core.progress import track_progress
+from ansys.workbench.core.rpc_stats import RpcStats
+from ansys.workbench.core.script_template import ScriptTemplate, get_script_template
+from ansys.workbench.core.server_log import ServerLogForwarder
+from ansys.workbench.core.upload_pipeline import (
+    DEFAULT_CHUNK_SIZE,
+    MAX_CHUNK_SIZE,
+    ChunkSizeTuner,
+    read_chunks,
+)
+from ansys.workbench.core.zip_stream import ZipStreamExtractor
+
+
+@dataclass
+class UploadResult:
+    """Outcome of uploading one file to the server.
+
+    Attributes
+    ----------
+    name : str
+        Name of the file on the server.
+    bytes : int
+        Number of bytes sent.
+    seconds : float
+        Wall time spent on the upload.
+    error : str or None
+        Error message if the upload failed, otherwise ``None``.
+    skipped : bool
+        Whether the upload was skipped because the server already has the same file.
+    """
 
+    name: str
+    bytes: int
+    seconds: float
+    error: str | None = None
+    skipped: bool = False
 
-class WorkbenchClient:
-    """Functions of a PyWorkbench client.
+
+@dataclass
+class SyncResult:
+    """Outcome of synchronizing a local directory to the server with ``sync_directory()``.
+
+    Attributes
+    ----------
+    uploaded : list[str]
+        Relative paths of the files that were added or changed and uploaded.
+    unchanged : list[str]
+        Relative paths of the files that the server already had.
+    deleted : list[str]
+        Relative paths of the stale server files that were deleted.
+    failed : list[str]
+        Relative paths of the files that failed to upload.
+    bytes_uploaded : int
+        Number of bytes sent.
+    bytes_saved : int
+        Number of bytes of the unchanged files, which were not sent.
+    seconds : float
+        Wall time spent on the synchronization.
+    """
+
+    uploaded: list = field(default_factory=list)
+    unchanged: list = field(default_factory=list)
+    deleted: list = field(default_factory=list)
+    failed: list = field(default_factory=list)
+    bytes_uploaded: int = 0
+    bytes_saved: int = 0
+    seconds: float = 0.0
+
+
+def _optional_bool(value):
+    """Convert a capability reported by the server, keeping ``None`` for unknown."""
+    return None if value is None else bool(value)
+
+
+_PROJECT_PATH_SCRIPT = """import json
+wb_script_result = json.dumps(GetProjectFile())
+"""
+
+
+@dataclass
+class ServerInfo:
+    """Capabilities of a Workbench server, collected once per server.
+
+    Only information that does not change while the server runs is kept. The path of
+    the project file changes with ``Open()`` and ``Save()``, so it is read on each
+    access of ``WorkbenchClient.project_path`` instead.
+
+    Attributes
+    ----------
+    version : int
+        Three-digit Workbench version, such as ``252``.
+    working_directory : str
+        Working directory of the server.
+    mechanical_server : bool or None
+        Whether the server can start PyMechanical servers for its systems, or ``None``
+        if the server could not tell.
+    fluent_server : bool or None
+        Whether the server can start PyFluent servers for its systems, or ``None`` if
+        the server could not tell.
+    sherlock_server : bool or None
+        Whether the server can start PySherlock servers for its systems, or ``None`` if
+        the server could not tell.
+    """
+
+    version: int
+    working_directory: str = ""
+    mechanical_server: bool | None = None
+    fluent_server: bool | None = None
+    sherlock_server: bool | None = None
+
+    script = """import json
+def _wb_has(name):
+    try:
+        eval(name)
+        return True
+    except NameError:
+        return False
+    except Exception:
+        return None
+wb_script_result = json.dumps({
+    "version": GetFrameworkVersion(),
+    "working_directory": GetServerWorkingDirectory(),
+    "mechanical_server": _wb_has("LaunchMechanicalServerOnSystem"),
+    "fluent_server": _wb_has("LaunchFluentServerOnSystem"),
+    "sherlock_server": _wb_has("LaunchSherlockServerOnSystem"),
+})
+"""
+    """Server script that collects the information in one call."""
+
+    @classmethod
+    def from_script_result(cls, result):
+        """Create the server information from the output of ``ServerInfo.script``."""
+        return cls(
+            version=int(str(result["version"]).replace(".", "")),
+            working_directory=result.get("working_directory") or "",
+            mechanical_server=_optional_bool(result.get("mechanical_server")),
+            fluent_server=_optional_bool(result.get("fluent_server")),
+            sherlock_server=_optional_bool(result.get("sherlock_server")),
+        )
+
+
+@dataclass
+class ScriptResult:
+    """Outcome of one script in a batch run by ``run_scripts_batch()``.
+
+    Attributes
+    ----------
+    result : object
+        Output defined in the script, or ``None`` if the script failed or did not
+        set ``wb_script_result``.
+    error : str or None
+        Error message if the script failed or was not run, otherwise ``None``.
+    """
+
+    result: object = None
+    error: str | None = None
+
+
+def _source_size(source):
+    """Return the number of bytes left in a bytes-like object or a file object, or 0."""
+    if not hasattr(source, "read"):
+        return memoryview(source).nbytes
+    try:
+        position = source.tell()
+        size = source.seek(0, os.SEEK_END)
+        source.seek(position)
+        return size - position
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def _iter_chunks(source, chunk_size, read_ahead=0, tuner=None):
+    """Yield the content of a bytes-like object or a binary file object in chunks."""
+    if hasattr(source, "read"):
+        yield from read_chunks(source, chunk_size, read_ahead, tuner)
+        return
+    view = memoryview(source).cast("B")
+    for start in range(0, len(view), chunk_size):
+        # protobuf takes only bytes, so each chunk is copied once from the buffer
+        yield bytes(view[start : start + chunk_size])
+
+
+def _buffer_writer(sink):
+    """Return a function that writes chunks to a file object, bytearray, or writable buffer."""
+    if isinstance(sink, bytearray):
+        return sink.extend
+    if hasattr(sink, "write"):
+        return sink.write
+    view = memoryview(sink).cast("B")
+    if view.readonly:
+        raise TypeError("The download target must be a writable buffer.")
+    position = 0
+
+    def write(data):
+        nonlocal position
+        end = position + len(data)
+        if end > len(view):
+            raise ValueError(f"The download does not fit in the buffer of {len(view)} bytes.")
+        view[position:end] = data
+        position = end
+
+    return write
+
+
+class _DownloadFileWriter:
+    """Write a downloaded file through a single buffered file handle.
+
+    The data goes to a temporary ``<file_path>.part`` file, which is preallocated
+    when the final size is known and renamed to ``file_path`` once complete, so
+    an interrupted download never leaves a truncated file under the final name.
+
+    A resumable writer keeps the partial file when the download fails and records
+    its progress in a ``<file_path>.part.json`` manifest next to it, so that a later
+    download of the same source can continue at the recorded byte offset.
+
+    Parameters
+    ----------
+    file_path : str
+        Final path of the downloaded file.
+    expected_size : int, default: 0
+        Final size of the file, or ``0`` if unknown.
+    offset : int, default: 0
+        Number of bytes already present in the partial file.
+    source : str, default: None
+        Name of the file on the server. Required for a resumable writer.
+    """
+
+    buffer_size = 1 << 20  # 1 MB
+    manifest_interval = 64 << 20  # 64 MB
+
+    def __init__(self, file_path, expected_size=0, offset=0, source=None):
+        self.file_path = file_path
+        self.temp_path = file_path + ".part"
+        self.manifest_path = file_path + ".part.json"
+        self.expected_size = expected_size
+        self.source = source
+        self.written = offset
+        self._manifest_written = offset
+        self._file = open(
+            self.temp_path, mode="r+b" if offset > 0 else "wb", buffering=self.buffer_size
+        )
+        self._file.seek(offset)
+        self._preallocated = False
+        if expected_size > offset:
+            try:
+                if hasattr(os, "posix_fallocate"):
+                    os.posix_fallocate(self._file.fileno(), 0, expected_size)
+                else:
+                    self._file.truncate(expected_size)
+                self._preallocated = True
+            except OSError:
+                # preallocation is only an optimization, e.g. not supported by the file system
+                pass
+        if self.source is not None:
+            self.__write_manifest()
+        self._start = time.perf_counter()
+        self._elapsed = 0.0
+
+    @staticmethod
+    def resume_offset(file_path, source):
+        """Return the byte offset to resume a previous download at.
+
+        Parameters
+        ----------
+        file_path : str
+            Final path of the downloaded file.
+        source : str
+            Name of the file on the server.
+
+        Returns
+        -------
+        tuple[int, int]
+            Number of bytes already downloaded and the expected final size, or
+            ``(0, 0)`` if there is no usable partial download.
+        """
+        try:
+            with open(file_path + ".part.json", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest["source"] != source:
+                return 0, 0
+            written = int(manifest["written"])
+            if os.path.getsize(file_path + ".part") < written:
+                return 0, 0
+            return written, int(manifest["size"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0, 0
+
+    def __write_manifest(self):
+        manifest = {"source": self.source, "size": self.expected_size, "written": self.written}
+        with open(self.manifest_path, mode="w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        self._manifest_written = self.written
+
+    def write(self, data):
+        """Append a chunk of data to the file."""
+        self._file.write(data)
+        self.written += len(data)
+        if self.source is not None and self.written - self._manifest_written >= (
+            self.manifest_interval
+        ):
+            self._file.flush()
+            self.__write_manifest()
+
+    @property
+    def throughput(self):
+        """Sustained write throughput in MB/s."""
+        elapsed = self._elapsed or (time.perf_counter() - self._start)
+        if elapsed <= 0:
+            return 0.0
+        return self.written / 1048576 / elapsed
+
+    def close(self):
+        """Flush and close the temporary file without moving it."""
+        if self._file.closed:
+            return
+        if self._preallocated:
+            self._file.truncate(self.written)
+        self._file.close()
+        self._elapsed = time.perf_counter() - self._start
+
+    def sha256(self):
+        """Return the SHA-256 hex digest of the data written so far."""
+        self.close()
+        return file_sha256(self.temp_path)
+
+    def commit(self):
+        """Close the file and move it to its final name."""
+        self.close()
+        try_more = 3
+        while True:
+            try:
+                os.replace(self.temp_path, self.file_path)
+                break
+            except PermissionError:
+                # intermittent "Permission Denied" error can happen, e.g. from virus scanners
+                if try_more <= 0:
+                    raise
+                try_more -= 1
+                time.sleep(0.1)
+        if os.path.exists(self.manifest_path):
+            os.remove(self.manifest_path)
+
+    def abort(self, keep=False):
+        """Close the incomplete file.
+
+        Parameters
+        ----------
+        keep : bool, default: False
+            Whether to keep the partial file and its manifest for a later resume.
+            Non-resumable writers always remove the partial file.
+        """
+        self.close()
+        if keep and self.source is not None:
+            self.__write_manifest()
+            return
+        for path in (self.temp_path, self.manifest_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class _WorkbenchClientBase:
+    """Configuration and helpers shared by the synchronous and asynchronous clients.
 
     Parameters
     ----------
@@ -53,64 +423,58 @@ class WorkbenchClient:
     server_security : string
         Security mode of the server.
         Options are: "insecure", "uds", "wnua", "mtls"
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
     """
 
-    def __init__(self, local_workdir, server_host, server_port, server_security):
+    def __init__(
+        self, local_workdir, server_host, server_port, server_security, channel_options=None
+    ):
         """Create a Workbench client."""
         self.workdir = local_workdir
         self._server_host = server_host
         self._server_port = server_port
         self._server_security = server_security
-        self._server_version = -1
+        self._channel_options = ChannelOptions.resolve(channel_options)
+        self._server_info = None
+        self._server_info_address = None
+        self.channel = None
+        self.stub = None
+        self._hooks = HookRegistry(parent=global_hooks)
+        self._rpc_stats = RpcStats(self._hooks)
         self.__init_logging()
 
-    @property
-    def server_version(self):
-        """The Workbench version of the connected server."""
-        if self._server_version <= 0:
-            ver_str = self.run_script_string("""import json
-wb_script_result=json.dumps(GetFrameworkVersion())""")
-            ver_str = ver_str.replace(".", "")
-            self._server_version = int(ver_str)
-        return self._server_version
-
-    def __enter__(self):
-        """Connect to the server when entering a context."""
-        self._connect()
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        """Disconnect from the server when exiting a context."""
-        self._disconnect()
-
-    def _connect(self):
-        """Connect to the server."""
-        self.channel = create_channel(
-            host=self._server_host,
-            port=self._server_port,
-            transport_mode=self._server_security,
-            certs_dir=None,
-            grpc_options=None,
-        )
-        self.stub = WorkbenchServiceStub(self.channel)
-        logging.info(
-            f"connected to the WB server at {self._server_host}:{self._server_port} "
-            "using {self._server_security} connection"
-        )
-
-    def _disconnect(self):
-        """Disconnect from the server."""
-        if self.channel:
-            self.channel.close()
-            self.channel = None
-            self.stub = None
-            self._server_version = -1
-            logging.info("Disconnected from the Workbench server")
-
     def _is_connected(self):
         """Return whether this client is connected to the server."""
         return self.channel is not None
 
+    def _upload_chunk_tuner(self):
+        """Return a chunk size tuner for an upload, or ``None`` if the size is fixed."""
+        if not self._channel_options.adaptive_chunk_size:
+            return None
+        chunk_size = self._channel_options.upload_chunk_size or DEFAULT_CHUNK_SIZE
+        return ChunkSizeTuner(chunk_size, max_chunk_size=max(chunk_size, MAX_CHUNK_SIZE))
+
+    def _transfer_call_options(self):
+        """Return the keyword arguments of the file transfer calls."""
+        compression = self._channel_options.compression
+        return {} if compression is None else {"compression": compression}
+
+    def _forget_other_server(self):
+        """Drop the cached server information if it belongs to a different server."""
+        if self._server_info_address != (self._server_host, self._server_port):
+            self._server_info = None
+            self._server_info_address = None
+
+    def _set_server_info(self, result):
+        """Cache the server information from the output of ``ServerInfo.script``."""
+        if result is None:
+            raise Exception("Failed to query the Workbench server information.")
+        self._server_info = ServerInfo.from_script_result(result)
+        self._server_info_address = (self._server_host, self._server_port)
+        return self._server_info
+
     def __init_logging(self):
         """Initialize logging for the client."""
         self._logger = logging.getLogger("WB")
@@ -121,6 +485,7 @@ wb_script_result=json.dumps(GetFrameworkVersion())""")
         stream_handler.setLevel(logging.WARNING)
         self._logger.addHandler(stream_handler)
         self.__log_console_handler = stream_handler
+        self._log_forwarder = ServerLogForwarder(self._logger)
 
     def set_console_log_level(self, log_level):
         """Set the log filter level for the client console.
@@ -130,7 +495,7 @@ wb_script_result=json.dumps(GetFrameworkVersion())""")
         log_level : str, default: "error"
             Level of logging. Options are "critical", "debug", "error", "info", and "warning".
         """
-        self.__log_console_handler.setLevel(WorkbenchClient.__to_python_log_level(log_level))
+        self.__log_console_handler.setLevel(_WorkbenchClientBase._to_python_log_level(log_level))
 
     def set_log_file(self, log_file):
         """Set a local log file for the Workbench server log.
@@ -154,20 +519,497 @@ wb_script_result=json.dumps(GetFrameworkVersion())""")
         """No longer use the current log file for the Workbench server log."""
         if self.__log_file_handler is None:
             return
+        self._log_forwarder.flush()
         self.__log_file_handler.close()
         self._logger.removeHandler(self.__log_file_handler)
         self.__log_file_handler = None
 
+    def set_server_log_policy(self, overflow="drop", max_queue_size=10000, sample_rate=10):
+        """Set how server log messages are queued when they arrive faster than they are written.
+
+        Server log messages are written to the console and the log file by a background
+        thread, so reading the server responses never waits for logging.
+
+        Parameters
+        ----------
+        overflow : str, default: "drop"
+            What to do with new messages when the queue is full. Options are ``"drop"``,
+            ``"sample"``, and ``"block"``. ``"sample"`` also keeps only every
+            ``sample_rate``-th message below the warning level once the queue is half full.
+            ``"block"`` never loses messages but slows down the script call.
+        max_queue_size : int, default: 10000
+            Maximum number of messages waiting to be written.
+        sample_rate : int, default: 10
+            Keep one of this many low-level messages when sampling.
+        """
+        self._log_forwarder.flush()
+        self._log_forwarder = ServerLogForwarder(
+            self._logger, max_queue_size=max_queue_size, overflow=overflow, sample_rate=sample_rate
+        )
+
+    def flush_server_log(self, timeout=None):
+        """Wait until all received server log messages are written.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Maximum number of seconds to wait. The default is ``None``, in which case
+            the method waits until all messages are written.
+
+        Returns
+        -------
+        bool
+            Whether all messages were written.
+        """
+        return self._log_forwarder.flush(timeout)
+
+    def server_log_stats(self):
+        """Return the counters of the server log forwarding.
+
+        Returns
+        -------
+        dict
+            Number of ``forwarded`` and ``dropped`` messages and of messages still
+            ``queued``.
+        """
+        return self._log_forwarder.counters()
+
+    def stats(self):
+        """Return the statistics of the gRPC calls of this client.
+
+        Every call records its duration, the bytes sent and received, the number of
+        streamed chunks and server log messages, and its error status. The statistics
+        cover all calls since the client was created or ``reset_stats()`` was called.
+
+        Returns
+        -------
+        dict
+            ``since``, the time when the collection started in seconds since the epoch,
+            ``methods``, the statistics of each gRPC method ("RunScript", "UploadFile",
+            and "DownloadFile"), and ``totals``, the statistics of all calls. The
+            statistics include the number of ``calls``, the number of ``errors`` by
+            status, the total ``seconds``, the ``min_ms``, ``mean_ms``, and ``max_ms``
+            latency, the ``p50_ms``, ``p95_ms``, and ``p99_ms`` latency estimated from
+            the latency ``histogram``, ``bytes_sent``, ``bytes_received``, ``chunks``,
+            and ``log_messages``.
+
+        Examples
+        --------
+        Compare the time spent running scripts with the time spent moving files.
+
+        >>> stats = wb.stats()["methods"]
+        >>> script_seconds = stats["RunScript"]["seconds"]
+        >>> upload_mb = stats["UploadFile"]["bytes_sent"] / 1048576
+
+        """
+        return self._rpc_stats.snapshot()
+
+    def reset_stats(self):
+        """Clear the statistics of the gRPC calls of this client."""
+        self._rpc_stats.reset()
+
+    def add_hook(self, event, callback):
+        """Register a callback for the gRPC calls of this client.
+
+        Callbacks run in the thread of the call, so they should return quickly. Use
+        ``ansys.workbench.core.hooks.add_hook()`` for callbacks on all clients and on
+        server launches.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event. Options are "rpc_start", "rpc_chunk", "rpc_log", and
+            "rpc_end". See ``ansys.workbench.core.hooks.EVENTS`` for the arguments of
+            the callbacks.
+        callback : callable
+            Function called with the arguments of the event.
+
+        Returns
+        -------
+        callable
+            The callback.
+
+        Examples
+        --------
+        Log every call that takes longer than a second.
+
+        >>> def report_slow_call(call):
+        ...     if call.seconds > 1:
+        ...         print(f"{call.method} took {call.seconds:.1f} s")
+        >>> wb.add_hook("rpc_end", report_slow_call)
+
+        """
+        return self._hooks.add(event, callback)
+
+    def remove_hook(self, event, callback):
+        """Unregister a callback registered with ``add_hook()``.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event.
+        callback : callable
+            Function registered with ``add_hook()``.
+        """
+        self._hooks.remove(event, callback)
+
     __log_file_handler = None
     __log_console_handler = None
 
+    @staticmethod
+    def _prepare_script(script_string, args):
+        """Substitute the script arguments into the script.
+
+        Parameters
+        ----------
+        script_string : str or ScriptTemplate
+            String containing the content of the script, or its parsed template.
+        args : dictionary of script variable names and values
+            Variables in the script specified as $$varname%%50%% will be converted to variable
+            values or use the default value - 50 in the example.
+
+        Returns
+        -------
+        str
+            Script with all arguments substituted, or ``None`` if an argument name is invalid.
+        """
+        if isinstance(script_string, ScriptTemplate):
+            template = script_string
+        else:
+            template = get_script_template(script_string)
+        try:
+            return template.render(args)
+        except ValueError:
+            logging.error("script argument name contains illegal character.")
+            return None
+
+    def _resolve_upload_files(self, file_list):
+        """Expand the given file patterns into the list of existing local files.
+
+        Parameters
+        ----------
+        file_list : list[str]
+            List of paths to local files. The wildcard characters "?" and "*" are supported.
+
+        Returns
+        -------
+        list[str]
+            Absolute paths of the existing files. Missing files are logged and skipped.
+        """
+        requested = []
+        for file_pattern in file_list:
+            if "*" in file_pattern or "?" in file_pattern:
+                if not os.path.isabs(file_pattern):
+                    file_pattern = os.path.join(self.workdir, file_pattern)
+                requested.extend(glob.glob(file_pattern))
+            else:
+                requested.append(file_pattern)
+        existing_files = []
+        nonexisting_files = []
+        for file_name in requested:
+            if not os.path.isabs(file_name):
+                file_name = os.path.join(self.workdir, file_name)
+            if os.path.isfile(file_name):
+                existing_files.append(file_name)
+            else:
+                nonexisting_files.append(file_name)
+        if len(nonexisting_files) > 0:
+            logging.warning(
+                "The following files do not exist and are skipped: " + "\n".join(nonexisting_files)
+            )
+        return existing_files
+
+    @staticmethod
+    def _batch_script(scripts, stop_on_error):
+        """Pack several scripts into one server-side dispatcher script.
+
+        Parameters
+        ----------
+        scripts : list
+            Scripts to run. Each entry is a script string, a ``ScriptTemplate``, or a
+            ``(script, args)`` tuple.
+        stop_on_error : bool
+            Whether to skip the remaining scripts after the first failure.
+
+        Returns
+        -------
+        ScriptTemplate
+            Dispatcher script, or ``None`` if an argument name is invalid. The scripts
+            are already rendered, so the dispatcher is not templated again.
+        """
+        contents = []
+        for entry in scripts:
+            script, args = entry if isinstance(entry, tuple) else (entry, None)
+            content = _WorkbenchClientBase._prepare_script(script, args)
+            if content is None:
+                return None
+            contents.append(content)
+        return ScriptTemplate.literal(f"""import json
+import traceback
+_wb_batch_results = []
+_wb_batch_failed = False
+for _wb_batch_script in json.loads({json.dumps(json.dumps(contents))}):
+    if _wb_batch_failed and {stop_on_error}:
+        _wb_batch_results.append({{"error": "Skipped because a previous script failed."}})
+        continue
+    wb_script_result = None
+    try:
+        exec(_wb_batch_script, globals())
+        _wb_batch_results.append({{"result": wb_script_result}})
+    except Exception:
+        _wb_batch_failed = True
+        _wb_batch_results.append({{"error": traceback.format_exc()}})
+wb_script_result = json.dumps(_wb_batch_results)
+""")
+
+    @staticmethod
+    def _batch_results(outputs, count):
+        """Convert the output of the dispatcher script into ``ScriptResult`` objects."""
+        if outputs is None:
+            return [ScriptResult(error="The batch of scripts failed to run.") for _ in range(count)]
+        results = []
+        for output in outputs:
+            if output.get("error"):
+                results.append(ScriptResult(error=output["error"]))
+            elif output.get("result"):
+                results.append(ScriptResult(result=json.loads(output["result"])))
+            else:
+                results.append(ScriptResult())
+        return results
+
+    @staticmethod
+    def _archive_script(archive_name, include_solution_result_files):
+        """Return the server script that saves and archives the current project."""
+        return f"""import os
+import json
+successful = False
+wd = GetServerWorkingDirectory()
+if os.path.basename(GetProjectFile()).StartsWith("wbnew."):
+    Save(FilePath=os.path.join(wd, "{archive_name}.wbpj"), Overwrite=True)
+else:
+    Save(Overwrite=True)
+Archive(FilePath=os.path.join(wd, "{archive_name}.wbpz"),
+    IncludeSkippedFiles={include_solution_result_files})
+successful = True
+wb_script_result =json.dumps(successful)
+"""
+
+    def _python_logging(self, log_level, msg):
+        """Queue a server log message for the client logger.
+
+        Parameters
+        ----------
+        log_level : int
+            Server log level. Options are ``wb.LOG_DEBUG``, ``wb.LOG_INFO``,
+            ``wb.LOG_WARNING``, ``wb.LOG_ERROR``, and ``wb.LOG_FATAL``.
+
+        msg : str
+            Message to log.
+        """
+        python_level = _WorkbenchClientBase._server_to_python_levels.get(log_level)
+        if python_level is not None:
+            self._log_forwarder.submit(python_level, msg)
+
+    _server_to_python_levels = {
+        wb.LOG_DEBUG: logging.DEBUG,
+        wb.LOG_INFO: logging.INFO,
+        wb.LOG_WARNING: logging.WARNING,
+        wb.LOG_ERROR: logging.ERROR,
+        wb.LOG_FATAL: logging.CRITICAL,
+    }
+
+    @staticmethod
+    def _to_python_log_level(log_level):
+        """Convert the given log level to the corresponding Python log level.
+
+        Parameters
+        ----------
+        log_level : str
+            level of logging: options are "debug", "info", "warning", "error", "critical"
+
+        Returns
+        -------
+        int
+            the corresponding Python log level
+        """
+        log_level = log_level.lower()
+        for level_name, server_level in _WorkbenchClientBase._log_levels.items():
+            if log_level in level_name:
+                return server_level[1]
+        return logging.NOTSET
+
+    @staticmethod
+    def _to_server_log_level(log_level):
+        """Convert the given log level to the corresponding server log level.
+
+        Parameters
+        ----------
+        log_level : str
+            Level of logging. Options are "critical", "debug", "error", "info", and "warning".
+
+        Returns
+        -------
+        int
+            Corresponding server log level.
+        """
+        log_level = log_level.lower()
+        for level_name, server_level in _WorkbenchClientBase._log_levels.items():
+            if log_level in level_name:
+                return server_level[0]
+        return wb.LOG_NONE
+
+    _log_levels = {
+        "none null": (wb.LOG_NONE, logging.NOTSET),
+        "debug": (wb.LOG_DEBUG, logging.DEBUG),
+        "information": (wb.LOG_INFO, logging.INFO),
+        "warning": (wb.LOG_WARNING, logging.WARNING),
+        "error": (wb.LOG_ERROR, logging.ERROR),
+        "fatal critical": (wb.LOG_FATAL, logging.CRITICAL),
+    }
+
+
+class WorkbenchClient(_WorkbenchClientBase):
+    """Functions of a PyWorkbench client.
+
+    Parameters
+    ----------
+    local_workdir : str
+        Local working directory for the client.
+    server_host : str
+        Hostname or IP address of the server.
+    server_port : int
+        Port number of the server.
+    server_security : string
+        Security mode of the server.
+        Options are: "insecure", "uds", "wnua", "mtls"
+    channel_options : ChannelOptions or str, default: None
+        Settings of the gRPC channel, or the name of a preset: "default" or
+        "high_throughput". The default is ``None``, in which case the gRPC defaults are used.
+    """
+
+    @property
+    def server_info(self):
+        """Information about the connected server.
+
+        The information is collected with a single script call on first access and
+        cached. Reconnecting to the same server keeps the cached information, which is
+        only collected again after connecting to a different server or calling
+        ``refresh_server_info()``.
+        """
+        if self._server_info is None:
+            self._set_server_info(self.run_script_string(ServerInfo.script))
+        return self._server_info
+
+    def refresh_server_info(self):
+        """Collect the information about the connected server again.
+
+        Returns
+        -------
+        ServerInfo
+            Updated server information.
+        """
+        self._server_info = None
+        return self.server_info
+
+    @property
+    def server_version(self):
+        """The Workbench version of the connected server."""
+        return self.server_info.version
+
+    @property
+    def project_path(self):
+        """Path of the current project file on the server.
+
+        The path is read from the server on each access, because it changes when a
+        project is opened or saved under a new name.
+        """
+        return self.run_script_string(_PROJECT_PATH_SCRIPT)
+
+    def _can_start_server(self, capability, product):
+        """Return whether to ask the server to start a product server for a system.
+
+        Only a server that reports that it lacks the capability is refused. If the
+        server information cannot be collected or the server cannot tell, the failure is
+        logged and the request is sent anyway.
+        """
+        try:
+            supported = getattr(self.server_info, capability)
+        except Exception as ex:
+            logging.warning(
+                f"Failed to query whether the Workbench server can start {product} servers: "
+                f"{ex}. Sending the request anyway."
+            )
+            return True
+        if supported is None:
+            logging.warning(
+                f"The Workbench server could not tell whether it can start {product} servers. "
+                "Sending the request anyway."
+            )
+            return True
+        if not supported:
+            logging.error(f"The Workbench server does not support starting {product} servers.")
+        return supported
+
+    def _is_version_252(self):
+        """Return whether the server is 2025 R2 or later, or ``None`` if unknown."""
+        try:
+            return self.server_version >= 252
+        except Exception as ex:
+            logging.warning(f"Failed to query the Workbench server version: {ex}")
+            return None
+
+    def _run_on_version_252(self, statement):
+        """Run a statement that needs a 2025 R2 or later server.
+
+        If the server version is unknown, the server checks it in the script itself.
+        """
+        is_version_252 = self._is_version_252()
+        if is_version_252 is None:
+            self.run_script_string(f"if float(GetFrameworkVersion()) >= 25.2:\n    {statement}\n")
+        elif is_version_252:
+            self.run_script_string(statement)
+
+    def __enter__(self):
+        """Connect to the server when entering a context."""
+        self._connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disconnect from the server when exiting a context."""
+        self._disconnect()
+
+    def _connect(self):
+        """Connect to the server."""
+        self.channel = create_channel(
+            host=self._server_host,
+            port=self._server_port,
+            transport_mode=self._server_security,
+            certs_dir=None,
+            grpc_options=self._channel_options.grpc_options(),
+        )
+        self.stub = WorkbenchServiceStub(self.channel)
+        self._forget_other_server()
+        logging.info(
+            f"connected to the WB server at {self._server_host}:{self._server_port} "
+            "using {self._server_security} connection"
+        )
+
+    def _disconnect(self):
+        """Disconnect from the server."""
+        if self.channel:
+            self.channel.close()
+            self.channel = None
+            self.stub = None
+            logging.info("Disconnected from the Workbench server")
+
     def run_script_string(self, script_string, args=None, log_level="error"):
         """Run a script as given in the input string on the server.
 
         Parameters
         ----------
-        script_string : str
-            String containing the content of the script to run.
+        script_string : str or ScriptTemplate
+            String containing the content of the script to run, or a template
+            created from it.
         args : dictionary of script variable names and values
             Variables in the script specified as $$varname%%50%% will be converted to variable
             values or use the default value - 50 in the example.
@@ -184,41 +1026,81 @@ wb_script_result=json.dumps(GetFrameworkVersion())""")
         Run a Workbench script, given in a string, that returns the name of
         a newly created system.
 
-        >>> wb.run_script_string(r'''import json
-        wb_script_result=json.dumps(GetTemplate(TemplateName="FLUENT").CreateSystem().Name)
-        ''')
+        >>> wb.run_script_string(r'''import json
+        wb_script_result=json.dumps(GetTemplate(TemplateName="FLUENT").CreateSystem().Name)
+        ''')
+
+        """
+        if not self._is_connected():
+            logging.error("Workbench client is not yet connected to a server.")
+            return None
+        updated_script_string = self._prepare_script(script_string, args)
+        if updated_script_string is None:
+            return None
+        request = wb.RunScriptRequest(
+            content=updated_script_string,
+            log_level=WorkbenchClient._to_server_log_level(log_level),
+        )
+        with self._rpc_stats.call("RunScript") as rpc:
+            rpc.bytes_sent = request.ByteSize()
+            for response in self.stub.RunScript(request):
+                rpc.chunk(received=response.ByteSize())
+                if response.log and response.log.messages and len(response.log.messages) > 0:
+                    for log_entry in response.log.messages:
+                        rpc.log(log_entry.level, log_entry.message)
+                        self._python_logging(log_entry.level, log_entry.message)
+                if response.result:
+                    if response.result.error:
+                        rpc.set_error(response.result.error)
+                        logging.error("Error when running the script: " + response.result.error)
+                        return None
+                    elif response.result.result:
+                        logging.info("The script has finisished.")
+                        return json.loads(response.result.result)
+
+    def run_scripts_batch(self, scripts, stop_on_error=True, log_level="error"):
+        """Run several scripts on the server in a single round trip.
+
+        The scripts run one after another in the same server session, as if
+        ``run_script_string()`` were called for each of them, but they are sent
+        together in one request.
+
+        Parameters
+        ----------
+        scripts : list
+            Scripts to run. Each entry is a script string, a ``ScriptTemplate``, or a
+            ``(script, args)`` tuple, where ``args`` is a dictionary of script variable
+            names and values as for ``run_script_string()``.
+        stop_on_error : bool, default: True
+            Whether to skip the remaining scripts after the first script that fails.
+        log_level : str, default: "error"
+            Level of logging. Options are "critical", "debug", "error", "info", and "warning".
+
+        Returns
+        -------
+        list[ScriptResult]
+            Result and error of each script, in the order of the given scripts.
+
+        Examples
+        --------
+        Reset the project, open a project file, and check it for errors with one request.
+
+        >>> results = wb.run_scripts_batch(
+        ...     [
+        ...         "Reset()",
+        ...         ('Open(FilePath="$$path%%%%")', {"path": "/data/model.wbpj"}),
+        ...         check_script,
+        ...     ]
+        ... )
+        >>> errors = [r.error for r in results if r.error]
 
         """
-        if not self._is_connected():
-            logging.error("Workbench client is not yet connected to a server.")
+        script = self._batch_script(scripts, stop_on_error)
+        if script is None:
             return None
-        updated_script_string = script_string
-        if args and len(args) > 0:
-            if any(not re.match(r"^\w+$", arg) for arg in args.keys()):
-                logging.error("script argument name contains illegal character.")
-                return None
-            for arg_name in args:
-                updated_script_string = re.sub(
-                    r"\$\$" + arg_name + r"%%((?!%%).)*%%",
-                    str(args[arg_name]),
-                    updated_script_string,
-                )
-        updated_script_string = re.sub(r"\$\$\w+%%(((?!%%).)*)%%", r"\1", updated_script_string)
-        request = wb.RunScriptRequest(
-            content=updated_script_string,
-            log_level=WorkbenchClient.__to_server_log_level(log_level),
+        return self._batch_results(
+            self.run_script_string(script, log_level=log_level), len(scripts)
         )
-        for response in self.stub.RunScript(request):
-            if response.log and response.log.messages and len(response.log.messages) > 0:
-                for log_entry in response.log.messages:
-                    self.__python_logging(log_entry.level, log_entry.message)
-            if response.result:
-                if response.result.error:
-                    logging.error("Error when running the script: " + response.result.error)
-                    return None
-                elif response.result.result:
-                    logging.info("The script has finisished.")
-                    return json.loads(response.result.result)
 
     def run_script_file(self, script_file_name, args=None, log_level="error"):
         """Run a script file on the server.
@@ -247,7 +1129,91 @@ wb_script_result=json.dumps(GetFrameworkVersion())""")
             script_string = sf.read()
         return self.run_script_string(script_string, args, log_level)
 
-    def upload_file(self, *file_list, show_progress=True):
+    def run_script_array(
+        self,
+        script_string,
+        args=None,
+        log_level="error",
+        dtype="float64",
+        mmap=True,
+        show_progress=False,
+    ):
+        """Run a script on the server and return its numeric output as a NumPy array.
+
+        Instead of ``wb_script_result``, the script assigns a sequence of numbers, or a
+        list of rows of equal length, to ``wb_script_array``. The values are written to
+        a binary ``.npy`` file on the server and downloaded without any JSON encoding,
+        which is much faster and leaner for millions of values. NumPy is required on
+        the client only.
+
+        Parameters
+        ----------
+        script_string : str or ScriptTemplate
+            String containing the content of the script to run.
+        args : dictionary of script variable names and values
+            Variables in the script specified as $$varname%%50%% will be converted to variable
+            values or use the default value - 50 in the example.
+        log_level : str, default: "error"
+            Level of logging. Options are "critical", "debug", "error", "info", and "warning".
+        dtype : str, default: "float64"
+            Data type of the array. Options are "float64", "float32", and "int32".
+        mmap : bool, default: True
+            Whether to memory-map the downloaded file instead of reading it into memory.
+            A memory-mapped array needs its file, so the file is kept in the client
+            working directory and belongs to the caller, who can remove it with
+            ``os.remove(array.filename)`` once the array is no longer used. Otherwise,
+            the file is removed after reading it.
+        show_progress : bool, str, ProgressReporter, or callable, default: False
+            How to report the progress of downloading the array. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for the options.
+
+        Returns
+        -------
+        numpy.ndarray
+            One- or two-dimensional array, or ``None`` if the script failed.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed. This is checked before the script runs.
+
+        Examples
+        --------
+        Get the coordinates of all nodes of a mesh as an N x 3 array.
+
+        >>> coordinates = wb.run_script_array(
+        ...     "wb_script_array = [[n.X, n.Y, n.Z] for n in GetNodes()]"
+        ... )
+
+        """
+        import_numpy()
+        if not self._is_connected():
+            logging.error("Workbench client is not yet connected to a server.")
+            return None
+        if isinstance(script_string, ScriptTemplate):
+            script_string = script_string.script_string
+        try:
+            script = array_script(script_string, dtype)
+        except ValueError as ex:
+            logging.error(str(ex))
+            return None
+        output = self.run_script_string(script, args, log_level)
+        if output is None:
+            return None
+        try:
+            downloaded = self.download_file(output["file"], show_progress=show_progress)
+        finally:
+            self.__remove_server_file(output["file"])
+        if downloaded is None:
+            return None
+        file_path = os.path.join(self.workdir, output["file"])
+        array = load_array(file_path, mmap)
+        if not mmap:
+            os.remove(file_path)
+        logging.info(f"Received an array of shape {tuple(output['shape'])}.")
+        return array
+
+    def upload_file(self, *file_list, show_progress=True, max_workers=1, skip_unchanged=False):
         """Upload one or more files from the client to the server.
 
         Parameters
@@ -255,75 +1221,394 @@ wb_script_result=json.dumps(GetFrameworkVersion())""")
         file_list : list[str]
             List of paths to the one or more local files to upload. The
             wildcard characters "?" and "*" are supported.
-        show_progress : bool, default: True
-            Whether to show a progress bar during the upload.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the upload. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. A
+            reporter name ("tqdm", "logging", or "silent"), a ``ProgressReporter``, or a
+            function that receives the ``ProgressTracker`` is also accepted. A single
+            progress report covers all files.
+        max_workers : int, default: 1
+            Maximum number of files to upload concurrently over the shared channel.
+            Many small files upload much faster with several workers because the
+            per-file round-trip latency overlaps.
+        skip_unchanged : bool, default: False
+            Whether to skip files that already exist with the same content in the server's
+            working directory. The local and server files are compared by SHA-256 hash.
+            Local hashes are cached in the cache directory of the current user, keyed by
+            path, size, and modification time, so unchanged files are not hashed again.
 
         Returns
         -------
-        list[str]
-            Names of the uploaded files.
+        list[UploadResult]
+            Result for each uploaded file, in the order the files were requested.
+
+        Examples
+        --------
+        Upload all part files of an assembly with eight concurrent streams.
+
+        >>> results = wb.upload_file("parts/*.prt", max_workers=8)
+        >>> failed = [r.name for r in results if r.error]
+
         """
         if not self._is_connected():
             logging.error("Workbench client is not yet connected to a server.")
             return
-        requested = []
-        for file_pattern in file_list:
-            if "*" in file_pattern or "?" in file_pattern:
-                if not os.path.isabs(file_pattern):
-                    file_pattern = os.path.join(self.workdir, file_pattern)
-                requested.extend(glob.glob(file_pattern))
+        existing_files = self._resolve_upload_files(file_list)
+        if len(existing_files) == 0:
+            return []
+        requested_files = existing_files
+        skipped = {}
+        if skip_unchanged:
+            existing_files = self.__filter_unchanged(existing_files)
+            skipped = {
+                path: UploadResult(os.path.basename(path), 0, 0.0, skipped=True)
+                for path in requested_files
+                if path not in existing_files
+            }
+
+        tracker = None
+        if show_progress:
+            total = 0
+            for file_path in existing_files:
+                try:
+                    total += os.path.getsize(file_path)
+                except OSError:
+                    pass
+            if len(existing_files) == 1:
+                desc = f"Uploading {os.path.basename(existing_files[0])}"
             else:
-                requested.append(file_pattern)
-        existing_files = []
-        nonexisting_files = []
-        for file_name in requested:
-            if not os.path.isabs(file_name):
-                file_name = os.path.join(self.workdir, file_name)
-            if os.path.isfile(file_name):
-                existing_files.append(file_name)
+                desc = f"Uploading {len(existing_files)} files"
+            tracker = track_progress(show_progress, desc, total, files=len(existing_files))
+
+        try:
+            if max_workers > 1 and len(existing_files) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(existing_files)),
+                    thread_name_prefix="wb-upload",
+                ) as executor:
+                    results = list(
+                        executor.map(lambda path: self.__upload_one(path, tracker), existing_files)
+                    )
             else:
-                nonexisting_files.append(file_name)
-        if len(nonexisting_files) > 0:
-            logging.warning(
-                "The following files do not exist and are skipped: " + "\n".join(nonexisting_files)
-            )
-        for file_path in existing_files:
-            logging.info(f"uploading file {file_path}")
-            response = self.stub.UploadFile(self.__upload_iterator(file_path, show_progress))
-            if response.error:
-                logging.error("Error during file upload: " + response.error)
+                results = [self.__upload_one(path, tracker) for path in existing_files]
+        finally:
+            if tracker is not None:
+                tracker.close()
+        if skipped:
+            uploaded = dict(zip(existing_files, results))
+            results = [skipped.get(path) or uploaded[path] for path in requested_files]
+        return results
+
+    def __filter_unchanged(self, file_paths):
+        """Return the files whose content differs from the same-named file on the server.
+
+        Parameters
+        ----------
+        file_paths : list[str]
+            Absolute paths of local files to upload.
+
+        Returns
+        -------
+        list[str]
+            Files that are missing on the server or have a different content.
+        """
+        index = FileHashIndex(default_index_path())
+        local = {}
+        for file_path in file_paths:
+            local[file_path] = (os.path.getsize(file_path), index.sha256(file_path))
+        index.save()
+        sizes = {os.path.basename(path): size for path, (size, _) in local.items()}
+        server_hashes = self.run_script_string(
+            SERVER_SHA256_FUNCTION
+            + f"""import os
+import json
+wd = GetServerWorkingDirectory()
+hashes = {{}}
+for name, size in json.loads({json.dumps(json.dumps(sizes))}).items():
+    file_path = os.path.join(wd, name)
+    if os.path.isfile(file_path) and os.path.getsize(file_path) == size:
+        hashes[name] = _wb_sha256(file_path)
+wb_script_result = json.dumps(hashes)
+"""
+        )
+        if server_hashes is None:
+            logging.warning("Failed to query file hashes on the server. Uploading all files.")
+            return file_paths
+        changed = []
+        for file_path, (_, digest) in local.items():
+            if server_hashes.get(os.path.basename(file_path)) == digest:
+                logging.info(f"skipping unchanged file {file_path}")
             else:
-                logging.info(
-                    "A file is uploaded to the server with the name: " + response.file_name
-                )
+                changed.append(file_path)
+        return changed
+
+    def sync_directory(
+        self, local_dir, remote_subdir="", delete=False, max_workers=4, show_progress=True
+    ):
+        """Make a directory on the server match a local directory by uploading only changes.
 
-    def __upload_iterator(self, file_path, show_progress):
-        dir_path, file_name = os.path.split(file_path)
-        yield wb.UploadFileRequest(file_name=file_name)
+        A manifest of the local files with their relative path, size, modification time,
+        and SHA-256 hash is compared with a manifest of the server directory, which is
+        collected by a single script call. The server hashes only the files whose size
+        matches the local file. Files that are missing or different on the server are
+        uploaded in parallel and then moved into place. Local hashes are cached in the
+        cache directory of the current user, so unchanged files are not hashed again.
 
-        pbar = None
-        if show_progress:
-            bytes = os.path.getsize(file_path)
-            pbar = tqdm.tqdm(
-                total=bytes,
-                desc=f"Uploading {file_name}",
-                unit="B",
-                unit_scale=True,
-                unit_divisor=1024,
+        Parameters
+        ----------
+        local_dir : str
+            Path to the local directory. A relative path is relative to the client working
+            directory.
+        remote_subdir : str, default: ""
+            Path of the target directory relative to the server's working directory. The
+            default is ``""``, in which case the working directory itself is used.
+        delete : bool, default: False
+            Whether to delete files in the server directory that do not exist locally.
+            Requires a ``remote_subdir``, so that project files and other uploads in the
+            server's working directory itself are never deleted.
+        max_workers : int, default: 4
+            Maximum number of files to upload concurrently.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the upload. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for the options.
+
+        Returns
+        -------
+        SyncResult
+            Uploaded, unchanged, deleted, and failed files, and the number of bytes
+            uploaded and saved, or ``None`` if the synchronization failed.
+
+        Examples
+        --------
+        Push the edited input files of a study before the next run.
+
+        >>> result = wb.sync_directory("inputs", "study/inputs", delete=True)
+        >>> print(f"{result.bytes_saved / 1048576:.0f} MB not uploaded again")
+
+        """
+        if not self._is_connected():
+            logging.error("Workbench client is not yet connected to a server.")
+            return None
+        if not os.path.isabs(local_dir):
+            local_dir = os.path.join(self.workdir, local_dir)
+        if not os.path.isdir(local_dir):
+            logging.error(f"The local directory {local_dir} does not exist.")
+            return None
+        remote_subdir = remote_subdir.replace("\\", "/").strip("/")
+        if ":" in remote_subdir or ".." in remote_subdir.split("/"):
+            logging.error(f"Invalid server directory: {remote_subdir}")
+            return None
+        if delete and all(part in ("", ".") for part in remote_subdir.split("/")):
+            logging.error(
+                "Deleting files is only supported when syncing to a subdirectory of the "
+                "server's working directory."
             )
+            return None
+        start = time.perf_counter()
+
+        index_path = default_index_path()
+        index = FileHashIndex(index_path)
+        local = {}
+        for root, dirs, files in os.walk(local_dir):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                if file_path == index_path or file_path.startswith(index_path + "."):
+                    continue
+                relative_path = os.path.relpath(file_path, local_dir).replace(os.sep, "/")
+                local[relative_path] = (
+                    file_path,
+                    os.path.getsize(file_path),
+                    index.sha256(file_path),
+                )
+        index.save()
 
-        chunk_size = 65536  ## 64 kb
-        with open(file_path, mode="rb") as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if chunk:
-                    if pbar is not None:
-                        pbar.update(len(chunk))
+        sizes = {relative_path: size for relative_path, (_, size, _) in local.items()}
+        remote = self.run_script_string(
+            SERVER_SHA256_FUNCTION
+            + f"""import os
+import json
+base = os.path.normpath(os.path.join(GetServerWorkingDirectory(), {json.dumps(remote_subdir)}))
+sizes = json.loads({json.dumps(json.dumps(sizes))})
+manifest = {{}}
+for root, dirs, files in os.walk(base):
+    for name in files:
+        file_path = os.path.join(root, name)
+        relative_path = os.path.relpath(file_path, base).replace(os.sep, "/")
+        size = os.path.getsize(file_path)
+        digest = None
+        if sizes.get(relative_path) == size:
+            digest = _wb_sha256(file_path)
+        manifest[relative_path] = [size, os.path.getmtime(file_path), digest]
+wb_script_result = json.dumps(manifest)
+"""
+        )
+        if remote is None:
+            logging.error("Failed to collect the manifest of the server directory.")
+            return None
+
+        result = SyncResult()
+        changed = []
+        for relative_path, (file_path, size, digest) in local.items():
+            entry = remote.get(relative_path)
+            if entry is not None and entry[2] == digest:
+                result.unchanged.append(relative_path)
+                result.bytes_saved += size
+            else:
+                changed.append(relative_path)
+        stale = sorted(set(remote) - set(local)) if delete else []
+
+        # files are uploaded under unique names into the working directory and then moved
+        token = uuid.uuid4().hex
+        staged = {relative_path: f"wb_sync_{token}_{i}" for i, relative_path in enumerate(changed)}
+        uploads = []
+        if changed:
+            tracker = None
+            if show_progress:
+                tracker = track_progress(
+                    show_progress,
+                    f"Synchronizing {len(changed)} files",
+                    sum(local[relative_path][1] for relative_path in changed),
+                    files=len(changed),
+                )
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(max_workers, len(changed))),
+                    thread_name_prefix="wb-upload",
+                ) as executor:
+                    uploads = list(
+                        executor.map(
+                            lambda relative_path: self.__upload_one(
+                                local[relative_path][0], tracker, staged[relative_path]
+                            ),
+                            changed,
+                        )
+                    )
+            finally:
+                if tracker is not None:
+                    tracker.close()
+
+        moves = []
+        cleanup = []
+        for relative_path, upload in zip(changed, uploads):
+            result.bytes_uploaded += upload.bytes
+            if upload.error:
+                result.failed.append(relative_path)
+                cleanup.append(staged[relative_path])
+            else:
+                moves.append([staged[relative_path], relative_path])
+        if moves or stale or cleanup:
+            plan = {"moves": moves, "delete": stale, "cleanup": cleanup}
+            applied = self.run_script_string(f"""import os
+import json
+wd = GetServerWorkingDirectory()
+base = os.path.normpath(os.path.join(wd, {json.dumps(remote_subdir)}))
+plan = json.loads({json.dumps(json.dumps(plan))})
+for staged, relative_path in plan["moves"]:
+    target = os.path.join(base, *relative_path.split("/"))
+    folder = os.path.dirname(target)
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    if os.path.exists(target):
+        os.remove(target)
+    os.rename(os.path.join(wd, staged), target)
+for relative_path in plan["delete"]:
+    target = os.path.join(base, *relative_path.split("/"))
+    if os.path.exists(target):
+        os.remove(target)
+    folder = os.path.dirname(target)
+    while folder != base and os.path.isdir(folder) and not os.listdir(folder):
+        os.rmdir(folder)
+        folder = os.path.dirname(folder)
+for staged in plan["cleanup"]:
+    staged_path = os.path.join(wd, staged)
+    if os.path.exists(staged_path):
+        os.remove(staged_path)
+wb_script_result = json.dumps(len(plan["moves"]))
+""")
+            if applied is None:
+                logging.error("Failed to move the uploaded files into place on the server.")
+                return None
+        result.uploaded = [relative_path for _, relative_path in moves]
+        result.deleted = stale
+        result.seconds = time.perf_counter() - start
+        logging.info(
+            f"Synchronized {local_dir}: uploaded {len(result.uploaded)} files "
+            f"({result.bytes_uploaded / 1048576:.1f} MB), skipped {len(result.unchanged)} "
+            f"unchanged files ({result.bytes_saved / 1048576:.1f} MB saved), "
+            f"deleted {len(result.deleted)} files."
+        )
+        return result
+
+    def __upload_one(self, file_path, tracker, remote_name=None):
+        """Upload a single file, file object, or buffer and return its ``UploadResult``."""
+        logging.info(f"uploading file {file_path if isinstance(file_path, str) else remote_name}")
+        sent = 0
+        rpc = self._rpc_stats.call("UploadFile")
+
+        def count(size):
+            nonlocal sent
+            sent += size
+            rpc.chunk(sent=size)
+            if tracker is not None:
+                tracker.advance(size)
+
+        start = time.perf_counter()
+        error = None
+        response = None
+        with rpc:
+            try:
+                response = self.stub.UploadFile(
+                    self.__upload_iterator(file_path, False, count, remote_name),
+                    **self._transfer_call_options(),
+                )
+                if response.error:
+                    error = response.error
+                    rpc.set_error(error)
+            except (grpc.RpcError, OSError) as ex:
+                # keep an empty message from being taken for success
+                error = str(ex) or type(ex).__name__
+                rpc.set_error(ex)
+        seconds = time.perf_counter() - start
+        if tracker is not None:
+            tracker.file_done()
+        if error is not None:
+            logging.error("Error during file upload: " + error)
+        elif response is not None:
+            logging.info("A file is uploaded to the server with the name: " + response.file_name)
+        return UploadResult(remote_name or os.path.basename(file_path), sent, seconds, error)
+
+    def __upload_iterator(self, file_path, show_progress, on_chunk=None, remote_name=None):
+        is_path = isinstance(file_path, str)
+        file_name = os.path.basename(file_path) if is_path else remote_name
+        yield wb.UploadFileRequest(file_name=remote_name or file_name)
+
+        tracker = None
+        if show_progress:
+            size = os.path.getsize(file_path) if is_path else _source_size(file_path)
+            tracker = track_progress(show_progress, f"Uploading {file_name}", size)
+
+        options = self._channel_options
+        chunk_size = options.upload_chunk_size or DEFAULT_CHUNK_SIZE
+        source = open(file_path, mode="rb") if is_path else contextlib.nullcontext(file_path)
+        try:
+            with (
+                source as f,
+                contextlib.closing(
+                    _iter_chunks(
+                        f, chunk_size, options.upload_read_ahead, self._upload_chunk_tuner()
+                    )
+                ) as chunks,
+            ):
+                for chunk in chunks:
+                    if tracker is not None:
+                        tracker.advance(len(chunk))
+                    if on_chunk is not None:
+                        on_chunk(len(chunk))
                     yield wb.UploadFileRequest(file_content=chunk)
-                else:
-                    if pbar is not None:
-                        pbar.close()
-                    return
+        finally:
+            if tracker is not None:
+                tracker.close()
 
     def upload_file_from_example_repo(self, relative_file_path, show_progress=True):
         """Upload a file from the Ansys ``example-data`` repository to the server.
@@ -332,12 +1617,16 @@ wb_script_result=json.dumps(GetFrameworkVersion())""")
         ----------
         relative_file_path : str
             File path relative to the ``pyworkbench`` folder in the ``example-data`` repository.
-        show_progress : bool, default: True
-            Whether to show a progress bar during the upload.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the upload. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for other options.
         """
         if not self._is_connected():
             logging.error("Workbench client is not yet connected to a server.")
             return
+        from ansys.tools.common.example_download import download_manager
+
         dir, fn = os.path.split(relative_file_path)
         dir = "pyworkbench/" + dir
         downloaded = download_manager.download_file(
@@ -345,7 +1634,81 @@ wb_script_result=json.dumps(GetFrameworkVersion())""")
         )
         self.upload_file(downloaded, show_progress=show_progress)
 
-    def download_file(self, file_name, show_progress=True, target_dir=None):
+    def upload_bytes(self, name, data, show_progress=True):
+        """Upload data from memory to a file on the server.
+
+        The data is streamed in chunks over the same call as ``upload_file()`` without
+        writing a local file or copying the whole buffer first.
+
+        Parameters
+        ----------
+        name : str
+            Name of the file in the server's working directory.
+        data : bytes, bytearray, or memoryview
+            Data to upload. Any object that supports the buffer protocol is accepted.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the upload. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for other options.
+
+        Returns
+        -------
+        UploadResult
+            Result of the upload.
+        """
+        return self.upload_from(data, name, show_progress=show_progress)
+
+    def upload_from(self, fileobj, name, show_progress=True):
+        """Upload the content of a file object or a buffer to a file on the server.
+
+        Parameters
+        ----------
+        fileobj : file object, bytes, bytearray, or memoryview
+            Binary file object to read from its current position to its end, such as an
+            ``io.BytesIO`` object or an open socket file, or a bytes-like object. The file
+            object is not closed.
+        name : str
+            Name of the file in the server's working directory.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the upload. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for other options.
+
+        Returns
+        -------
+        UploadResult
+            Result of the upload.
+
+        Examples
+        --------
+        Upload a journal that is generated in memory.
+
+        >>> wb.upload_from(io.BytesIO(journal.encode()), "setup.wbjn")
+
+        """
+        if not self._is_connected():
+            logging.error("Workbench client is not yet connected to a server.")
+            return None
+        tracker = None
+        if show_progress:
+            tracker = track_progress(show_progress, f"Uploading {name}", _source_size(fileobj))
+        try:
+            return self.__upload_one(fileobj, tracker, remote_name=name)
+        finally:
+            if tracker is not None:
+                tracker.close()
+
+    def download_file(
+        self,
+        file_name,
+        show_progress=True,
+        target_dir=None,
+        resume=False,
+        verify=False,
+        extract=False,
+        include=None,
+        exclude=None,
+    ):
         """Download one or more files from the server.
 
         Parameters
@@ -354,186 +1717,342 @@ wb_script_result=json.dumps(GetFrameworkVersion())""")
             Name of the file. File must be located in the server's working directory.
             The wildcard characters "?" and "*" are supported. A ZIP file is automatically
             generated and downloaded when multiple files are specified.
-        show_progress : bool, default: True
-            Whether to show a progress bar during the download.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the download. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for other options.
         target_dir : str, default: None
             Path to a local directory to download the files to. The default is ``None``,
             in which case the client working directory is used.
-
+        resume : bool, default: False
+            Whether to keep the partial file if the download fails and to continue a
+            previously interrupted download of the same file where it stopped. Not
+            supported for wildcard downloads.
+        verify : bool, default: False
+            Whether to check the downloaded file against a SHA-256 hash computed on the
+            server. Not supported for wildcard downloads.
+        extract : bool, default: False
+            Whether to extract the ZIP file of a wildcard download while it is received.
+            The matching files are written straight to the target directory and the ZIP
+            file is never stored.
+        include : str or list[str], default: None
+            Patterns of the files to extract from the ZIP file, such as ``"*.out"``. The
+            default is ``None``, in which case all files are extracted.
+        exclude : str or list[str], default: None
+            Patterns of the files not to extract from the ZIP file. Excluded files are
+            never written to disk.
 
         Returns
         -------
-        str
-            Name of the downloaded file.
+        str or list[str]
+            Name of the downloaded file, or the names of the extracted files when
+            ``extract=True`` and the server sent a ZIP file.
         """
         if not self._is_connected():
             logging.error("Workbench client is not yet connected to a server.")
             return None
-        request = wb.DownloadFileRequest(file_name=file_name)
+        source_name = file_name
+        is_pattern = "*" in file_name or "?" in file_name
         file_name = file_name.replace("*", "_").replace("?", "_")
         td = target_dir
         if td is None:
             td = self.workdir
         file_path = os.path.join(td, file_name)
-        pbar = None
-        started = False
-        for response in self.stub.DownloadFile(request):
-            if response.error:
-                logging.error("Error during file download: " + response.error)
+        if is_pattern and (resume or verify):
+            logging.warning("Resuming and verifying are not supported for wildcard downloads.")
+            resume = verify = False
+
+        offset = expected_size = 0
+        server_info = {}
+        if resume or verify:
+            if resume:
+                offset, expected_size = _DownloadFileWriter.resume_offset(file_path, source_name)
+            server_info = self.__prepare_download(source_name, offset, expected_size, verify)
+            if server_info is None:
                 return None
-            if response.file_info:
-                if response.file_info.is_archive:
-                    file_name += ".zip"
-                    file_path += ".zip"
-                if response.file_info.file_size > 0:
-                    if show_progress:
-                        pbar = tqdm.tqdm(
-                            total=response.file_info.file_size,
-                            desc=f"Downloading {file_name}",
-                            unit="B",
-                            unit_scale=True,
-                            unit_divisor=1024,
-                        )
-            if response.file_content:
-                size = len(response.file_content)
-                if size > 0:
-                    if not started:
-                        if os.path.exists(file_path):
-                            os.remove(file_path)
-                        started = True
-
-                    try_more = 3
-                    while try_more > 0:
-                        try:
-                            with open(file_path, mode="ab") as f:
-                                f.write(response.file_content)
-                            try_more = 0
-                        except PermissionError:
-                            # intermittent "Permission Denied" error can happen
-                            if try_more <= 0:
-                                raise
-                            try_more -= 1
-                            time.sleep(0.1)
-
-                    if pbar is not None:
-                        pbar.update(size)
-        logging.info(f"Dwnloaded the file {file_name}.")
-        if pbar is not None:
-            pbar.close()
-        return file_name
-
-    def download_project_archive(
-        self, archive_name, include_solution_result_files=True, show_progress=True
-    ):
-        """Create and download the project archive.
-
-        Parameters
-        ----------
-        archive_name : str
-            Name of the project archive to use, without the file extension.
-        include_solution_result_files : bool, default: True
-            Whether to include solution and result files in the archive.
-        show_progress : bool, default: True
-            Whether to show a progress bar during the download.
-        """
-        if not re.match(r"^\w+$", archive_name):
-            logging.error("archive name should contain only alphanumeric characters")
-            return
-        script = f"""import os
-import json
-successful = False
-wd = GetServerWorkingDirectory()
-if os.path.basename(GetProjectFile()).StartsWith("wbnew."):
-    Save(FilePath=os.path.join(wd, "{archive_name}.wbpj"), Overwrite=True)
-else:
-    Save(Overwrite=True)
-Archive(FilePath=os.path.join(wd, "{archive_name}.wbpz"),
-    IncludeSkippedFiles={include_solution_result_files})
-successful = True
-wb_script_result =json.dumps(successful)
-"""
-        archive_created = self.run_script_string(script)
-        if not archive_created:
-            logging.error(
-                (
-                    "Failed to create the project archive. "
-                    "Make sure that the solver PyAnsys sessions are closed."
+            if offset > 0 and "tail" not in server_info and offset != server_info["size"]:
+                logging.info(f"The file {source_name} changed on the server. Restarting download.")
+                offset = 0
+            elif offset > 0:
+                logging.info(f"Resuming the download of {source_name} at byte {offset}.")
+
+        tracker = None
+        writer = None
+        extractor = None
+        source = source_name if resume else None
+        try:
+            if offset > 0:
+                writer = _DownloadFileWriter(file_path, server_info["size"], offset, source)
+            if offset == 0 or "tail" in server_info:
+                request = wb.DownloadFileRequest(file_name=server_info.get("tail", source_name))
+                with self._rpc_stats.call("DownloadFile") as rpc:
+                    for response in self.stub.DownloadFile(request):
+                        rpc.chunk(received=len(response.file_content))
+                        if response.error:
+                            rpc.set_error(response.error)
+                            logging.error("Error during file download: " + response.error)
+                            if writer is not None:
+                                writer.abort(keep=resume)
+                            if extractor is not None:
+                                extractor.abort()
+                            return None
+                        if response.file_info:
+                            if response.file_info.is_archive and extract:
+                                extractor = ZipStreamExtractor(td, include, exclude)
+                            elif response.file_info.is_archive:
+                                file_name += ".zip"
+                                file_path += ".zip"
+                            if (
+                                response.file_info.file_size > 0
+                                and writer is None
+                                and extractor is None
+                            ):
+                                writer = _DownloadFileWriter(
+                                    file_path, response.file_info.file_size, source=source
+                                )
+                            if response.file_info.file_size > 0 and show_progress:
+                                tracker = track_progress(
+                                    show_progress,
+                                    f"Downloading {file_name}",
+                                    offset + response.file_info.file_size,
+                                    initial=offset,
+                                )
+                        if response.file_content:
+                            size = len(response.file_content)
+                            if size > 0 and extractor is not None:
+                                extractor.write(response.file_content)
+                            elif size > 0:
+                                if writer is None:
+                                    writer = _DownloadFileWriter(file_path, source=source)
+                                writer.write(response.file_content)
+                            if size > 0 and tracker is not None:
+                                tracker.advance(size)
+            if extractor is not None:
+                extractor.close()
+                logging.info(
+                    f"Extracted {len(extractor.extracted)} files of {file_name} to {td} "
+                    f"and skipped {len(extractor.skipped)} files."
                 )
-            )
-            return
-        self.download_file(archive_name + ".wbpz", show_progress=show_progress)
+                return extractor.extracted
+            if writer is None:
+                writer = _DownloadFileWriter(file_path)
+            if verify and writer.sha256() != server_info["sha256"]:
+                logging.error(
+                    f"The downloaded file {file_name} does not match the file on the server."
+                )
+                writer.abort()
+                return None
+            writer.commit()
+        except BaseException:
+            if writer is not None:
+                writer.abort(keep=resume)
+            if extractor is not None:
+                extractor.abort()
+            raise
+        finally:
+            if tracker is not None:
+                tracker.close()
+            if "tail" in server_info:
+                self.__remove_server_file(server_info["tail"])
+        logging.info(
+            f"Downloaded the file {file_name}: {writer.written / 1048576:.1f} MB "
+            f"at {writer.throughput:.1f} MB/s."
+        )
+        return file_name
 
-    def __python_logging(self, log_level, msg):
-        """Log a message with the given log level.
+    def download_bytes(self, file_name, show_progress=True):
+        """Download a file from the server into memory.
 
         Parameters
         ----------
-        log_level : int
-            log level. Options are ``logging.CRITICAL``, ``logging.DEBUG``, ``logging.ERROR``,
-            ``logging.INFO``, and ``logging.WARNING``.
+        file_name : str
+            Name of the file in the server's working directory. When the name contains
+            the wildcard characters "?" and "*", the content of a ZIP file of the
+            matching files is returned.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the download. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for other options.
 
-        msg : str
-            Message to log.
+        Returns
+        -------
+        bytes
+            Content of the file, or ``None`` if the download failed.
         """
-        if log_level == wb.LOG_DEBUG:
-            self._logger.debug(msg)
-        elif log_level == wb.LOG_INFO:
-            self._logger.info(msg)
-        elif log_level == wb.LOG_WARNING:
-            self._logger.warn(msg)
-        elif log_level == wb.LOG_ERROR:
-            self._logger.error(msg)
-        elif log_level == wb.LOG_FATAL:
-            self._logger.fatal(msg)
+        chunks = []
+        if self.download_to(chunks.append, file_name, show_progress) is None:
+            return None
+        return b"".join(chunks)
 
-    @staticmethod
-    def __to_python_log_level(log_level):
-        """Convert the given log level to the corresponding Python log level.
+    def download_to(self, fileobj, file_name, show_progress=True):
+        """Download a file from the server into a file object or a buffer.
+
+        The data is streamed over the same call as ``download_file()`` and never
+        written to the client file system unless ``fileobj`` is a local file.
 
         Parameters
         ----------
-        log_level : str
-            level of logging: options are "debug", "info", "warning", "error", "critical"
+        fileobj : file object, bytearray, memoryview, or callable
+            Where to write the data. A binary file object or a function receives each
+            chunk, a ``bytearray`` is extended, and any other writable buffer, such as a
+            ``memoryview`` of a preallocated array, is filled from its start.
+        file_name : str
+            Name of the file in the server's working directory. When the name contains
+            the wildcard characters "?" and "*", a ZIP file of the matching files is
+            written.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the download. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for other options.
 
         Returns
         -------
         int
-            the corresponding Python log level
+            Number of bytes written, or ``None`` if the download failed.
+
+        Raises
+        ------
+        ValueError
+            If the file is larger than a fixed-size buffer.
         """
-        log_level = log_level.lower()
-        for level_name, server_level in WorkbenchClient.__log_levels.items():
-            if log_level in level_name:
-                return server_level[1]
-        return logging.NOTSET
+        if not self._is_connected():
+            logging.error("Workbench client is not yet connected to a server.")
+            return None
+        write = fileobj if callable(fileobj) else _buffer_writer(fileobj)
+        received = 0
+        tracker = None
+        try:
+            request = wb.DownloadFileRequest(file_name=file_name)
+            with self._rpc_stats.call("DownloadFile") as rpc:
+                for response in self.stub.DownloadFile(request):
+                    rpc.chunk(received=len(response.file_content))
+                    if response.error:
+                        rpc.set_error(response.error)
+                        logging.error("Error during file download: " + response.error)
+                        return None
+                    if response.file_info and response.file_info.file_size > 0 and show_progress:
+                        tracker = track_progress(
+                            show_progress,
+                            f"Downloading {file_name}",
+                            response.file_info.file_size,
+                        )
+                    if response.file_content:
+                        write(response.file_content)
+                        received += len(response.file_content)
+                        if tracker is not None:
+                            tracker.advance(len(response.file_content))
+        finally:
+            if tracker is not None:
+                tracker.close()
+        return received
+
+    def __remove_server_file(self, file_name):
+        """Remove a temporary file from the server's working directory."""
+        try:
+            self.run_script_string(
+                "import os\n"
+                f"os.remove(os.path.join(GetServerWorkingDirectory(), {json.dumps(file_name)}))"
+            )
+        except grpc.RpcError as ex:
+            logging.warning(f"Failed to remove the temporary file {file_name} on the server: {ex}")
 
-    @staticmethod
-    def __to_server_log_level(log_level):
-        """Convert the given log level to the corresponding server log level.
+    def __prepare_download(self, file_name, offset, expected_size, verify):
+        """Query the server about a file before a resumed or verified download.
+
+        If a partial download of the unchanged file exists, the server copies the
+        missing tail of the file into a temporary file, since the download service
+        always streams whole files.
 
         Parameters
         ----------
-        log_level : str
-            Level of logging. Options are "critical", "debug", "error", "info", and "warning".
+        file_name : str
+            Name of the file in the server's working directory.
+        offset : int
+            Number of bytes already downloaded.
+        expected_size : int
+            Size of the file when the partial download started.
+        verify : bool
+            Whether to compute the SHA-256 hash of the file.
 
         Returns
         -------
-        int
-            Corresponding server log level.
+        dict
+            ``size`` of the file, its ``sha256`` hash if requested, and the name of the
+            ``tail`` file to download if the download can be resumed. ``None`` if the
+            script failed.
         """
-        log_level = log_level.lower()
-        for level_name, server_level in WorkbenchClient.__log_levels.items():
-            if log_level in level_name:
-                return server_level[0]
-        return wb.LOG_NONE
+        tail_name = f"{file_name}.{uuid.uuid4().hex}.tail"
+        script = (
+            SERVER_SHA256_FUNCTION
+            + f"""import os
+import json
+file_path = os.path.join(GetServerWorkingDirectory(), {json.dumps(file_name)})
+offset = {offset}
+info = {{"size": os.path.getsize(file_path)}}
+if {verify}:
+    info["sha256"] = _wb_sha256(file_path)
+if 0 < offset < info["size"] and info["size"] == {expected_size}:
+    tail_name = {json.dumps(tail_name)}
+    with open(file_path, "rb") as src:
+        src.seek(offset)
+        with open(os.path.join(GetServerWorkingDirectory(), tail_name), "wb") as dst:
+            while True:
+                block = src.read(1048576)
+                if not block:
+                    break
+                dst.write(block)
+    info["tail"] = tail_name
+wb_script_result = json.dumps(info)
+"""
+        )
+        return self.run_script_string(script)
 
-    __log_levels = {
-        "none null": (wb.LOG_NONE, logging.NOTSET),
-        "debug": (wb.LOG_DEBUG, logging.DEBUG),
-        "information": (wb.LOG_INFO, logging.INFO),
-        "warning": (wb.LOG_WARNING, logging.WARNING),
-        "error": (wb.LOG_ERROR, logging.ERROR),
-        "fatal critical": (wb.LOG_FATAL, logging.CRITICAL),
-    }
+    def download_project_archive(
+        self,
+        archive_name,
+        include_solution_result_files=True,
+        show_progress=True,
+        resume=False,
+        verify=False,
+    ):
+        """Create and download the project archive.
+
+        Parameters
+        ----------
+        archive_name : str
+            Name of the project archive to use, without the file extension.
+        include_solution_result_files : bool, default: True
+            Whether to include solution and result files in the archive.
+        show_progress : bool, str, ProgressReporter, or callable, default: True
+            How to report the progress of the download. ``True`` uses the default
+            reporter, which shows a progress bar, and ``False`` reports nothing. See
+            ``ansys.workbench.core.progress.get_progress_reporter()`` for other options.
+        resume : bool, default: False
+            Whether to continue an interrupted download of the same archive instead of
+            creating the archive again.
+        verify : bool, default: False
+            Whether to check the downloaded archive against a SHA-256 hash computed on
+            the server.
+        """
+        if not re.match(r"^\w+$", archive_name):
+            logging.error("archive name should contain only alphanumeric characters")
+            return
+        archive_file = archive_name + ".wbpz"
+        partial, _ = _DownloadFileWriter.resume_offset(
+            os.path.join(self.workdir, archive_file), archive_file
+        )
+        if not resume or partial == 0:
+            script = self._archive_script(archive_name, include_solution_result_files)
+            archive_created = self.run_script_string(script)
+            if not archive_created:
+                logging.error(
+                    (
+                        "Failed to create the project archive. "
+                        "Make sure that the solver PyAnsys sessions are closed."
+                    )
+                )
+                return
+        self.download_file(archive_file, show_progress=show_progress, resume=resume, verify=verify)
 
     def start_mechanical_server(self, system_name, port=0):
         """Start the PyMechanical server for the given system in the Workbench project.
@@ -559,15 +2078,23 @@ wb_script_result =json.dumps(successful)
         >>> mechanical = connect_to_mechanical(port=server_port)
 
         """
-        port_arg = ""
-        if port > 0:
-            port_arg = ", Port=" + str(port)
+        if not self._can_start_server("mechanical_server", "PyMechanical"):
+            return None
+        launch = f'server_port=LaunchMechanicalServerOnSystem(SystemName="{system_name}"'
+        is_version_252 = self._is_version_252() if port > 0 else False
+        if is_version_252 is None:
+            # the server version is unknown, so the server checks it itself
+            launch = f"""if float(GetFrameworkVersion()) >= 25.2:
+    {launch}, Port={port})
+else:
+    {launch})"""
+        elif is_version_252:
+            launch += f", Port={port})"
+        else:
+            launch += ")"
         pymech_port = self.run_script_string(
             f"""import json
-if float(GetFrameworkVersion()) >= 25.2:
-    server_port=LaunchMechanicalServerOnSystem(SystemName="{system_name}{port_arg}")
-else:
-    server_port=LaunchMechanicalServerOnSystem(SystemName="{system_name}")
+{launch}
 wb_script_result=json.dumps(server_port)
 """
         )
@@ -588,9 +2115,7 @@ wb_script_result=json.dumps(server_port)
         >>> wb.stop_mechanical_server(system_name=mech_system_name)
 
         """
-        self.run_script_string(f"""if float(GetFrameworkVersion()) >= 25.2:
-    StopMechanicalServerOnSystem(SystemName="{system_name}")
-""")
+        self._run_on_version_252(f'StopMechanicalServerOnSystem(SystemName="{system_name}")')
 
     def start_fluent_server(self, system_name):
         """Start the PyFluent server for the given system in the Workbench project.
@@ -615,6 +2140,8 @@ wb_script_result=json.dumps(server_port)
         >>> fluent=pyfluent.connect_to_fluent(server_info_file_name=server_info_file)
 
         """
+        if not self._can_start_server("fluent_server", "PyFluent"):
+            return None
         server_info_file_name = self.run_script_string(
             f"""import json
 server_info_file=LaunchFluentServerOnSystem(SystemName="{system_name}")
@@ -642,9 +2169,7 @@ wb_script_result=json.dumps(server_info_file)
         >>> wb.stop_fluent_server(system_name=mech_system_name)
 
         """
-        self.run_script_string(f"""if float(GetFrameworkVersion()) >= 25.2:
-    StopFluentServerOnSystem(SystemName="{system_name}")
-""")
+        self._run_on_version_252(f'StopFluentServerOnSystem(SystemName="{system_name}")')
 
     def start_sherlock_server(self, system_name):
         """Start the PySherlock server for the given system in the Workbench project.
@@ -669,6 +2194,8 @@ wb_script_result=json.dumps(server_info_file)
         >>> sherlock.common.check()
 
         """
+        if not self._can_start_server("sherlock_server", "PySherlock"):
+            return None
         pysherlock_port = self.run_script_string(
             f"""import json
 server_port=LaunchSherlockServerOnSystem(SystemName="{system_name}")
@@ -692,9 +2219,7 @@ wb_script_result=json.dumps(server_port)
         >>> wb.stop_sherlock_server(system_name=mech_system_name)
 
         """
-        self.run_script_string(f"""if float(GetFrameworkVersion()) >= 25.2:
-    StopSherlockServerOnSystem(SystemName="{system_name}")
-""")
+        self._run_on_version_252(f'StopSherlockServerOnSystem(SystemName="{system_name}")')
 
 
-__all__ = ["WorkbenchClient"]
+__all__ = ["WorkbenchClient", "ServerInfo", "UploadResult", "ScriptResult"]
@@ -22,16 +22,20 @@
 
 """Module for launching PyWorkbench."""
 
-import ctypes
+from collections import deque
+import contextlib
 import logging
 import os
 import platform
 
 # subprocess is used to launch Workbench on local Linux machine, excluding bandit warning
 import subprocess  # nosec: B404
+import threading
 import time
 import uuid
 
+from ansys.workbench.core.hooks import global_hooks
+
 
 class Launcher:
     """Launch a Workbench server on a local or remote machine.
@@ -39,13 +43,28 @@ class Launcher:
     Note that launching a server on a remote Linux machine, or on a remote Windows
     machine from a Linux machine, is not supported.
 
+    On Linux, the output of the server process is read in a background thread for as long
+    as the server runs, so the server never blocks on a full output pipe. The most recent
+    lines are kept for ``recent_output()``.
+
+    The phases of a launch are reported to the "launch_phase" hooks registered with
+    ``ansys.workbench.core.hooks.add_hook()``.
+
+    Parameters
+    ----------
+    output_lines : int, default: 1000
+        Number of the most recent output lines of the server process to keep.
+    forward_output : bool, default: False
+        Whether to also log every output line of the server process to the "WB" logger
+        at the info level.
+
     Raises
     ------
     Exception
         If the wmi module on Windows, or the ctypes module on Linux, is not available
     """
 
-    def __init__(self):
+    def __init__(self, output_lines=1000, forward_output=False):
         self._wmi = None
         self._libc = None
         if platform.system() == "Windows":
@@ -58,7 +77,10 @@ class Launcher:
                 )
         else:
             try:
+                import ctypes
+
                 self._libc = ctypes.CDLL("libc.so.6")
+                self._libc.getenv.restype = ctypes.c_char_p
             except Exception:
                 self._libc = None
             if not self._libc:
@@ -68,7 +90,14 @@ class Launcher:
                 )
 
         self._wmi_connection = None
+        self._wmi_credentials = None
         self._process_id = -1
+        self._process = None
+        self._output = deque(maxlen=output_lines)
+        self._forward_output = forward_output
+        self._output_reader = None
+        self._port = None
+        self.launch_id = None
 
     def launch(
         self,
@@ -80,6 +109,7 @@ class Launcher:
         host=None,
         username=None,
         password=None,
+        timeout=480,
     ):
         """Launch PyWorkbench server on the local or a remote computer.
 
@@ -104,6 +134,8 @@ class Launcher:
         password : str, default: None
             User's password on the server. The default is ``None``, which launches Workbench
             on the local computer.
+        timeout : float, default: 480
+            Maximum number of seconds to wait for the server to report its port.
 
         Raises
         ------
@@ -140,7 +172,29 @@ class Launcher:
         elif not host and self._wmi:
             security = "wnua"
 
-        if self._wmi:
+        prefix = uuid.uuid4().hex
+        self.launch_id = prefix
+        self.report_phase("started", host=host)
+
+        args = (version, show_gui, server_workdir, port_to_use, security, host, prefix, timeout)
+        if not self._wmi:
+            return self.__launch(*args)
+        self._wmi_credentials = (host, username, password)
+        with self.__wmi_session():
+            return self.__launch(*args)
+
+    @contextlib.contextmanager
+    def __wmi_session(self):
+        """Connect to WMI inside a COM apartment of the current thread.
+
+        The apartment is released when the session ends, so launching from many worker
+        threads does not leak COM apartments. WMI objects are only valid in the session.
+        """
+        import pythoncom
+
+        host, username, password = self._wmi_credentials
+        pythoncom.CoInitialize()
+        try:
             try:
                 if not host:
                     self._wmi_connection = self._wmi.WMI()
@@ -156,7 +210,14 @@ class Launcher:
                     )
                 else:
                     raise Exception("Failed in initializing WMI service on the local computer.")
+            yield self._wmi_connection
+        finally:
+            self._wmi_connection = None
+            pythoncom.CoUninitialize()
 
+    def __launch(
+        self, version, show_gui, server_workdir, port_to_use, security, host, prefix, timeout
+    ):
         ansys_install_path = None
         if version:
             ansys_install_path = self.__getenv("AWP_ROOT" + version)
@@ -202,7 +263,6 @@ class Launcher:
         args.append("-E")
 
         # create command string
-        prefix = uuid.uuid4().hex
         cmd1 = "StartServer(EnvironmentPrefix='"
         cmd1 += prefix + "'"
         if server_workdir is not None:
@@ -250,10 +310,6 @@ It is highly recommended to only utilize these features on a trusted, secure net
             if result == 0:
                 successful = True
                 self._process_id = process_id
-                for p in self._wmi_connection.Win32_Process():
-                    if p.ProcessId == process_id:
-                        self._process = p
-                        break
         else:
             # Excluding bandit warning for subprocess usage
             # as this is a controlled env
@@ -266,13 +322,14 @@ It is highly recommended to only utilize these features on a trusted, secure net
                 self._process = process
         if successful:
             logging.info(f"Workbench is launched successfully with process ID {self._process_id}.")
+            self.report_phase("process_spawned", host=host, pid=self._process_id)
         else:
             logging.error("Workbench failed to launch on the host.")
+            self.report_phase("failed", host=host)
             return 0, security
 
         # retrieve server port once WB is fully up running
         port = None
-        timeout = 60 * 8  # set 8 minutes as upper limit for WB startup
         start_time = time.time()
         if self._wmi:
             while True:
@@ -282,24 +339,105 @@ It is highly recommended to only utilize these features on a trusted, secure net
                     break
                 else:
                     port = None
-                if time.time() - start_time > timeout:
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
                     logging.error("Failed to start Workbench service within reasonable timeout.")
                     break
-                time.sleep(10)
+                time.sleep(min(10, remaining))
         else:
-            for line in process.stdout:
-                line = line.rstrip()
-                if line.startswith("ANSYS_FRAMEWORK_SERVER_PORT="):
-                    port = line[28:]
-                    if port.startswith(prefix):
-                        port = port[len(prefix) :]
-                        break
+            # the output is read in a thread for the whole life of the server,
+            # which reports the port line to this thread
+            port_found = threading.Event()
+            self._output_reader = threading.Thread(
+                target=self.__drain_output,
+                args=(process, prefix, port_found),
+                name="wb-server-output",
+                daemon=True,
+            )
+            self._output_reader.start()
+            if port_found.wait(timeout):
+                port = self._port
+            else:
+                logging.error("Failed to start Workbench service within reasonable timeout.")
         if not port or int(port) <= 0:
             logging.error("Failed to retrieve the port used by Workbench service.")
+            self.report_phase("failed", host=host, pid=self._process_id)
             return 0, security
         logging.info("Workbench service uses port: " + port)
+        self.report_phase("port_seen", host=host, pid=self._process_id, port=int(port))
         return int(port), security
 
+    def report_phase(self, phase, **info):
+        """Report a phase of the current launch to the "launch_phase" hooks.
+
+        Parameters
+        ----------
+        phase : str
+            Name of the phase: "started", "process_spawned", "port_seen", "connected",
+            or "failed".
+        **info
+            Details of the launch, such as the ``host``, ``pid``, and ``port``.
+        """
+        if global_hooks:
+            global_hooks.emit("launch_phase", phase, dict(info, launch_id=self.launch_id))
+
+    def configure_output(self, output_lines=1000, forward_output=False):
+        """Change how the output of the server process is kept.
+
+        Parameters
+        ----------
+        output_lines : int, default: 1000
+            Number of the most recent output lines of the server process to keep.
+        forward_output : bool, default: False
+            Whether to also log every output line of the server process to the "WB"
+            logger at the info level.
+        """
+        if output_lines != self._output.maxlen:
+            self._output = deque(self._output, maxlen=output_lines)
+        self._forward_output = forward_output
+
+    def recent_output(self, lines=None):
+        """Return the most recent output lines of the server process.
+
+        Parameters
+        ----------
+        lines : int, default: None
+            Maximum number of lines to return. The default is ``None``, in which case
+            all kept lines are returned.
+
+        Returns
+        -------
+        list of str
+            Output lines, oldest first. The list is empty on Windows, where the output
+            of the server process is not captured.
+        """
+        output = list(self._output)
+        if lines is not None:
+            output = output[-lines:] if lines > 0 else []
+        return output
+
+    def __keep_output(self, line):
+        self._output.append(line)
+        if self._forward_output:
+            logging.getLogger("WB").info(line)
+
+    def __drain_output(self, process, prefix, port_found):
+        """Keep reading the output of the server process until it ends."""
+        try:
+            for line in process.stdout:
+                line = line.rstrip()
+                self.__keep_output(line)
+                if not port_found.is_set() and line.startswith("ANSYS_FRAMEWORK_SERVER_PORT="):
+                    port = line[28:]
+                    if port.startswith(prefix):
+                        self._port = port[len(prefix) :]
+                        port_found.set()
+        except (OSError, ValueError):
+            # the pipe is closed when the process is terminated
+            pass
+        finally:
+            port_found.set()
+
     def __getenv(self, key):
         value = None
         if self._wmi:
@@ -307,33 +445,52 @@ It is highly recommended to only utilize these features on a trusted, secure net
                 if ev.Name == key:
                     value = ev.VariableValue
         elif self._libc:
-            getenv = self._libc.getenv
-            getenv.restype = ctypes.c_char_p
-            value = getenv(key.encode("utf-8"))
+            value = self._libc.getenv(key.encode("utf-8"))
             if value:
                 value = value.decode("utf-8")
         else:
             raise Exception("Code path is unexpected.")
         return value
 
+    def is_running(self):
+        """Return whether the launched Workbench server process is still running.
+
+        Returns
+        -------
+        bool
+            ``True`` if the server process is running, ``False`` if it has exited or
+            was never launched.
+        """
+        if self._process_id <= 0:
+            return False
+        try:
+            if self._wmi:
+                with self.__wmi_session() as connection:
+                    return len(connection.Win32_Process(ProcessId=self._process_id)) > 0
+            return self._process.poll() is None
+        except Exception as ex:
+            logging.info(f"Failed to query process {self._process_id}: {ex}")
+            return False
+
     def exit(self):
         """End the launched Workbench server."""
-        if self._process:
+        if self._process_id > 0:
             try:
                 if self._wmi:
-                    for p in self.__collect_process_tree():
-                        logging.info("Shutting down " + p.Name + " ...")
-                        try:
+                    with self.__wmi_session() as connection:
+                        for p in self.__collect_process_tree():
+                            logging.info("Shutting down " + p.Name + " ...")
+                            try:
+                                p.Terminate()
+                            except Exception as ex:
+                                logging.info(f"Failed to terminate process {p.Name}: {ex}")
+                        for p in connection.Win32_Process(ProcessId=self._process_id):
                             p.Terminate()
-                        except Exception as ex:
-                            logging.info(f"Failed to terminate process {p.Name}: {ex}")
-                    self._process.Terminate()
                 else:
                     self._process.terminate()
             except Exception as ex:
-                logging.info(f"Failed to terminate process {self._process.pid}: {ex}")
+                logging.info(f"Failed to terminate process {self._process_id}: {ex}")
 
-        self._wmi_connection = None
         self._process_id = -1
         self._process = None
 
@@ -0,0 +1,328 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for running scripts on a pool of Workbench servers."""
+
+import atexit
+from collections import deque
+from concurrent.futures import Future
+import logging
+import threading
+import time
+
+import grpc
+
+from ansys.workbench.core.public_api import LaunchWorkbench
+
+
+class _PoolSession:
+    """Workbench session owned by a pool, with its usage counters."""
+
+    def __init__(self, client):
+        self.client = client
+        self.busy_seconds = 0.0
+        self.tasks_done = 0
+
+
+class WorkbenchPool:
+    """Pool of Workbench servers that run independent scripts in parallel.
+
+    The servers are launched in the background with the ``launch_workbench()`` options.
+    Submitted work is queued and dispatched to the idle session with the least busy
+    time. A session whose server stops responding is shut down and replaced by a
+    newly launched one.
+
+    Parameters
+    ----------
+    size : int
+        Number of servers to run. Each server uses one Workbench license, so choose
+        a size that fits both the cores of the machine and the available licenses.
+    **launch_options
+        Options passed to ``launch_workbench()`` for every server, such as ``version``,
+        ``show_gui``, ``client_workdir``, or ``use_insecure_connection``. The default
+        for ``show_gui`` is ``False``.
+
+    Examples
+    --------
+    Run a parameter study on four servers.
+
+    >>> from ansys.workbench.core import WorkbenchPool
+    >>> with WorkbenchPool(4, version="252") as pool:
+    ...     futures = pool.map(study_script, [{"thickness": t} for t in (1, 2, 3, 4, 5)])
+    ...     results = [future.result() for future in futures]
+    """
+
+    def __init__(self, size, **launch_options):
+        launch_options.setdefault("show_gui", False)
+        self._launch_options = launch_options
+        self._lock = threading.Lock()
+        self._sessions = []
+        self._idle = []
+        self._pending = deque()
+        self._launching = 0
+        self._target_size = 0
+        self._closed = False
+        self.resize(size)
+
+    @property
+    def size(self):
+        """Number of servers that the pool keeps running."""
+        return self._target_size
+
+    @property
+    def sessions(self):
+        """Clients of the servers that are currently running."""
+        with self._lock:
+            return [session.client for session in self._sessions]
+
+    def resize(self, size):
+        """Change the number of servers.
+
+        New servers are launched in the background. When shrinking, idle servers are
+        stopped right away and busy servers when they finish their current work.
+
+        Parameters
+        ----------
+        size : int
+            Number of servers to run.
+        """
+        if size < 0:
+            raise ValueError("The pool size cannot be negative.")
+        retired = []
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The Workbench pool is closed.")
+            self._target_size = size
+            missing = size - len(self._sessions) - self._launching
+            while missing < 0 and self._idle:
+                retired.append(self.__remove(self._idle.pop()))
+                missing += 1
+            for _ in range(max(0, missing)):
+                self.__launch()
+        for session in retired:
+            self.__stop(session)
+
+    def submit(self, script, args=None, log_level="error"):
+        """Queue a script to run on the next idle server.
+
+        Parameters
+        ----------
+        script : str, ScriptTemplate, or callable
+            Script to run with ``run_script_string()``, or a function that takes the
+            client of the server as its only argument, for work that needs several calls
+            such as uploading inputs and downloading results.
+        args : dictionary of script variable names and values, default: None
+            Values for the placeholders of the script. Ignored for functions.
+        log_level : str, default: "error"
+            Level of logging. Ignored for functions.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future holding the output of the script or the return value of the function.
+        """
+        if callable(script):
+            task = script
+        else:
+
+            def task(client):
+                return client.run_script_string(script, args, log_level)
+
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The Workbench pool is closed.")
+            if not self._sessions and not self._launching:
+                raise RuntimeError("The Workbench pool has no servers.")
+            self._pending.append((future, task))
+            session = self.__take_idle()
+        if session is not None:
+            self.__start_worker(session)
+        return future
+
+    def map(self, script, args_list, log_level="error"):
+        """Queue the same script with different arguments.
+
+        Parameters
+        ----------
+        script : str, ScriptTemplate, or callable
+            Script to run, as for ``submit()``.
+        args_list : iterable of dictionaries
+            Arguments for each run of the script.
+        log_level : str, default: "error"
+            Level of logging.
+
+        Returns
+        -------
+        list of concurrent.futures.Future
+            Futures in the order of the arguments.
+        """
+        return [self.submit(script, args, log_level) for args in args_list]
+
+    def close(self, wait=True):
+        """Stop all servers of the pool.
+
+        Parameters
+        ----------
+        wait : bool, default: True
+            Whether to finish the queued work first. Otherwise, the queued work is
+            cancelled and only the running scripts are completed.
+        """
+        with self._lock:
+            self._closed = True
+            if not wait:
+                while self._pending:
+                    self._pending.popleft()[0].cancel()
+        while True:
+            with self._lock:
+                if len(self._idle) == len(self._sessions) and (
+                    not self._pending or (not self._sessions and not self._launching)
+                ):
+                    sessions, self._sessions, self._idle = self._sessions, [], []
+                    self._target_size = 0
+                    break
+            time.sleep(0.1)
+        for session in sessions:
+            self.__stop(session)
+
+    def __enter__(self):
+        """Return the pool when entering a context."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop all servers when exiting a context."""
+        self.close()
+
+    def __take_idle(self):
+        """Return the idle session with the least busy time, or ``None``. Requires the lock."""
+        if not self._pending or not self._idle:
+            return None
+        session = min(self._idle, key=lambda s: s.busy_seconds)
+        self._idle.remove(session)
+        return session
+
+    def __start_worker(self, session):
+        threading.Thread(
+            target=self.__work, args=(session,), name="wb-pool-worker", daemon=True
+        ).start()
+
+    def __work(self, session):
+        """Run queued work on a session until the queue is empty."""
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self.__release(session)
+                    return
+                future, task = self._pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            start = time.monotonic()
+            try:
+                result = task(session.client)
+            except grpc.RpcError as ex:
+                future.set_exception(ex)
+                if ex.code() == grpc.StatusCode.UNAVAILABLE:
+                    logging.error(f"A Workbench server of the pool stopped responding: {ex}")
+                    self.__replace(session)
+                    return
+                continue
+            except BaseException as ex:
+                future.set_exception(ex)
+                continue
+            finally:
+                session.busy_seconds += time.monotonic() - start
+            session.tasks_done += 1
+            future.set_result(result)
+
+    def __release(self, session):
+        """Return a session to the idle list or retire it if the pool shrank. Requires the lock."""
+        if len(self._sessions) > self._target_size and not self._closed:
+            self.__remove(session)
+            threading.Thread(target=self.__stop, args=(session,), daemon=True).start()
+        else:
+            self._idle.append(session)
+
+    def __remove(self, session):
+        """Remove a session from the pool. Requires the lock."""
+        self._sessions.remove(session)
+        return session
+
+    def __replace(self, session):
+        """Stop a failed session and launch a new server instead."""
+        with self._lock:
+            self.__remove(session)
+            if not self._closed and len(self._sessions) + self._launching < self._target_size:
+                self.__launch()
+            else:
+                self.__fail_pending_without_servers()
+        self.__stop(session)
+
+    def __launch(self):
+        """Launch a server in the background. Requires the lock."""
+        self._launching += 1
+        threading.Thread(target=self.__launch_session, name="wb-pool-launch", daemon=True).start()
+
+    def __launch_session(self):
+        try:
+            session = _PoolSession(LaunchWorkbench(**self._launch_options))
+        except Exception as ex:
+            logging.error(f"Failed to launch a Workbench server for the pool: {ex}")
+            with self._lock:
+                self._launching -= 1
+                self.__fail_pending_without_servers()
+            return
+        with self._lock:
+            self._launching -= 1
+            self._sessions.append(session)
+            if len(self._sessions) > self._target_size:
+                retire = self.__remove(session)
+            else:
+                retire = None
+                self._idle.append(session)
+                session = self.__take_idle()
+        if retire is not None:
+            self.__stop(retire)
+        elif session is not None:
+            self.__start_worker(session)
+
+    def __fail_pending_without_servers(self):
+        """Fail the queued work if no server is left to run it. Requires the lock."""
+        if self._sessions or self._launching:
+            return
+        while self._pending:
+            future = self._pending.popleft()[0]
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError("No Workbench server of the pool is available."))
+
+    @staticmethod
+    def __stop(session):
+        """Stop the server of a session."""
+        try:
+            session.client.exit()
+        except Exception as ex:
+            logging.warning(f"Failed to stop a Workbench server of the pool: {ex}")
+            atexit.unregister(session.client.exit)
+            session.client._launcher.exit()
+
+
+__all__ = ["WorkbenchPool"]
@@ -0,0 +1,286 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Module for extracting a ZIP archive while it is being downloaded."""
+
+import fnmatch
+import os
+import struct
+import zlib
+
+_LOCAL_HEADER = b"PK\x03\x04"
+_DATA_DESCRIPTOR = b"PK\x07\x08"
+_LOCAL_HEADER_FORMAT = struct.Struct("<4s5H3L2H")
+_ZIP64_EXTRA_ID = 0x0001
+_STORED = 0
+_DEFLATED = 8
+_FLAG_ENCRYPTED = 0x1
+_FLAG_DATA_DESCRIPTOR = 0x8
+
+
+class ZipStreamExtractor:
+    """Extract the members of a ZIP archive from a stream of data chunks.
+
+    The archive is parsed by its local file headers as the data arrives, so members are
+    written straight to the target directory and the archive itself is never stored.
+    Each member is written to a temporary ``.part`` file and renamed when its CRC has
+    been checked. Stored and deflated members are supported, including ZIP64 sizes and
+    deflated members followed by a data descriptor.
+
+    Parameters
+    ----------
+    target_dir : str
+        Directory to extract the members to.
+    include : str or list[str], default: None
+        Patterns of the member paths to extract, such as ``"*.out"``. The default is
+        ``None``, in which case all members are extracted.
+    exclude : str or list[str], default: None
+        Patterns of the member paths to skip, which take precedence over ``include``.
+    """
+
+    def __init__(self, target_dir, include=None, exclude=None):
+        self.target_dir = os.path.abspath(target_dir)
+        self._include = [include] if isinstance(include, str) else include
+        self._exclude = [exclude] if isinstance(exclude, str) else (exclude or [])
+        self._buffer = bytearray()
+        self._state = "header"
+        self._member = None
+        self._file = None
+        self._decompressor = None
+        self._remaining = 0
+        self._crc = 0
+        self.extracted = []
+        """Paths of the extracted members, relative to the target directory."""
+        self.skipped = []
+        """Paths of the members skipped by the filters."""
+
+    def wants(self, name):
+        """Return whether a member passes the include and exclude filters.
+
+        Parameters
+        ----------
+        name : str
+            Path of the member in the archive.
+
+        Returns
+        -------
+        bool
+            Whether the member is extracted.
+        """
+        if self._include is not None and not any(
+            fnmatch.fnmatch(name, pattern) for pattern in self._include
+        ):
+            return False
+        return not any(fnmatch.fnmatch(name, pattern) for pattern in self._exclude)
+
+    def write(self, data):
+        """Process the next chunk of the archive.
+
+        Parameters
+        ----------
+        data : bytes
+            Next chunk of the archive.
+
+        Raises
+        ------
+        ValueError
+            If the data is not a valid archive or uses an unsupported feature.
+        """
+        self._buffer += data
+        while self._buffer and self._state != "done":
+            if self._state == "header":
+                if not self.__read_header():
+                    return
+            elif self._state == "data":
+                self.__read_data()
+                if self._state == "data":
+                    return
+            elif self._state == "descriptor":
+                if not self.__read_descriptor():
+                    return
+
+    def close(self):
+        """Check that the whole archive was received.
+
+        Raises
+        ------
+        ValueError
+            If the archive ended in the middle of a member.
+        """
+        if self._state != "done" and (self._state != "header" or self._buffer):
+            self.abort()
+            raise ValueError("The archive ended in the middle of a member.")
+
+    def abort(self):
+        """Remove the partially extracted member."""
+        if self._file is not None:
+            self._file.close()
+            os.remove(self._file.name)
+            self._file = None
+
+    def __read_header(self):
+        if len(self._buffer) < 4:
+            return False
+        if bytes(self._buffer[:4]) != _LOCAL_HEADER:
+            # the central directory follows the last member
+            self._state = "done"
+            self._buffer.clear()
+            return False
+        if len(self._buffer) < _LOCAL_HEADER_FORMAT.size:
+            return False
+        (
+            _,
+            _,
+            flags,
+            method,
+            _,
+            _,
+            crc,
+            compressed_size,
+            size,
+            name_length,
+            extra_length,
+        ) = _LOCAL_HEADER_FORMAT.unpack_from(self._buffer)
+        header_size = _LOCAL_HEADER_FORMAT.size + name_length + extra_length
+        if len(self._buffer) < header_size:
+            return False
+        name = bytes(self._buffer[30 : 30 + name_length]).decode("utf-8", errors="replace")
+        extra = bytes(self._buffer[30 + name_length : header_size])
+        del self._buffer[:header_size]
+
+        # a ZIP64 extra field also means 8-byte sizes in the data descriptor, even when
+        # the sizes of the local header are zero because the member is streamed
+        zip64_values = self.__zip64_values(extra)
+        zip64 = zip64_values is not None
+        if compressed_size == 0xFFFFFFFF or size == 0xFFFFFFFF:
+            if not zip64:
+                raise ValueError("The archive has an invalid ZIP64 header.")
+            offset = 0
+            if size == 0xFFFFFFFF:
+                size = struct.unpack_from("<Q", zip64_values, offset)[0]
+                offset += 8
+            if compressed_size == 0xFFFFFFFF:
+                compressed_size = struct.unpack_from("<Q", zip64_values, offset)[0]
+        if flags & _FLAG_ENCRYPTED:
+            raise ValueError(f"The archive member {name} is encrypted.")
+        if method not in (_STORED, _DEFLATED):
+            raise ValueError(f"The compression of the archive member {name} is not supported.")
+        streamed = bool(flags & _FLAG_DATA_DESCRIPTOR)
+        if streamed and method == _STORED and not name.endswith("/"):
+            raise ValueError(f"The archive member {name} has no size and cannot be streamed.")
+
+        self._member = {"name": name, "crc": crc, "streamed": streamed, "zip64": zip64}
+        self._remaining = None if streamed else compressed_size
+        self._decompressor = zlib.decompressobj(-15) if method == _DEFLATED else None
+        self._crc = 0
+        self.__open_member(name)
+        self._state = "descriptor" if streamed and method == _STORED else "data"
+        if self._remaining == 0:
+            self.__finish_member(crc)
+        return True
+
+    @staticmethod
+    def __zip64_values(extra):
+        position = 0
+        while position + 4 <= len(extra):
+            field_id, field_length = struct.unpack_from("<2H", extra, position)
+            if field_id == _ZIP64_EXTRA_ID:
+                return extra[position + 4 : position + 4 + field_length]
+            position += 4 + field_length
+        return None
+
+    def __open_member(self, name):
+        relative_path = os.path.normpath(name.replace("\\", "/")).replace(os.sep, "/")
+        if (
+            os.path.isabs(relative_path)
+            or relative_path.startswith("../")
+            or relative_path == ".."
+            or ":" in relative_path
+        ):
+            raise ValueError(f"The archive member {name} points outside the target directory.")
+        if name.endswith("/") or not self.wants(relative_path):
+            if not name.endswith("/"):
+                self.skipped.append(relative_path)
+            self._file = None
+            return
+        file_path = os.path.join(self.target_dir, *relative_path.split("/"))
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        self._file = open(file_path + ".part", mode="wb", buffering=1 << 20)
+        self._member["path"] = file_path
+        self._member["relative_path"] = relative_path
+
+    def __output(self, data):
+        if data:
+            self._crc = zlib.crc32(data, self._crc)
+            if self._file is not None:
+                self._file.write(data)
+
+    def __read_data(self):
+        if self._remaining is not None:
+            count = min(self._remaining, len(self._buffer))
+            chunk = bytes(self._buffer[:count])
+            del self._buffer[:count]
+            self._remaining -= count
+            if self._decompressor is not None:
+                self.__output(self._decompressor.decompress(chunk))
+            else:
+                self.__output(chunk)
+            if self._remaining == 0:
+                if self._decompressor is not None:
+                    self.__output(self._decompressor.flush())
+                self.__finish_member(self._member["crc"])
+            return
+        # deflated member of unknown size: the stream ends where the decompressor stops
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        self.__output(self._decompressor.decompress(chunk))
+        if self._decompressor.eof:
+            self._buffer += self._decompressor.unused_data
+            self._state = "descriptor"
+
+    def __read_descriptor(self):
+        size_length = 8 if self._member["zip64"] else 4
+        signature = 4 if bytes(self._buffer[:4]) == _DATA_DESCRIPTOR else 0
+        needed = signature + 4 + 2 * size_length
+        if len(self._buffer) < max(needed, 4):
+            return False
+        (crc,) = struct.unpack_from("<L", self._buffer, signature)
+        del self._buffer[:needed]
+        self.__finish_member(crc)
+        return True
+
+    def __finish_member(self, crc):
+        if crc != self._crc & 0xFFFFFFFF:
+            self.abort()
+            raise ValueError(f"The archive member {self._member['name']} is corrupted.")
+        if self._file is not None:
+            self._file.close()
+            os.replace(self._file.name, self._member["path"])
+            self._file = None
+            self.extracted.append(self._member["relative_path"])
+        self._member = None
+        self._decompressor = None
+        self._state = "header"
+
+
+__all__ = ["ZipStreamExtractor"]
@@ -0,0 +1,187 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the asynchronous workbench client."""
+
+import asyncio
+import io
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansys.api.workbench.v0 import workbench_pb2 as wb
+from ansys.api.workbench.v0.workbench_pb2_grpc import WorkbenchServiceStub
+from ansys.workbench.core import ChannelOptions, async_workbench_client, connect_workbench_async
+from ansys.workbench.core.async_workbench_client import AsyncWorkbenchClient, _create_aio_channel
+from ansys.workbench.core.fake_server import FakeWorkbenchServer
+
+
+async def _stream(*responses):
+    for response in responses:
+        yield response
+
+
+@pytest.fixture
+def async_client():
+    """Create an asynchronous client with a mocked stub."""
+    client = AsyncWorkbenchClient(
+        local_workdir="/tmp", server_host="localhost", server_port=5000, server_security="insecure"
+    )
+    # grpc.aio channels need a running event loop, so the stub is attached directly
+    client.channel = MagicMock()
+    client.stub = MagicMock()
+    return client, client.stub
+
+
+def test_connect_workbench_async():
+    """Test the connect_workbench_async method."""
+
+    async def run():
+        client = await connect_workbench_async(
+            port=5000, client_workdir="/tmp", host="localhost", security="insecure"
+        )
+        assert isinstance(client, AsyncWorkbenchClient)
+        assert client._is_connected()
+        await client.exit()
+        assert not client._is_connected()
+
+    asyncio.run(run())
+
+
+def test_run_script_string_async(async_client):
+    """Test the asynchronous run_script_string method."""
+    client, stub = async_client
+    stub.RunScript = MagicMock(
+        return_value=_stream(
+            wb.RunScriptResponse(
+                log=wb.RunScriptLog(messages=[wb.LogEntry(level=wb.LOG_INFO, message="hi")])
+            ),
+            wb.RunScriptResponse(result=wb.RunScriptResult(result='{"key": "$$v%%1%%"}')),
+        )
+    )
+    result = asyncio.run(client.run_script_string("print($$v%%1%%)", args={"v": 2}))
+    assert result == {"key": "$$v%%1%%"}
+    assert stub.RunScript.call_args[0][0].content == "print(2)"
+
+
+def test_upload_file_async(async_client, tmp_path):
+    """Test the asynchronous upload_file method."""
+    client, stub = async_client
+    local_file = tmp_path / "model.agdb"
+    local_file.write_bytes(b"x" * 100000)
+    received = []
+
+    async def upload(requests):
+        async for request in requests:
+            received.append(request)
+        return wb.UploadFileResponse(file_name="model.agdb")
+
+    stub.UploadFile = upload
+    asyncio.run(client.upload_file(str(local_file), show_progress=False))
+    assert received[0].file_name == "model.agdb"
+    assert b"".join(r.file_content for r in received[1:]) == local_file.read_bytes()
+
+
+def test_download_file_async(async_client, tmp_path):
+    """Test the asynchronous download_file method."""
+    client, stub = async_client
+    stub.DownloadFile = MagicMock(
+        return_value=_stream(
+            wb.DownloadFileResponse(file_info=wb.DownloadFileInfo(file_size=6)),
+            wb.DownloadFileResponse(file_content=b"abc"),
+            wb.DownloadFileResponse(file_content=b"def"),
+        )
+    )
+    name = asyncio.run(client.download_file("out.txt", show_progress=False, target_dir=tmp_path))
+    assert name == "out.txt"
+    assert (tmp_path / "out.txt").read_bytes() == b"abcdef"
+
+
+def test_aio_channel_security(monkeypatch):
+    """Test that the asynchronous channels are checked like the synchronous ones."""
+    monkeypatch.setattr(async_workbench_client, "_IS_WINDOWS", True)
+    with pytest.raises(ValueError, match="Remote host"):
+        _create_aio_channel("10.0.0.5", 5000, "wnua")
+    monkeypatch.setattr(async_workbench_client, "_IS_WINDOWS", False)
+    with pytest.raises(ValueError, match="only supported on Windows"):
+        _create_aio_channel("localhost", 5000, "wnua")
+    with pytest.raises(ValueError, match="uds_service"):
+        _create_aio_channel("localhost", 0, "uds")
+    with pytest.raises(ValueError):
+        _create_aio_channel("localhost", 5000, "tls")
+
+    async def run():
+        with pytest.warns(UserWarning, match="INSECURE"):
+            channel = _create_aio_channel("localhost", 5000, "insecure")
+        await channel.close()
+
+    asyncio.run(run())
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Unix domain socket paths are POSIX here")
+def test_aio_channel_uds(tmp_path):
+    """Test running a script over a Unix domain socket."""
+    socket_path = str(tmp_path / "wb.sock")
+
+    async def run():
+        client = AsyncWorkbenchClient(str(tmp_path), "localhost", 0, "uds")
+        client.channel = _create_aio_channel(None, None, "uds", uds_full_path=socket_path)
+        client.stub = WorkbenchServiceStub(client.channel)
+        result = await client.run_script_string("wb_script_result = '42'")
+        await client._disconnect()
+        return result
+
+    with FakeWorkbenchServer(uds_path=socket_path):
+        assert asyncio.run(run()) == 42
+
+
+def test_upload_read_ahead_async(async_client, tmp_path, monkeypatch):
+    """Test that a stopped upload waits for the running read before closing the file."""
+    client, stub = async_client
+    client._channel_options = ChannelOptions(upload_chunk_size=1000, upload_read_ahead=1)
+    local_file = tmp_path / "mesh.msh"
+    local_file.write_bytes(b"x" * 100000)
+    reads = []
+
+    class SlowFile(io.FileIO):
+        def read(self, size=-1):
+            time.sleep(0.05)
+            data = super().read(size)
+            reads.append(self.closed)
+            return data
+
+    monkeypatch.setattr(
+        async_workbench_client, "open", lambda path, mode: SlowFile(path, mode), raising=False
+    )
+
+    async def upload(requests):
+        async for request in requests:
+            if request.file_content:
+                break
+        await requests.aclose()
+        return wb.UploadFileResponse(file_name="mesh.msh")
+
+    stub.UploadFile = upload
+    asyncio.run(client.upload_file(str(local_file), show_progress=False))
+    assert len(reads) == 2 and not any(reads)
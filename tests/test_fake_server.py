@@ -0,0 +1,281 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the client against the local stand-in Workbench server."""
+
+import hashlib
+import io
+import json
+import os
+import platform
+import zipfile
+
+import grpc
+import pytest
+
+from ansys.workbench.core.chrome_trace import ChromeTraceExporter
+from ansys.workbench.core.fake_server import FakeWorkbenchServer
+
+
+@pytest.fixture
+def server():
+    """Start a stand-in server on a loopback port."""
+    with FakeWorkbenchServer(chunk_size=4096) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server, tmp_path):
+    """Connect a client to the stand-in server."""
+    client = server.connect(str(tmp_path))
+    yield client
+    client._disconnect()
+
+
+def test_run_script(server, client):
+    """Test running scripts, including errors and server information."""
+    assert client.run_script_string("import json\nwb_script_result = json.dumps($$x%%1%% * 2)") == 2
+    assert client.run_script_string("raise ValueError('bad')") is None
+    assert client.server_version == 252
+    assert client.server_info.working_directory == server.working_directory
+    assert server.calls["RunScript"] == 3
+
+    # the project path is read again after saving under a new name
+    assert client.project_path == os.path.join(server.working_directory, "wbnew.wbpj")
+    saved = os.path.join(server.working_directory, "saved.wbpj")
+    client.run_script_string(f"Save(FilePath={saved!r})")
+    assert client.project_path == saved
+
+
+def test_upload_and_download(server, client, tmp_path):
+    """Test transferring files in both directions."""
+    content = os.urandom(100000)
+    (tmp_path / "model.agdb").write_bytes(content)
+    client.upload_file("model.agdb", show_progress=False)
+    assert server.bytes_received == len(content)
+    os.remove(tmp_path / "model.agdb")
+    assert client.download_file("model.agdb", show_progress=False, verify=True) == "model.agdb"
+    assert (tmp_path / "model.agdb").read_bytes() == content
+
+    (tmp_path / "notes.txt").write_text("notes")
+    client.upload_file("notes.txt", show_progress=False)
+    assert client.download_file("*.*", show_progress=False) == "_._.zip"
+    with zipfile.ZipFile(tmp_path / "_._.zip") as archive:
+        assert sorted(archive.namelist()) == ["model.agdb", "notes.txt"]
+
+
+def test_extract_download(server, client, tmp_path):
+    """Test extracting a wildcard download while it is received."""
+    for name in ("a.out", "b.out", "c.log"):
+        with open(os.path.join(server.working_directory, name), "wb") as f:
+            f.write(os.urandom(30000))
+    target = tmp_path / "results"
+    reports = []
+    extracted = client.download_file(
+        "*.*",
+        show_progress=lambda tracker: reports.append((tracker.done, tracker.total)),
+        target_dir=str(target),
+        extract=True,
+        exclude="b.*",
+    )
+    assert extracted == ["a.out", "c.log"]
+    assert reports[-1][0] == reports[-1][1] > 0
+    assert sorted(os.listdir(target)) == ["a.out", "c.log"]
+    with open(os.path.join(server.working_directory, "a.out"), "rb") as f:
+        assert (target / "a.out").read_bytes() == f.read()
+    assert client.download_file("*.log", show_progress=False, extract=True, include="*.out") == []
+    assert not (tmp_path / "_.log.zip").exists()
+
+
+def test_in_memory_transfers(server, client, tmp_path):
+    """Test uploading from and downloading to memory without local files."""
+    content = os.urandom(50000)
+    result = client.upload_bytes("data.bin", memoryview(bytearray(content)), show_progress=False)
+    assert result.name == "data.bin" and result.bytes == len(content)
+    stream = io.BytesIO(b"header" + content)
+    stream.seek(6)
+    assert client.upload_from(stream, "copy.bin", show_progress=False).error is None
+    assert not stream.closed
+
+    assert client.download_bytes("copy.bin", show_progress=False) == content
+    buffer = bytearray(len(content) + 10)
+    assert client.download_to(memoryview(buffer), "data.bin", show_progress=False) == len(content)
+    assert buffer[: len(content)] == content
+    sink = bytearray()
+    client.download_to(sink, "*.bin", show_progress=False)
+    with zipfile.ZipFile(io.BytesIO(sink)) as archive:
+        assert sorted(archive.namelist()) == ["copy.bin", "data.bin"]
+    with pytest.raises(ValueError):
+        client.download_to(memoryview(bytearray(10)), "data.bin", show_progress=False)
+    assert client.download_bytes("missing.bin", show_progress=False) is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_read_ahead_upload(server, tmp_path):
+    """Test uploading with read-ahead and adaptive chunk sizes."""
+    client = server.connect(str(tmp_path), channel_options="high_throughput")
+    try:
+        content = os.urandom(12 << 20)
+        (tmp_path / "mesh.msh").write_bytes(content)
+        (result,) = client.upload_file("mesh.msh", show_progress=False)
+        assert result.error is None and result.bytes == len(content)
+        with open(os.path.join(server.working_directory, "mesh.msh"), "rb") as f:
+            assert f.read() == content
+    finally:
+        client._disconnect()
+
+
+def test_resume_after_injected_failure(server, client, tmp_path):
+    """Test resuming a download that failed in the middle of the stream."""
+    content = os.urandom(200000)
+    with open(os.path.join(server.working_directory, "result.rst"), "wb") as f:
+        f.write(content)
+    server.fail_next("DownloadFile", after_bytes=100000)
+    with pytest.raises(grpc.RpcError) as error:
+        client.download_file("result.rst", show_progress=False, resume=True)
+    assert error.value.code() == grpc.StatusCode.UNAVAILABLE
+    assert client.download_file("result.rst", show_progress=False, resume=True) == "result.rst"
+    downloaded = (tmp_path / "result.rst").read_bytes()
+    assert hashlib.sha256(downloaded).digest() == hashlib.sha256(content).digest()
+    assert server.bytes_sent < 2 * len(content)
+
+
+def test_sync_directory(server, client, tmp_path, monkeypatch):
+    """Test uploading only the changes of a directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    inputs = tmp_path / "inputs"
+    (inputs / "mesh").mkdir(parents=True)
+    for name in ("setup.jou", "material.xml", "mesh/part.msh"):
+        (inputs / name).write_bytes(os.urandom(20000))
+    result = client.sync_directory("inputs", "study", show_progress=False)
+    assert sorted(result.uploaded) == ["material.xml", "mesh/part.msh", "setup.jou"]
+    assert result.bytes_uploaded == 60000 and result.bytes_saved == 0
+
+    (inputs / "setup.jou").write_bytes(os.urandom(20000))
+    (inputs / "notes.txt").write_text("new")
+    os.remove(inputs / "mesh" / "part.msh")
+    server.fail_next("UploadFile")
+    result = client.sync_directory("inputs", "study", delete=True, max_workers=1)
+    assert result.failed == ["notes.txt"]
+    assert result.uploaded == ["setup.jou"]
+    assert result.unchanged == ["material.xml"]
+    assert result.deleted == ["mesh/part.msh"]
+    assert result.bytes_saved == 20000
+
+    study = os.path.join(server.working_directory, "study")
+    assert sorted(os.listdir(study)) == ["material.xml", "setup.jou"]
+    with open(os.path.join(study, "setup.jou"), "rb") as f:
+        assert f.read() == (inputs / "setup.jou").read_bytes()
+    assert os.listdir(server.working_directory) == ["study"]
+    assert client.sync_directory("inputs", "../outside") is None
+    assert client.sync_directory("inputs", delete=True) is None
+    assert client.sync_directory("inputs", "./.", delete=True) is None
+    assert os.listdir(server.working_directory) == ["study"]
+
+
+def test_rpc_stats(server, client, tmp_path):
+    """Test the statistics of the gRPC calls of the client."""
+    client.run_script_string("wb_script_result = '1'")
+    client.run_script_string("raise ValueError('bad')")
+    (tmp_path / "mesh.msh").write_bytes(os.urandom(10000))
+    client.upload_file("mesh.msh", show_progress=False)
+    client.download_file("mesh.msh", show_progress=False)
+    server.fail_next("DownloadFile")
+    with pytest.raises(grpc.RpcError):
+        client.download_file("mesh.msh", show_progress=False)
+
+    stats = client.stats()
+    run_script = stats["methods"]["RunScript"]
+    assert run_script["calls"] == 2
+    assert run_script["errors"] == {"SERVER_ERROR": 1}
+    assert run_script["bytes_sent"] > 0 and run_script["bytes_received"] > 0
+    assert sum(run_script["histogram"].values()) == 2
+    assert stats["methods"]["UploadFile"]["bytes_sent"] == 10000
+    assert stats["methods"]["UploadFile"]["chunks"] == 1
+    download = stats["methods"]["DownloadFile"]
+    assert download["bytes_received"] == 10000
+    assert download["errors"] == {"UNAVAILABLE": 1}
+    assert stats["totals"]["calls"] == 5
+    assert 0 < stats["totals"]["p50_ms"] <= stats["totals"]["max_ms"]
+
+    client.reset_stats()
+    assert client.stats()["totals"]["calls"] == 0
+
+
+def test_hooks_and_trace(server, client, tmp_path):
+    """Test the call hooks of a client and the Chrome trace exporter."""
+    events = []
+    client.add_hook("rpc_start", lambda call: events.append(("start", call.method)))
+    client.add_hook("rpc_end", lambda call: events.append(("end", call.method, call.error)))
+    client.add_hook("rpc_chunk", lambda call, size: 1 / 0)
+    trace = ChromeTraceExporter(str(tmp_path / "trace.json"), chunks=True)
+    with trace:
+        (tmp_path / "input.dat").write_bytes(os.urandom(10000))
+        client.upload_file("input.dat", show_progress=False)
+        client.run_script_string("raise ValueError('bad')")
+    assert events == [
+        ("start", "UploadFile"),
+        ("end", "UploadFile", None),
+        ("start", "RunScript"),
+        ("end", "RunScript", "SERVER_ERROR"),
+    ]
+
+    with open(tmp_path / "trace.json") as f:
+        trace_events = json.load(f)["traceEvents"]
+    spans = [event for event in trace_events if event["ph"] == "X"]
+    assert [span["name"] for span in spans] == ["UploadFile", "RunScript"]
+    assert spans[0]["args"]["bytes_sent"] == 10000
+    assert spans[1]["args"]["error"] == "SERVER_ERROR"
+    counters = [event["args"] for event in trace_events if event["ph"] == "C"]
+    assert {"UploadFile": 10000} in counters
+    assert any(event["ph"] == "M" for event in trace_events)
+
+    client.run_script_string("wb_script_result = '1'")
+    assert len(trace.events) == len(trace_events) - 1
+
+
+def test_log_flood():
+    """Test that log messages are sent only for verbose requests."""
+    server_log = FakeWorkbenchServer(log_messages=250).start()
+    try:
+        chatty = server_log.connect()
+        chatty.run_script_string("wb_script_result = '1'", log_level="info")
+        chatty.flush_server_log(timeout=10)
+        assert chatty.server_log_stats()["forwarded"] + chatty.server_log_stats()["dropped"] == 250
+        assert chatty.stats()["methods"]["RunScript"]["log_messages"] == 250
+        chatty.run_script_string("wb_script_result = '1'")
+        chatty.flush_server_log(timeout=10)
+        assert chatty.server_log_stats()["forwarded"] + chatty.server_log_stats()["dropped"] == 250
+        chatty._disconnect()
+    finally:
+        server_log.stop()
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Unix domain sockets only")
+def test_unix_domain_socket(tmp_path):
+    """Test serving on a Unix domain socket."""
+    with FakeWorkbenchServer(uds_path=str(tmp_path / "wb.sock")) as server:
+        client = server.connect(str(tmp_path))
+        assert client.run_script_string("wb_script_result = '[1, 2]'") == [1, 2]
+        client._disconnect()
@@ -0,0 +1,86 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the import time of the package."""
+
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_TIME_BUDGET_MS = 50
+"""Maximum time to import ``ansys.workbench.core``, with a wide margin for slow machines."""
+
+
+def _import_in_subprocess(statement):
+    """Run an import in a fresh interpreter and return its stderr and loaded modules."""
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sorted(sys.modules)))"
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return process.stderr, set(process.stdout.split())
+
+
+def _cumulative_ms(importtime_output, module):
+    """Return the cumulative import time of a module from the -X importtime output."""
+    for line in importtime_output.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+    raise AssertionError(f"{module} not found in the import time output")
+
+
+def test_package_import_budget():
+    """Test that importing the package loads no heavy dependencies."""
+    importtime, modules = _import_in_subprocess("import ansys.workbench.core")
+    for heavy in (
+        "grpc",
+        "google.protobuf",
+        "asyncio",
+        "ctypes",
+        "requests",
+        "tqdm",
+        "ansys.tools.common.cyberchannel",
+        "ansys.workbench.core.public_api",
+        "ansys.workbench.core.workbench_launcher",
+    ):
+        assert heavy not in modules
+    assert _cumulative_ms(importtime, "ansys.workbench.core") < IMPORT_TIME_BUDGET_MS
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from ansys.workbench.core import launch_workbench",
+        "from ansys.workbench.core import connect_workbench",
+    ],
+)
+def test_client_import_defers_optional_dependencies(statement):
+    """Test that the client loads tqdm and the example downloader only when used."""
+    _, modules = _import_in_subprocess(statement)
+    assert "grpc" in modules
+    for deferred in ("tqdm", "requests", "ansys.tools.common.example_download"):
+        assert deferred not in modules
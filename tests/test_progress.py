@@ -0,0 +1,131 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the progress reporting of file transfers."""
+
+import logging
+
+import pytest
+
+from ansys.workbench.core.fake_server import FakeWorkbenchServer
+from ansys.workbench.core.progress import (
+    CallbackProgress,
+    LoggingProgress,
+    ProgressReporter,
+    SilentProgress,
+    TqdmProgress,
+    get_progress_reporter,
+    set_default_progress,
+    track_progress,
+)
+
+
+class _CountingReporter(ProgressReporter):
+    def __init__(self, interval):
+        self.interval = interval
+        self.calls = []
+
+    def start(self, tracker):
+        self.calls.append(("start", tracker.done))
+
+    def update(self, tracker):
+        self.calls.append(("update", tracker.done))
+
+    def finish(self, tracker):
+        self.calls.append(("finish", tracker.done))
+
+
+def test_get_progress_reporter():
+    """Test resolving the show_progress argument."""
+    assert get_progress_reporter(False) is None
+    assert get_progress_reporter(None) is None
+    assert isinstance(get_progress_reporter(True), TqdmProgress)
+    assert isinstance(get_progress_reporter("logging"), LoggingProgress)
+    assert isinstance(get_progress_reporter("silent"), SilentProgress)
+    assert isinstance(get_progress_reporter(print), CallbackProgress)
+    reporter = SilentProgress()
+    assert get_progress_reporter(reporter) is reporter
+    with pytest.raises(ValueError):
+        get_progress_reporter("bars")
+    set_default_progress("silent")
+    try:
+        assert isinstance(get_progress_reporter(True), SilentProgress)
+    finally:
+        set_default_progress(None)
+    assert isinstance(get_progress_reporter(True), TqdmProgress)
+
+
+def test_updates_are_throttled():
+    """Test that chunks are counted without updating the reporter for each one."""
+    reporter = _CountingReporter(interval=3600)
+    tracker = track_progress(reporter, "Uploading", total=1000 * 65536)
+    for _ in range(1000):
+        tracker.advance(65536)
+    tracker.close()
+    tracker.close()
+    assert reporter.calls == [("start", 0), ("finish", 1000 * 65536)]
+
+    reporter = _CountingReporter(interval=0)
+    tracker = track_progress(reporter, "Uploading", total=3)
+    for _ in range(3):
+        tracker.advance(1)
+    tracker.close()
+    assert reporter.calls == [
+        ("start", 0),
+        ("update", 1),
+        ("update", 2),
+        ("update", 3),
+        ("finish", 3),
+    ]
+
+
+def test_logging_progress(caplog):
+    """Test reporting the progress to a logger."""
+    tracker = track_progress(
+        LoggingProgress(interval=0), "Downloading result.rst", total=4 << 20, initial=1 << 20
+    )
+    with caplog.at_level(logging.INFO):
+        tracker.advance(1 << 20)
+        tracker.close()
+    assert "Downloading result.rst: transferred 2.0 of 4.0 MB (50%)" in caplog.records[0].message
+    assert "finished after 2.0 of 4.0 MB" in caplog.records[1].message
+
+
+def test_transfer_totals(tmp_path):
+    """Test that a transfer of several files reports combined totals."""
+    for i in range(3):
+        (tmp_path / f"part{i}.prt").write_bytes(b"x" * 100000)
+    reports = []
+    with FakeWorkbenchServer() as server:
+        client = server.connect(str(tmp_path))
+        client.upload_file(
+            "part?.prt",
+            show_progress=CallbackProgress(
+                lambda tracker: reports.append((tracker.done, tracker.files_done)), interval=0
+            ),
+            max_workers=3,
+        )
+        assert client.download_file("part0.prt", show_progress="silent") == "part0.prt"
+        client._disconnect()
+    assert reports[-1] == (300000, 3)
+    assert all(done <= 300000 for done, _ in reports)
@@ -0,0 +1,66 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for script templates."""
+
+import pytest
+
+from ansys.workbench.core.script_template import ScriptTemplate, get_script_template
+
+
+def test_render_arguments_and_defaults():
+    """Test that arguments replace placeholders and missing arguments use defaults."""
+    template = ScriptTemplate(
+        "a=$$a%%1%%\nb=$$b%%two words%%\nc='$$c%%%%'\nd=$$a%%9%%\nplain $$ text %% here"
+    )
+    assert template.names == {"a", "b", "c"}
+    assert template.render() == "a=1\nb=two words\nc=''\nd=9\nplain $$ text %% here"
+    assert template.render({"a": 5, "c": "x", "unused": 0}) == (
+        "a=5\nb=two words\nc='x'\nd=5\nplain $$ text %% here"
+    )
+
+
+def test_render_values_are_literal():
+    """Test that argument values are inserted as is."""
+    template = ScriptTemplate('path=r"$$path%%%%"')
+    assert template.render({"path": r"C:\temp\1"}) == r'path=r"C:\temp\1"'
+    assert template.render({"path": "$$other%%1%%"}) == 'path=r"$$other%%1%%"'
+
+
+def test_literal_template():
+    """Test that a literal template keeps placeholder-like text."""
+    template = ScriptTemplate.literal("x=$$x%%1%%")
+    assert template.names == frozenset()
+    assert template.render() == "x=$$x%%1%%"
+
+
+def test_render_rejects_illegal_names():
+    """Test that illegal argument names are rejected."""
+    with pytest.raises(ValueError):
+        ScriptTemplate("x=$$x%%1%%").render({"x-y": 1})
+
+
+def test_templates_are_cached():
+    """Test that the same script text reuses the parsed template."""
+    script = "x=$$x%%1%%"
+    assert get_script_template(script) is get_script_template(script)
@@ -0,0 +1,124 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the server log forwarding."""
+
+import logging
+import threading
+
+from ansys.workbench.core.server_log import ServerLogForwarder
+
+
+class _SlowHandler(logging.Handler):
+    """Handler that waits until it is released before recording messages."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.gate.wait(timeout=5)
+        self.messages.append(record.getMessage())
+
+
+def _make_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.handlers = [handler]
+    return logger
+
+
+def test_forwarder_does_not_wait_for_handlers():
+    """Test that submitting messages does not wait for a slow handler."""
+    handler = _SlowHandler()
+    forwarder = ServerLogForwarder(_make_logger("test_forward_slow", handler), max_queue_size=3)
+    for index in range(10):
+        forwarder.submit(logging.INFO, f"message {index}")
+    handler.gate.set()
+    assert forwarder.flush(timeout=5)
+    counters = forwarder.counters()
+    assert counters["dropped"] > 0
+    assert counters["forwarded"] + counters["dropped"] == 10
+    assert counters["queued"] == 0
+    assert handler.messages[0] == "message 0"
+
+
+def test_forwarder_sampling_keeps_warnings():
+    """Test that sampling under pressure never drops warnings."""
+    handler = _SlowHandler()
+    forwarder = ServerLogForwarder(
+        _make_logger("test_forward_sample", handler),
+        max_queue_size=100,
+        overflow="sample",
+        sample_rate=5,
+    )
+    for index in range(60):
+        forwarder.submit(logging.DEBUG, f"debug {index}")
+    forwarder.submit(logging.WARNING, "warning")
+    handler.gate.set()
+    assert forwarder.flush(timeout=5)
+    assert "warning" in handler.messages
+    assert 50 < len(handler.messages) < 60
+    assert forwarder.counters()["dropped"] == 61 - len(handler.messages)
+
+
+def test_forwarder_block_keeps_all_messages():
+    """Test that the blocking policy writes every message."""
+    handler = _SlowHandler()
+    handler.gate.set()
+    forwarder = ServerLogForwarder(
+        _make_logger("test_forward_block", handler), max_queue_size=2, overflow="block"
+    )
+    for index in range(50):
+        forwarder.submit(logging.ERROR, f"error {index}")
+    assert forwarder.flush(timeout=5)
+    assert handler.messages == [f"error {index}" for index in range(50)]
+    assert forwarder.counters()["dropped"] == 0
+
+
+def test_forwarder_counters_from_many_threads():
+    """Test that messages submitted from many threads are all counted."""
+    handler = _SlowHandler()
+    handler.gate.set()
+    forwarder = ServerLogForwarder(
+        _make_logger("test_forward_threads", handler),
+        max_queue_size=20,
+        overflow="sample",
+        sample_rate=3,
+    )
+
+    def submit_many():
+        for index in range(500):
+            forwarder.submit(logging.DEBUG, f"debug {index}")
+
+    threads = [threading.Thread(target=submit_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert forwarder.flush(timeout=5)
+    counters = forwarder.counters()
+    assert counters["forwarded"] == len(handler.messages)
+    assert counters["forwarded"] + counters["dropped"] == 4000
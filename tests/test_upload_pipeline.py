@@ -0,0 +1,104 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for reading files ahead of the upload stream."""
+
+import io
+import os
+import threading
+import time
+
+import pytest
+
+from ansys.workbench.core.upload_pipeline import ChunkSizeTuner, read_chunks
+
+
+@pytest.mark.parametrize("read_ahead", [0, 3])
+def test_read_chunks(read_ahead):
+    """Test reading a file in chunks, with and without a read-ahead thread."""
+    content = os.urandom(100000)
+    chunks = list(read_chunks(io.BytesIO(content), 30000, read_ahead))
+    assert [len(chunk) for chunk in chunks] == [30000, 30000, 30000, 10000]
+    assert b"".join(chunks) == content
+
+
+def test_read_chunks_errors_and_close():
+    """Test that read errors reach the consumer and closing stops the reader thread."""
+
+    class FailingFile(io.BytesIO):
+        def read(self, size=-1):
+            if self.tell() >= 20000:
+                raise OSError("disk error")
+            return super().read(size)
+
+    with pytest.raises(OSError, match="disk error"):
+        list(read_chunks(FailingFile(os.urandom(50000)), 10000, read_ahead=2))
+
+    chunks = read_chunks(io.BytesIO(os.urandom(1 << 20)), 1000, read_ahead=2)
+    next(chunks)
+    chunks.close()
+    assert not any(thread.name == "wb-read-ahead" for thread in threading.enumerate())
+
+
+def test_read_chunks_blocked_reader():
+    """Test that closing the stream does not wait for a reader blocked in read()."""
+    release = threading.Event()
+
+    class BlockingFile(io.RawIOBase):
+        def __init__(self):
+            self.reads = 0
+
+        def read(self, size=-1):
+            self.reads += 1
+            if self.reads > 1:
+                release.wait(10)
+            return b"x" * size
+
+    chunks = read_chunks(BlockingFile(), 1000, read_ahead=1)
+    next(chunks)
+    start = time.perf_counter()
+    chunks.close()
+    assert time.perf_counter() - start < 5
+    release.set()
+
+
+def test_chunk_size_tuner(monkeypatch):
+    """Test that the chunk size follows the throughput and stays within bounds."""
+    clock = [0.0]
+    monkeypatch.setattr("time.perf_counter", lambda: clock[0])
+    tuner = ChunkSizeTuner(1 << 16, max_chunk_size=1 << 20, window_chunks=2)
+
+    def window(bytes_per_second):
+        for _ in range(2):
+            clock[0] += tuner.chunk_size / bytes_per_second
+            tuner.record(tuner.chunk_size)
+        return tuner.chunk_size
+
+    tuner.record(0)
+    assert window(100e6) == 1 << 17
+    assert window(200e6) == 1 << 18
+    assert window(100e6) == 1 << 17
+    assert window(101e6) == 1 << 17
+    for _ in range(20):
+        window(1e9)
+        assert 1 << 16 <= tuner.chunk_size <= 1 << 20
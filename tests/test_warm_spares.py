@@ -0,0 +1,165 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the warm spare Workbench servers."""
+
+import asyncio
+import atexit
+import logging
+import time
+from unittest.mock import patch
+
+import grpc
+import pytest
+
+from ansys.workbench.core import disable_warm_spares, enable_warm_spares, launch_workbench
+from ansys.workbench.core.warm_spares import WarmSparePool
+
+
+def _wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def spare_launcher():
+    """Replace the server launch and warm-up of the spares."""
+    with (
+        patch("ansys.workbench.core.warm_spares.Launcher") as launcher,
+        patch("ansys.workbench.core.warm_spares.create_channel"),
+        patch("ansys.workbench.core.warm_spares.WorkbenchServiceStub") as stub,
+        patch("ansys.workbench.core.warm_spares.grpc.channel_ready_future"),
+    ):
+        launcher.return_value.launch.return_value = (5000, "insecure")
+        stub.return_value.RunScript.return_value = []
+        yield launcher, stub
+
+
+def test_launch_workbench_uses_warm_spare(spare_launcher):
+    """Test that launch_workbench hands out a ready spare and launches a replacement."""
+    launcher, stub = spare_launcher
+    enable_warm_spares(1, show_gui=False, use_insecure_connection=True)
+    try:
+        from ansys.workbench.core import public_api
+
+        assert _wait_for(lambda: public_api._warm_spares.ready == 1)
+        assert stub.return_value.RunScript.call_args.args[0].content == "Reset()"
+        with patch("ansys.workbench.core.public_api.Launcher") as cold_launcher:
+            cold_launcher.return_value.launch.return_value = (5001, "insecure")
+            wb = launch_workbench(show_gui=False, use_insecure_connection=True)
+            atexit.unregister(wb.exit)
+            cold_launcher.assert_not_called()
+            assert wb._launcher is launcher.return_value
+            assert wb._server_port == 5000
+            launcher.return_value.configure_output.assert_called_with(1000, False)
+            assert _wait_for(lambda: launcher.call_count == 2)
+
+            wb = launch_workbench(show_gui=True, use_insecure_connection=True)
+            atexit.unregister(wb.exit)
+            cold_launcher.assert_called_once()
+    finally:
+        disable_warm_spares()
+    launcher.return_value.exit.assert_called()
+
+
+def test_idle_spares_are_retired(spare_launcher):
+    """Test that unused spares are stopped after the idle timeout."""
+    launcher, _ = spare_launcher
+    pool = WarmSparePool(2, idle_timeout=0.05)
+    assert _wait_for(lambda: launcher.return_value.exit.call_count == 2)
+    assert pool.ready == 0
+    assert pool.take() is None
+    assert _wait_for(lambda: launcher.call_count == 4)
+    pool.close()
+
+
+def test_dead_spare_is_discarded(spare_launcher):
+    """Test that a spare whose server has stopped is not handed out."""
+    launcher, _ = spare_launcher
+    pool = WarmSparePool(1)
+    assert _wait_for(lambda: pool.ready == 1)
+    launcher.return_value.is_running.return_value = False
+    assert pool.take() is None
+    launcher.return_value.exit.assert_called()
+    assert _wait_for(lambda: pool.ready == 1)
+
+    launcher.return_value.is_running.return_value = True
+    with patch(
+        "ansys.workbench.core.warm_spares.grpc.channel_ready_future",
+        side_effect=grpc.FutureTimeoutError(),
+    ):
+        assert pool.take() is None
+    assert _wait_for(lambda: pool.ready == 1)
+    assert pool.take() == (launcher.return_value, 5000, "insecure")
+    pool.close()
+
+
+def test_spares_do_not_add_log_handlers(spare_launcher):
+    """Test that launching and checking spares leaves the "WB" logger alone."""
+    handlers = list(logging.getLogger("WB").handlers)
+    pool = WarmSparePool(2)
+    assert _wait_for(lambda: pool.ready == 2)
+    assert pool.take() is not None
+    assert _wait_for(lambda: pool.ready == 2)
+    pool.close()
+    assert logging.getLogger("WB").handlers == handlers
+
+
+def test_failed_spare_launch(spare_launcher):
+    """Test that a spare that fails to start is not handed out."""
+    launcher, _ = spare_launcher
+    launcher.return_value.launch.return_value = (0, "mtls")
+    pool = WarmSparePool(1)
+    assert _wait_for(lambda: launcher.return_value.exit.called)
+    assert pool.take() is None
+    pool.close()
+    with pytest.raises(ValueError):
+        WarmSparePool(1, port=5000)
+
+
+def test_matches_launch_options():
+    """Test matching the launch options of a spare."""
+    with patch.object(WarmSparePool, "_WarmSparePool__top_up"):
+        pool = WarmSparePool(1, version="252", show_gui=False)
+        assert pool.matches(version="252", show_gui=False, host=None)
+        assert not pool.matches(version="252")
+        pool.close()
+
+
+def test_launch_workbench_async_uses_warm_spare(spare_launcher):
+    """Test that launch_workbench_async hands out a ready spare too."""
+    launcher, _ = spare_launcher
+    enable_warm_spares(1, show_gui=False, use_insecure_connection=True)
+    try:
+        from ansys.workbench.core import launch_workbench_async, public_api
+
+        assert _wait_for(lambda: public_api._warm_spares.ready == 1)
+        with patch("ansys.workbench.core.public_api.Launcher") as cold_launcher:
+            wb = asyncio.run(launch_workbench_async(show_gui=False, use_insecure_connection=True))
+            atexit.unregister(wb._launcher.exit)
+            cold_launcher.assert_not_called()
+            assert wb._launcher is launcher.return_value
+    finally:
+        disable_warm_spares()
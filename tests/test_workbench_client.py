@@ -22,14 +22,19 @@
 
 """Tests for workbench client."""
 
+import hashlib
+import json
+import os
 import pathlib
 import tempfile
 from unittest.mock import MagicMock, patch
 
+import grpc
 import pytest
 
-from ansys.workbench.core import connect_workbench
-from ansys.workbench.core.workbench_client import WorkbenchClient
+from ansys.api.workbench.v0 import workbench_pb2 as wb
+from ansys.workbench.core import ChannelOptions, connect_workbench
+from ansys.workbench.core.workbench_client import ServerInfo, WorkbenchClient
 
 
 # Mock grpc and other dependencies
@@ -288,3 +293,463 @@ def test_download_file(mock_workbench_service_stub):
     # Assertions
     assert mock_stub.DownloadFile.call_count == 1
     assert mock_response_1.file_info.file_size == 200  # Ensure the file size is set correctly
+
+
+def test_upload_file_parallel(mock_workbench_service_stub, tmp_path):
+    """Test uploading several files concurrently."""
+    client = WorkbenchClient(
+        local_workdir=str(tmp_path),
+        server_host="localhost",
+        server_port=5000,
+        server_security="insecure",
+    )
+    client._connect()
+    for i in range(5):
+        (tmp_path / f"part{i}.prt").write_bytes(b"p" * (70000 + i))
+    received = {}
+
+    def upload(requests):
+        requests = list(requests)
+        name = requests[0].file_name
+        received[name] = b"".join(r.file_content for r in requests[1:])
+        response = MagicMock()
+        response.error = "disk full" if name == "part3.prt" else ""
+        response.file_name = name
+        return response
+
+    mock_workbench_service_stub.return_value.UploadFile.side_effect = upload
+    results = client.upload_file("part?.prt", show_progress=True, max_workers=4)
+
+    assert sorted(r.name for r in results) == [f"part{i}.prt" for i in range(5)]
+    for result in results:
+        assert result.bytes == len(received[result.name])
+        assert result.seconds >= 0
+    assert [r.name for r in results if r.error] == ["part3.prt"]
+
+    # an error without a message still fails the upload
+    mock_workbench_service_stub.return_value.UploadFile.side_effect = grpc.RpcError()
+    results = client.upload_file("part0.prt", show_progress=False)
+    assert [r.error for r in results] == ["RpcError"]
+
+
+def test_download_file_single_writer(mock_workbench_service_stub, tmp_path):
+    """Test that a download is written through a temporary file and renamed at the end."""
+    client = WorkbenchClient(
+        local_workdir=str(tmp_path),
+        server_host="localhost",
+        server_port=5000,
+        server_security="insecure",
+    )
+    client._connect()
+    (tmp_path / "solve.out").write_bytes(b"old content that is longer")
+    mock_workbench_service_stub.return_value.DownloadFile.return_value = [
+        wb.DownloadFileResponse(file_info=wb.DownloadFileInfo(file_size=12)),
+        wb.DownloadFileResponse(file_content=b"abcdef"),
+        wb.DownloadFileResponse(file_content=b"ghijkl"),
+    ]
+    assert client.download_file("solve.out", show_progress=False) == "solve.out"
+    assert (tmp_path / "solve.out").read_bytes() == b"abcdefghijkl"
+    assert not (tmp_path / "solve.out.part").exists()
+
+
+def test_download_file_error_keeps_existing_file(mock_workbench_service_stub, tmp_path):
+    """Test that a failed download does not touch an existing file."""
+    client = WorkbenchClient(
+        local_workdir=str(tmp_path),
+        server_host="localhost",
+        server_port=5000,
+        server_security="insecure",
+    )
+    client._connect()
+    (tmp_path / "solve.out").write_bytes(b"previous")
+    mock_workbench_service_stub.return_value.DownloadFile.return_value = [
+        wb.DownloadFileResponse(file_info=wb.DownloadFileInfo(file_size=12)),
+        wb.DownloadFileResponse(file_content=b"abcdef"),
+        wb.DownloadFileResponse(error="connection lost"),
+    ]
+    assert client.download_file("solve.out", show_progress=False) is None
+    assert (tmp_path / "solve.out").read_bytes() == b"previous"
+    assert not (tmp_path / "solve.out.part").exists()
+
+
+def test_download_file_resume_and_verify(mock_workbench_service_stub, tmp_path):
+    """Test resuming an interrupted download and verifying it against the server hash."""
+    client = WorkbenchClient(
+        local_workdir=str(tmp_path),
+        server_host="localhost",
+        server_port=5000,
+        server_security="insecure",
+    )
+    client._connect()
+    stub = mock_workbench_service_stub.return_value
+
+    def interrupted(request):
+        yield wb.DownloadFileResponse(file_info=wb.DownloadFileInfo(file_size=12))
+        yield wb.DownloadFileResponse(file_content=b"abcdef")
+        raise grpc.RpcError("connection lost")
+
+    stub.DownloadFile.side_effect = interrupted
+    with patch.object(client, "run_script_string", return_value={"size": 12}):
+        with pytest.raises(grpc.RpcError):
+            client.download_file("project.wbpz", show_progress=False, resume=True)
+    assert (tmp_path / "project.wbpz.part").read_bytes() == b"abcdef"
+    assert not (tmp_path / "project.wbpz").exists()
+
+    # the tail file on the server is removed even if the local file cannot be reopened
+    tail_info = {"size": 12, "tail": "project.wbpz.1.tail"}
+    with (
+        patch.object(client, "run_script_string", return_value=tail_info) as run_script,
+        patch(
+            "ansys.workbench.core.workbench_client._DownloadFileWriter.__init__",
+            side_effect=PermissionError,
+        ),
+    ):
+        with pytest.raises(PermissionError):
+            client.download_file("project.wbpz", show_progress=False, resume=True)
+        assert "project.wbpz.1.tail" in run_script.call_args[0][0]
+
+    stub.DownloadFile.side_effect = None
+    stub.DownloadFile.return_value = [
+        wb.DownloadFileResponse(file_info=wb.DownloadFileInfo(file_size=6)),
+        wb.DownloadFileResponse(file_content=b"ghijkl"),
+    ]
+    server_info = {
+        "size": 12,
+        "tail": "project.wbpz.1.tail",
+        "sha256": hashlib.sha256(b"abcdefghijkl").hexdigest(),
+    }
+    with patch.object(client, "run_script_string", return_value=server_info) as run_script:
+        name = client.download_file("project.wbpz", show_progress=True, resume=True, verify=True)
+        assert "offset = 6" in run_script.call_args_list[0][0][0]
+        assert "project.wbpz.1.tail" in run_script.call_args_list[1][0][0]
+    assert name == "project.wbpz"
+    assert stub.DownloadFile.call_args[0][0].file_name == "project.wbpz.1.tail"
+    assert (tmp_path / "project.wbpz").read_bytes() == b"abcdefghijkl"
+    assert not (tmp_path / "project.wbpz.part").exists()
+    assert not (tmp_path / "project.wbpz.part.json").exists()
+
+
+def test_download_file_verify_mismatch(mock_workbench_service_stub, tmp_path):
+    """Test that a download that does not match the server hash is discarded."""
+    client = WorkbenchClient(
+        local_workdir=str(tmp_path),
+        server_host="localhost",
+        server_port=5000,
+        server_security="insecure",
+    )
+    client._connect()
+    mock_workbench_service_stub.return_value.DownloadFile.return_value = [
+        wb.DownloadFileResponse(file_content=b"corrupted"),
+    ]
+    with patch.object(client, "run_script_string", return_value={"size": 9, "sha256": "0" * 64}):
+        assert client.download_file("solve.out", show_progress=False, verify=True) is None
+    assert not (tmp_path / "solve.out").exists()
+    assert not (tmp_path / "solve.out.part").exists()
+
+
+def test_upload_file_skip_unchanged(mock_workbench_service_stub, tmp_path, monkeypatch):
+    """Test that files with the same content on the server are not uploaded again."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    client = WorkbenchClient(
+        local_workdir=str(tmp_path),
+        server_host="localhost",
+        server_port=5000,
+        server_security="insecure",
+    )
+    client._connect()
+    (tmp_path / "material.xml").write_bytes(b"steel")
+    (tmp_path / "geometry.agdb").write_bytes(b"new geometry")
+    stub = mock_workbench_service_stub.return_value
+    stub.UploadFile.side_effect = lambda requests: MagicMock(
+        error="", file_name=next(iter(requests)).file_name
+    )
+    server_hashes = {
+        "material.xml": hashlib.sha256(b"steel").hexdigest(),
+        "geometry.agdb": hashlib.sha256(b"old geometry").hexdigest(),
+    }
+
+    with patch.object(client, "run_script_string", return_value=server_hashes):
+        results = client.upload_file(
+            "material.xml", "geometry.agdb", show_progress=False, skip_unchanged=True
+        )
+    assert [(r.name, r.skipped) for r in results] == [
+        ("material.xml", True),
+        ("geometry.agdb", False),
+    ]
+    assert stub.UploadFile.call_count == 1
+
+    # the second run uses the cached hashes instead of reading the files again
+    with patch.object(client, "run_script_string", return_value=server_hashes):
+        with patch("ansys.workbench.core.hash_index.file_sha256") as rehash:
+            client.upload_file("material.xml", show_progress=False, skip_unchanged=True)
+            rehash.assert_not_called()
+    index_dir = tmp_path / "cache" / "ansys-workbench"
+    assert (index_dir / "file_hash_index.json").exists()
+    assert not list(tmp_path.glob("*.json"))
+    if os.name != "nt":
+        assert index_dir.stat().st_mode & 0o777 == 0o700
+
+
+def _run_locally(script, args=None, log_level="error"):
+    """Run a server script with the local Python interpreter."""
+    namespace = {}
+    exec(WorkbenchClient._prepare_script(script, args), namespace)
+    return json.loads(namespace["wb_script_result"])
+
+
+@pytest.mark.parametrize("stop_on_error", [True, False])
+def test_run_scripts_batch(stop_on_error):
+    """Test running several scripts in one request."""
+    client = WorkbenchClient(
+        local_workdir="/tmp", server_host="localhost", server_port=5000, server_security="insecure"
+    )
+    scripts = [
+        "import json\nwb_script_result = json.dumps($$x%%1%%)",
+        ("import json\nwb_script_result = json.dumps($$x%%1%% + $$y%%1%%)", {"x": 40, "y": 2}),
+        "raise RuntimeError('broken')",
+        "counter = 1",
+    ]
+    with patch.object(client, "run_script_string", side_effect=_run_locally) as run_script:
+        results = client.run_scripts_batch(scripts, stop_on_error=stop_on_error)
+    assert run_script.call_count == 1
+    assert [r.result for r in results] == [1, 42, None, None]
+    assert "RuntimeError: broken" in results[2].error
+    assert (results[3].error is not None) == stop_on_error
+
+
+def test_run_scripts_batch_renders_once():
+    """Test that argument values that look like placeholders are not substituted again."""
+    client = WorkbenchClient(
+        local_workdir="/tmp", server_host="localhost", server_port=5000, server_security="insecure"
+    )
+    scripts = [("import json\nwb_script_result = json.dumps('$$s%%%%')", {"s": "$$z%%9%%"})]
+    with patch.object(client, "run_script_string", side_effect=_run_locally):
+        results = client.run_scripts_batch(scripts)
+    assert results[0].result == "$$z%%9%%"
+
+
+def test_run_scripts_batch_failure():
+    """Test that a failed batch returns a separate result for each script."""
+    client = WorkbenchClient(
+        local_workdir="/tmp", server_host="localhost", server_port=5000, server_security="insecure"
+    )
+    with patch.object(client, "run_script_string", return_value=None):
+        results = client.run_scripts_batch(["a = 1", "b = 2"])
+    assert [r.error for r in results] == ["The batch of scripts failed to run."] * 2
+    results[0].error = None
+    assert results[1].error is not None
+
+
+def test_server_info_cached_per_server(mock_workbench_service_stub):
+    """Test that the server information is collected once per server."""
+    client = WorkbenchClient(
+        local_workdir="/tmp", server_host="localhost", server_port=5000, server_security="insecure"
+    )
+    client._connect()
+    info = {
+        "version": "25.2",
+        "working_directory": "/server/wd",
+        "mechanical_server": True,
+        "fluent_server": False,
+        "sherlock_server": True,
+    }
+    with patch.object(client, "run_script_string", return_value=info) as run_script:
+        assert client.server_version == 252
+        assert client.server_info.working_directory == "/server/wd"
+        assert not client.server_info.fluent_server
+        client._disconnect()
+        client._connect()
+        assert client.server_version == 252
+        assert run_script.call_count == 1
+
+        client._server_port = 5001
+        client._connect()
+        assert client.server_info.sherlock_server
+        assert run_script.call_count == 2
+
+        assert client.start_fluent_server("FFF") is None
+        client.start_mechanical_server("SYS", port=1234)
+        assert 'SystemName="SYS", Port=1234)' in run_script.call_args[0][0]
+
+
+def test_server_info_script():
+    """Test the server information script against stand-in Workbench functions."""
+    namespace = {
+        "GetFrameworkVersion": lambda: "25.1",
+        "GetServerWorkingDirectory": lambda: "/wd",
+        "GetProjectFile": lambda: "/wd/wbnew.wbpj",
+        "LaunchMechanicalServerOnSystem": lambda **kwargs: 0,
+    }
+    exec(ServerInfo.script, namespace)
+    info = ServerInfo.from_script_result(json.loads(namespace["wb_script_result"]))
+    assert info == ServerInfo(251, "/wd", True, False, False)
+
+
+def test_start_server_probe_fallback():
+    """Test that the solver server requests are still sent when the probe fails."""
+    client = WorkbenchClient(
+        local_workdir="/tmp", server_host="localhost", server_port=5000, server_security="insecure"
+    )
+
+    def run_script(script, *args, **kwargs):
+        return None if script == ServerInfo.script else 5555
+
+    with patch.object(client, "run_script_string", side_effect=run_script) as run:
+        assert client.start_mechanical_server("SYS", port=1234) == 5555
+        assert "if float(GetFrameworkVersion()) >= 25.2:" in run.call_args[0][0]
+        assert 'SystemName="SYS", Port=1234)' in run.call_args[0][0]
+        assert client.start_sherlock_server("SSS") == 5555
+        client.stop_fluent_server("FFF")
+        assert run.call_args[0][0].startswith("if float(GetFrameworkVersion()) >= 25.2:")
+
+    # a capability that the server cannot tell does not block the request either
+    client._server_info = ServerInfo(version=252, mechanical_server=None, sherlock_server=False)
+    with patch.object(client, "run_script_string", return_value=5556) as run:
+        assert client.start_mechanical_server("SYS") == 5556
+        assert client.start_sherlock_server("SSS") is None
+        assert run.call_count == 1
+
+    def probe(name):
+        if name == "LaunchFluentServerOnSystem":
+            raise RuntimeError("The add-in is not loaded.")
+        raise NameError(name)
+
+    namespace = {
+        "GetFrameworkVersion": lambda: "25.2",
+        "GetServerWorkingDirectory": lambda: "/wd",
+        "GetProjectFile": lambda: None,
+        "eval": probe,
+    }
+    exec(ServerInfo.script, namespace)
+    info = ServerInfo.from_script_result(json.loads(namespace["wb_script_result"]))
+    assert info.fluent_server is None and info.sherlock_server is False
+    info = ServerInfo.from_script_result({"version": "24.2"})
+    assert info.mechanical_server is None and info.fluent_server is None
+
+
+def test_stop_server_skipped_on_old_versions():
+    """Test that stopping a solver server is not requested from servers older than 25.2."""
+    client = WorkbenchClient(
+        local_workdir="/tmp", server_host="localhost", server_port=5000, server_security="insecure"
+    )
+    client._server_info = ServerInfo(version=251)
+    with patch.object(client, "run_script_string") as run_script:
+        client.stop_mechanical_server("SYS")
+        run_script.assert_not_called()
+
+
+def test_server_log_forwarding(mock_workbench_service_stub, tmp_path):
+    """Test that server log messages reach the log file through the forwarder."""
+    client = WorkbenchClient(
+        local_workdir=str(tmp_path),
+        server_host="localhost",
+        server_port=5000,
+        server_security="insecure",
+    )
+    client._connect()
+    log_response = MagicMock()
+    log_response.log.messages = [
+        LogMessage(wb.LOG_INFO, "info message"),
+        LogMessage(wb.LOG_ERROR, "error message"),
+    ]
+    log_response.result = None
+    result_response = MagicMock()
+    result_response.log.messages = []
+    result_response.result.error = ""
+    result_response.result.result = "1"
+    client.stub.RunScript.return_value = [log_response, result_response]
+    log_file = tmp_path / "server.log"
+    client.set_log_file(str(log_file))
+    assert client.run_script_string("wb_script_result = 1") == 1
+    assert client.flush_server_log(timeout=5)
+    client.reset_log_file()
+    assert log_file.read_text().splitlines() == ["INFO: info message", "ERROR: error message"]
+    assert client.server_log_stats() == {"forwarded": 2, "dropped": 0, "queued": 0}
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_run_script_array(tmp_path, mmap):
+    """Test returning a script result as a NumPy array through a binary file."""
+    numpy = pytest.importorskip("numpy")
+    server_dir = tmp_path / "server"
+    client_dir = tmp_path / "client"
+    server_dir.mkdir()
+    client_dir.mkdir()
+    client = WorkbenchClient(
+        local_workdir=str(client_dir),
+        server_host="localhost",
+        server_port=5000,
+        server_security="insecure",
+    )
+    client.channel = MagicMock()
+
+    def run_on_server(script, args=None, log_level="error"):
+        namespace = {"GetServerWorkingDirectory": lambda: str(server_dir)}
+        exec(client._prepare_script(script, args), namespace)
+        result = namespace.get("wb_script_result")
+        return None if result is None else json.loads(result)
+
+    def download(file_name, show_progress=True):
+        (client_dir / file_name).write_bytes((server_dir / file_name).read_bytes())
+        return file_name
+
+    script = "wb_script_array = [[i, i * $$scale%%1%%, 0.5] for i in range(5)]"
+    with (
+        patch.object(client, "run_script_string", side_effect=run_on_server),
+        patch.object(client, "download_file", side_effect=download),
+    ):
+        array = client.run_script_array(script, args={"scale": 2}, mmap=mmap)
+        ints = client.run_script_array("wb_script_array = range(7)", dtype="int32", mmap=mmap)
+    expected = numpy.array([[i, i * 2, 0.5] for i in range(5)])
+    numpy.testing.assert_array_equal(array, expected)
+    assert array.dtype == numpy.float64
+    assert isinstance(array, numpy.memmap) == mmap
+    numpy.testing.assert_array_equal(ints, numpy.arange(7))
+    assert ints.dtype == numpy.int32
+    assert list(server_dir.iterdir()) == []
+    assert len(list(client_dir.iterdir())) == (2 if mmap else 0)
+    if mmap:
+        assert pathlib.Path(array.filename).parent == client_dir
+
+
+def test_run_script_array_without_numpy():
+    """Test that a missing NumPy is reported before the script runs."""
+    client = WorkbenchClient(
+        local_workdir="/tmp", server_host="localhost", server_port=5000, server_security="insecure"
+    )
+    client.channel = MagicMock()
+    with (
+        patch.dict("sys.modules", {"numpy": None}),
+        patch.object(client, "run_script_string") as run_script,
+    ):
+        with pytest.raises(ImportError, match="arrays"):
+            client.run_script_array("wb_script_array = [1]")
+    run_script.assert_not_called()
+
+
+def test_channel_options(mock_grpc, mock_workbench_service_stub, tmp_path):
+    """Test connecting with tuned channel options and compressed uploads."""
+    options = ChannelOptions(max_receive_message_length=64 << 20, keepalive_time_ms=20000)
+    assert ChannelOptions().grpc_options() is None
+    assert ChannelOptions.resolve("high_throughput") == ChannelOptions.high_throughput()
+    with pytest.raises(ValueError):
+        ChannelOptions(transfer_compression="zstd")
+
+    client = WorkbenchClient(str(tmp_path), "localhost", 5000, "insecure", options)
+    client._connect()
+    mock_grpc.assert_called_once_with(
+        "localhost:5000",
+        options=[("grpc.max_receive_message_length", 64 << 20), ("grpc.keepalive_time_ms", 20000)],
+    )
+
+    client = WorkbenchClient(str(tmp_path), "localhost", 5000, "insecure", "high_throughput")
+    client._connect()
+    client.stub.UploadFile.return_value.error = ""
+    (tmp_path / "mesh.msh").write_bytes(b"nodes" * 1000)
+    client.upload_file("mesh.msh", show_progress=False)
+    assert client.stub.UploadFile.call_args.kwargs == {"compression": grpc.Compression.Gzip}
+    options = mock_grpc.call_args.kwargs["options"]
+    assert ("grpc.keepalive_permit_without_calls", 1) in options
+    # gRPC servers answer pings without calls more often than every 5 minutes with GOAWAY
+    assert dict(options)["grpc.keepalive_time_ms"] >= 300000
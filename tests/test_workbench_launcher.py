@@ -0,0 +1,183 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for launching Workbench servers."""
+
+import atexit
+import io
+import os
+import platform
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ansys.workbench.core import hooks, launch_many
+from ansys.workbench.core.workbench_launcher import Launcher
+
+pytestmark = pytest.mark.skipif(platform.system() == "Windows", reason="Linux launcher only")
+
+
+@pytest.fixture
+def fake_runwb2(monkeypatch, tmp_path):
+    """Replace the runwb2 process with one that prints a fixed output."""
+    monkeypatch.setenv("AWP_ROOT252", str(tmp_path))
+    process = MagicMock()
+    process.pid = 1234
+    output = "Starting Workbench\nANSYS_FRAMEWORK_SERVER_PORT=prefix5000\n"
+    output += "".join(f"solver line {i}\n" for i in range(20))
+    process.stdout = io.StringIO(output)
+    with (
+        patch("ansys.workbench.core.workbench_launcher.subprocess.Popen", return_value=process),
+        patch("ansys.workbench.core.workbench_launcher.uuid.uuid4") as uuid4,
+    ):
+        uuid4.return_value.hex = "prefix"
+        yield process
+
+
+def test_launcher_drains_output(fake_runwb2):
+    """Test that the server output is read after the port is found."""
+    launcher = Launcher(output_lines=5)
+    assert launcher.launch(version="252", show_gui=False) == (5000, "mtls")
+    launcher._output_reader.join(timeout=10)
+    assert fake_runwb2.stdout.read() == ""
+    assert launcher.recent_output() == [f"solver line {i}" for i in range(15, 20)]
+    assert launcher.recent_output(2) == ["solver line 18", "solver line 19"]
+
+
+def test_launcher_forwards_output(fake_runwb2):
+    """Test forwarding the server output to the logger."""
+    launcher = Launcher(forward_output=True)
+    with patch("logging.getLogger") as get_logger:
+        launcher.launch(version="252", show_gui=False)
+        launcher._output_reader.join(timeout=10)
+    get_logger.assert_called_with("WB")
+    assert get_logger.return_value.info.call_count == 22
+    assert launcher.recent_output()[0] == "Starting Workbench"
+
+
+def test_launch_phases(fake_runwb2):
+    """Test reporting the phases of a launch to the hooks."""
+    phases = []
+
+    def on_phase(phase, info):
+        phases.append((phase, info))
+
+    hooks.add_hook("launch_phase", on_phase)
+    try:
+        Launcher().launch(version="252", show_gui=False)
+    finally:
+        hooks.remove_hook("launch_phase", on_phase)
+    assert [phase for phase, _ in phases] == ["started", "process_spawned", "port_seen"]
+    assert phases[1][1]["pid"] == 1234
+    assert phases[2][1] == {"host": None, "pid": 1234, "port": 5000, "launch_id": "prefix"}
+
+
+def test_launcher_timeout(fake_runwb2):
+    """Test that waiting for the port line stops at the timeout."""
+    read_end, write_end = os.pipe()
+    fake_runwb2.stdout = os.fdopen(read_end)
+    launcher = Launcher()
+    start = time.monotonic()
+    assert launcher.launch(version="252", show_gui=False, timeout=0.2) == (0, "mtls")
+    assert time.monotonic() - start < 5
+    os.close(write_end)
+    launcher._output_reader.join(timeout=10)
+
+
+def test_launch_many():
+    """Test launching several servers concurrently."""
+    delays = {5001: 0.3, 5002: 0.0, 5003: 0.1}
+
+    def make_launcher(output_lines, forward_output):
+        assert (output_lines, forward_output) == (1000, False)
+        launcher = MagicMock()
+        port = 5001 + make_launcher.count
+        make_launcher.count += 1
+
+        def launch(*args):
+            time.sleep(delays.get(port, 0))
+            assert 0 < args[-1] <= 60
+            return (port, "insecure") if port in delays else (0, "insecure")
+
+        launcher.launch.side_effect = launch
+        return launcher
+
+    make_launcher.count = 0
+    with patch("ansys.workbench.core.public_api.Launcher", side_effect=make_launcher):
+        clients = launch_many(4, timeout=60, show_gui=False, use_insecure_connection=True)
+    for client in clients:
+        atexit.unregister(client.exit)
+    assert [client._server_port for client in clients] == [5002, 5003, 5001]
+    assert all(not client._launcher.exit.called for client in clients)
+
+
+def test_wmi_exit_releases_com():
+    """Test that every COM initialization for WMI is paired with an uninitialization."""
+    launcher = Launcher()
+    launcher._wmi = MagicMock()
+    launcher._wmi_credentials = (None, None, None)
+    launcher._process_id = 1234
+    connection = launcher._wmi.WMI.return_value
+    connection.Win32_Process.return_value = []
+    pythoncom = MagicMock()
+    with patch.dict("sys.modules", {"pythoncom": pythoncom}):
+        launcher.exit()
+    pythoncom.CoInitialize.assert_called_once()
+    pythoncom.CoUninitialize.assert_called_once()
+    connection.Win32_Process.assert_called_with(ProcessId=1234)
+    assert launcher._wmi_connection is None
+    assert launcher._process_id == -1
+
+
+def test_launcher_is_running(fake_runwb2):
+    """Test checking whether the launched server process is still running."""
+    launcher = Launcher()
+    assert not launcher.is_running()
+    launcher.launch(version="252", show_gui=False)
+    fake_runwb2.poll.return_value = None
+    assert launcher.is_running()
+    fake_runwb2.poll.return_value = 1
+    assert not launcher.is_running()
+
+
+def test_launch_workbench_output_options(fake_runwb2):
+    """Test keeping and forwarding the server output through the public API."""
+    from ansys.workbench.core import launch_workbench
+
+    with patch("logging.getLogger") as get_logger:
+        wb = launch_workbench(
+            show_gui=False,
+            version="252",
+            use_insecure_connection=True,
+            output_lines=5,
+            forward_output=True,
+        )
+        atexit.unregister(wb.exit)
+        wb._launcher._output_reader.join(timeout=10)
+    get_logger.return_value.info.assert_any_call("solver line 19")
+    assert wb.recent_output() == [f"solver line {i}" for i in range(15, 20)]
+    assert wb.recent_output(1) == ["solver line 19"]
+    wb._launcher.configure_output(2)
+    assert wb.recent_output() == ["solver line 18", "solver line 19"]
+    wb._disconnect()
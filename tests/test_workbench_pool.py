@@ -0,0 +1,142 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for the pool of Workbench servers."""
+
+import itertools
+import threading
+import time
+from unittest.mock import patch
+
+import grpc
+import pytest
+
+from ansys.workbench.core import WorkbenchPool
+
+
+class _Unavailable(grpc.RpcError):
+    """Error raised by the client of a server that crashed."""
+
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+
+class _FakeSession:
+    """Stand-in for ``LaunchWorkbench`` that runs scripts with ``eval``."""
+
+    ids = itertools.count()
+
+    def __init__(self, **launch_options):
+        self.id = next(_FakeSession.ids)
+        self.launch_options = launch_options
+        self.exited = False
+        self.scripts = []
+
+    def run_script_string(self, script, args=None, log_level="error"):
+        if script == "crash":
+            raise _Unavailable()
+        time.sleep(0.01)
+        self.scripts.append(script)
+        return eval(script, {}, dict(args or {}))
+
+    def exit(self):
+        self.exited = True
+
+
+@pytest.fixture
+def fake_launch():
+    """Replace the server launch with fake sessions."""
+    with patch(
+        "ansys.workbench.core.workbench_pool.LaunchWorkbench", side_effect=_FakeSession
+    ) as launch:
+        yield launch
+
+
+def test_pool_map(fake_launch):
+    """Test running scripts on several servers."""
+    with WorkbenchPool(3, version="252") as pool:
+        futures = pool.map("x * 2", [{"x": x} for x in range(20)])
+        assert [future.result(timeout=10) for future in futures] == [x * 2 for x in range(20)]
+        sessions = pool.sessions
+    assert fake_launch.call_count == 3
+    assert fake_launch.call_args.kwargs == {"version": "252", "show_gui": False}
+    assert sum(len(session.scripts) for session in sessions) == 20
+    assert all(session.exited for session in sessions)
+
+
+def test_pool_submit_function(fake_launch):
+    """Test submitting a function that receives the client."""
+    with WorkbenchPool(1) as pool:
+        future = pool.submit(lambda client: client.run_script_string("1 + 1") + 1)
+        assert future.result(timeout=10) == 3
+
+
+def test_pool_replaces_crashed_server(fake_launch):
+    """Test that a server that stops responding is replaced."""
+    with WorkbenchPool(1) as pool:
+        crashed = pool.submit("crash")
+        with pytest.raises(grpc.RpcError):
+            crashed.result(timeout=10)
+        assert pool.submit("40 + 2").result(timeout=10) == 42
+        assert fake_launch.call_count == 2
+        assert len(pool.sessions) == 1
+
+
+def test_pool_resize(fake_launch):
+    """Test growing and shrinking the pool."""
+    pool = WorkbenchPool(1)
+    pool.resize(4)
+    assert pool.size == 4
+    assert [f.result(timeout=10) for f in pool.map("x", [{"x": x} for x in range(8)])] == list(
+        range(8)
+    )
+    deadline = time.monotonic() + 10
+    while len(pool.sessions) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sessions = pool.sessions
+    pool.resize(2)
+    deadline = time.monotonic() + 10
+    while sum(session.exited for session in sessions) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(pool.sessions) == 2
+    assert sum(session.exited for session in sessions) == 2
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.submit("1")
+
+
+def test_pool_launch_failure(fake_launch):
+    """Test that queued work fails when no server can be launched."""
+    started = threading.Event()
+
+    def fail(**launch_options):
+        started.wait(timeout=10)
+        raise Exception("Failed to launch Ansys Workbench service.")
+
+    fake_launch.side_effect = fail
+    pool = WorkbenchPool(2)
+    future = pool.submit("1")
+    started.set()
+    with pytest.raises(RuntimeError, match="No Workbench server"):
+        future.result(timeout=10)
+    pool.close()
@@ -0,0 +1,122 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests for extracting ZIP archives from a stream."""
+
+import io
+import os
+import zipfile
+
+import pytest
+
+from ansys.workbench.core.zip_stream import ZipStreamExtractor
+
+
+class _Unseekable(io.RawIOBase):
+    """Write-only stream that makes ``zipfile`` use data descriptors."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.data += data
+        return len(data)
+
+
+def _feed(extractor, data, chunk_size):
+    for start in range(0, len(data), chunk_size):
+        extractor.write(data[start : start + chunk_size])
+    extractor.close()
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_extract_stream(tmp_path, seekable, chunk_size):
+    """Test extracting stored and deflated members fed in chunks of any size."""
+    members = {"a.txt": b"a" * 5000, "sub/b.bin": os.urandom(3000), "sub/c.txt": b""}
+    stream = io.BytesIO() if seekable else _Unseekable()
+    with zipfile.ZipFile(stream, "w") as archive:
+        archive.writestr("sub/", b"")
+        archive.writestr("a.txt", members["a.txt"], zipfile.ZIP_DEFLATED)
+        for name in ("sub/b.bin", "sub/c.txt"):
+            compression = zipfile.ZIP_STORED if seekable else zipfile.ZIP_DEFLATED
+            archive.writestr(name, members[name], compression)
+    data = bytes(stream.getvalue() if seekable else stream.data)
+
+    extractor = ZipStreamExtractor(str(tmp_path), exclude="*.txt")
+    _feed(extractor, data, chunk_size)
+    assert extractor.extracted == ["sub/b.bin"]
+    assert extractor.skipped == ["a.txt", "sub/c.txt"]
+    assert (tmp_path / "sub" / "b.bin").read_bytes() == members["sub/b.bin"]
+    assert not (tmp_path / "a.txt").exists()
+
+
+@pytest.mark.parametrize("zero_sizes", [False, True])
+def test_extract_streamed_zip64(tmp_path, zero_sizes):
+    """Test streamed ZIP64 members, whose data descriptors have 8-byte sizes."""
+    members = {"a.bin": os.urandom(5000), "b.bin": os.urandom(7000)}
+    stream = _Unseekable()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            with archive.open(name, "w", force_zip64=True) as member:
+                member.write(content)
+    data = bytearray(stream.data)
+    if zero_sizes:
+        # other writers leave the sizes of streamed members at zero and only add the
+        # ZIP64 extra field
+        position = 0
+        while (position := data.find(b"PK\x03\x04", position)) >= 0:
+            data[position + 18 : position + 26] = bytes(8)
+            position += 4
+    extractor = ZipStreamExtractor(str(tmp_path))
+    _feed(extractor, bytes(data), 1000)
+    assert extractor.extracted == ["a.bin", "b.bin"]
+    for name, content in members.items():
+        assert (tmp_path / name).read_bytes() == content
+
+
+def test_extract_stream_errors(tmp_path):
+    """Test rejecting unsafe, corrupted, and truncated archives."""
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w") as archive:
+        archive.writestr("../evil.txt", b"evil")
+    with pytest.raises(ValueError, match="outside"):
+        ZipStreamExtractor(str(tmp_path)).write(stream.getvalue())
+
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w") as archive:
+        archive.writestr("data.txt", b"0123456789")
+    data = bytearray(stream.getvalue())
+    data[data.index(b"0123456789")] ^= 1
+    with pytest.raises(ValueError, match="corrupted"):
+        ZipStreamExtractor(str(tmp_path)).write(bytes(data))
+    assert os.listdir(tmp_path) == []
+
+    extractor = ZipStreamExtractor(str(tmp_path))
+    extractor.write(stream.getvalue()[:40])
+    with pytest.raises(ValueError, match="ended"):
+        extractor.close()
+    assert os.listdir(tmp_path) == []